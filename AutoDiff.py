@@ -0,0 +1,289 @@
+import math
+
+from LazyImport import lazy_import
+
+np = lazy_import("numpy")
+
+
+class Dual:
+    """
+    Дуальное число value + d*eps (eps^2 = 0) для вычисления первой производной.
+    d может быть массивом NumPy: тогда за один проход вычисляется градиент.
+    """
+
+    __slots__ = ("value", "d")
+
+    def __init__(self, value, d=0.0):
+        self.value = value
+        self.d = d
+
+    def apply(self, g, g1, g2=None):
+        """g(u): значение g(value), производная g'(value)*d"""
+        return Dual(g(self.value), g1(self.value) * self.d)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.d + other.d)
+        return Dual(self.value + other, self.d)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.d - other.d)
+        return Dual(self.value - other, self.d)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.d)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.d * other.value + self.value * other.d)
+        return Dual(self.value * other, self.d * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value,
+                        (self.d * other.value - self.value * other.d) / other.value ** 2)
+        return Dual(self.value / other, self.d / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.d / self.value ** 2)
+
+    def __pow__(self, n):
+        if isinstance(n, Dual):
+            return exp(n * log(self))
+        if n == 0:
+            return Dual(1.0, 0 * self.d)
+        return Dual(self.value ** n, n * self.value ** (n - 1) * self.d)
+
+    def __rpow__(self, c):
+        return exp(self * math.log(c))
+
+    def __neg__(self):
+        return Dual(-self.value, -self.d)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, (Dual, HyperDual)) else other)
+
+    __hash__ = None
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, (Dual, HyperDual)) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, (Dual, HyperDual)) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, (Dual, HyperDual)) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, (Dual, HyperDual)) else other)
+
+    def __repr__(self):
+        return f"Dual({self.value}, {self.d})"
+
+
+class HyperDual:
+    """
+    Число, несущее значение функции и две ее производные (f, f', f'').
+    Арифметика реализует правила дифференцирования до второго порядка.
+    """
+
+    __slots__ = ("value", "d1", "d2")
+
+    def __init__(self, value, d1=0.0, d2=0.0):
+        self.value = value
+        self.d1 = d1
+        self.d2 = d2
+
+    def apply(self, g, g1, g2):
+        """g(u): g(u)' = g'(u)u', g(u)'' = g''(u)u'^2 + g'(u)u''"""
+        g1_v = g1(self.value)
+        return HyperDual(g(self.value), g1_v * self.d1, g2(self.value) * self.d1 ** 2 + g1_v * self.d2)
+
+    def __add__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value + other.value, self.d1 + other.d1, self.d2 + other.d2)
+        return HyperDual(self.value + other, self.d1, self.d2)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value - other.value, self.d1 - other.d1, self.d2 - other.d2)
+        return HyperDual(self.value - other, self.d1, self.d2)
+
+    def __rsub__(self, other):
+        return HyperDual(other - self.value, -self.d1, -self.d2)
+
+    def __mul__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value * other.value,
+                             self.d1 * other.value + self.value * other.d1,
+                             self.d2 * other.value + 2 * self.d1 * other.d1 + self.value * other.d2)
+        return HyperDual(self.value * other, self.d1 * other, self.d2 * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, HyperDual):
+            return self * other.apply(lambda t: 1 / t, lambda t: -1 / t ** 2, lambda t: 2 / t ** 3)
+        return HyperDual(self.value / other, self.d1 / other, self.d2 / other)
+
+    def __rtruediv__(self, other):
+        return other * self.apply(lambda t: 1 / t, lambda t: -1 / t ** 2, lambda t: 2 / t ** 3)
+
+    def __pow__(self, n):
+        if isinstance(n, HyperDual):
+            return exp(n * log(self))
+        if n == 0:
+            return HyperDual(1.0)
+        return self.apply(lambda t: t ** n,
+                          lambda t: n * t ** (n - 1),
+                          lambda t: n * (n - 1) * t ** (n - 2) if n != 1 else 0.0)
+
+    def __rpow__(self, c):
+        return exp(self * math.log(c))
+
+    def __neg__(self):
+        return HyperDual(-self.value, -self.d1, -self.d2)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    __eq__ = Dual.__eq__
+    __hash__ = None
+    __lt__ = Dual.__lt__
+    __le__ = Dual.__le__
+    __gt__ = Dual.__gt__
+    __ge__ = Dual.__ge__
+
+    def __repr__(self):
+        return f"HyperDual({self.value}, {self.d1}, {self.d2})"
+
+
+# Элементарные функции: работают с числами, массивами NumPy, Dual и HyperDual.
+# Числа обрабатываются модулем math без обращения к numpy
+
+def sin(x):
+    if isinstance(x, (Dual, HyperDual)):
+        return x.apply(math.sin, math.cos, lambda t: -math.sin(t))
+    if isinstance(x, (int, float)):
+        return math.sin(x)
+    return np.sin(x)
+
+
+def cos(x):
+    if isinstance(x, (Dual, HyperDual)):
+        return x.apply(math.cos, lambda t: -math.sin(t), lambda t: -math.cos(t))
+    if isinstance(x, (int, float)):
+        return math.cos(x)
+    return np.cos(x)
+
+
+def exp(x):
+    if isinstance(x, (Dual, HyperDual)):
+        return x.apply(math.exp, math.exp, math.exp)
+    if isinstance(x, (int, float)):
+        return math.exp(x)
+    return np.exp(x)
+
+
+def log(x):
+    if isinstance(x, (Dual, HyperDual)):
+        return x.apply(math.log, lambda t: 1 / t, lambda t: -1 / t ** 2)
+    if isinstance(x, (int, float)):
+        return math.log(x)
+    return np.log(x)
+
+
+def sqrt(x):
+    if isinstance(x, (Dual, HyperDual)):
+        return x.apply(math.sqrt, lambda t: 0.5 / math.sqrt(t), lambda t: -0.25 / t ** 1.5)
+    if isinstance(x, (int, float)):
+        return math.sqrt(x)
+    return np.sqrt(x)
+
+
+def cbrt(x):
+    """Вещественный кубический корень (в том числе из отрицательных чисел)"""
+    if isinstance(x, (Dual, HyperDual)):
+        return x.apply(cbrt,
+                       lambda t: 1 / (3 * cbrt(t) ** 2),
+                       lambda t: -2 / (9 * cbrt(t) ** 5))
+    if isinstance(x, (int, float)):
+        return math.copysign(abs(x) ** (1 / 3), x)
+    return np.cbrt(x)
+
+
+# Производные и совместное вычисление
+
+def value_and_derivative(f, x):
+    """(f(x), f'(x)) за одно вычисление f"""
+    result = f(Dual(x, 1.0))
+    if not isinstance(result, Dual):
+        return result, 0.0
+    return result.value, result.d
+
+
+def taylor2(f, x):
+    """(f(x), f'(x), f''(x)) за одно вычисление f"""
+    result = f(HyperDual(x, 1.0, 0.0))
+    if not isinstance(result, HyperDual):
+        return result, 0.0, 0.0
+    return result.value, result.d1, result.d2
+
+
+def derivative(f):
+    """Функция x -> f'(x)"""
+    def f_prime(x):
+        return value_and_derivative(f, x)[1]
+    return f_prime
+
+
+def second_derivative(f):
+    """Функция x -> f''(x)"""
+    def f2(x):
+        return taylor2(f, x)[2]
+    return f2
+
+
+def value_and_jacobian(functions, *args):
+    """
+    Значения и матрица Якоби системы за одно вычисление.
+
+    functions: функция (x1, ..., xn) -> (F1, ..., Fm)
+    :return: Кортеж (values, jacobian), где jacobian[i][j] = dFi/dxj.
+    """
+    n = len(args)
+    seeds = np.eye(n)
+    result = functions(*(Dual(x, seeds[j]) for j, x in enumerate(args)))
+    values = []
+    jacobian = []
+    for component in result:
+        if isinstance(component, Dual):
+            values.append(component.value)
+            jacobian.append(list(component.d))
+        else:
+            values.append(component)
+            jacobian.append([0.0] * n)
+    return tuple(values), jacobian
+
+
+def jacobian(functions):
+    """Функция (x1, ..., xn) -> матрица Якоби системы functions"""
+    def compute(*args):
+        return value_and_jacobian(functions, *args)[1]
+    return compute
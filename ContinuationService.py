@@ -0,0 +1,128 @@
+import math
+
+import numpy as np
+
+import AutoDiff
+
+
+class ContinuationSolver:
+    """
+    Решение семейства уравнений f(x, p) = 0 (FunctionService.families) при
+    последовательном изменении параметров p.
+
+    Каждое решение начинается с прогноза по касательной к кривой корней
+    x(p): dx/dp = -(df/dp) / (df/dx), производные берутся из того же
+    вычисления f, что и последний шаг Ньютона. Прогноз уточняется методом
+    Ньютона; если уточнение не сошлось или вышло за [a, b], корень ищется
+    заново сканированием отрезка (ScanService) методом meth_num.
+    """
+
+    def __init__(self, family, a, b, epsilon, max_iter=10, meth_num=4):
+        """
+        family  : семейство из FunctionService.families
+        a, b    : отрезок, на котором ищется корень
+        epsilon : точность
+        max_iter: максимальное число итераций уточнения для одного значения p
+        meth_num: метод из MethodService.methods для повторного поиска корня
+        """
+        if a > b:
+            a, b = b, a
+
+        self.family = family
+        self.a = a
+        self.b = b
+        self.epsilon = epsilon
+        self.max_iter = max_iter
+        self.meth_num = meth_num
+        self.rebrackets = []
+        self.failures = []
+
+    def evaluate(self, x, p):
+        """Кортеж (f, df/dx, df/dp) за одно вычисление f"""
+        f = self.family["f"]
+        (value,), (gradient,) = AutoDiff.value_and_jacobian(lambda *args: (f(*args),), x, *p)
+        return float(value), float(gradient[0]), np.asarray(gradient[1:], dtype=float)
+
+    def correct(self, x, p):
+        """
+        Уточнение корня методом Ньютона при фиксированных p.
+
+        :return: Кортеж (root, value, iterations, dx_dp) или None, если метод
+                 не сошелся или вышел за [a, b].
+        """
+        for i in range(1, self.max_iter + 1):
+            value, f_x, f_p = self.evaluate(x, p)
+            if f_x == 0:
+                return None
+            step = value / f_x
+            x -= step
+            if not (math.isfinite(x) and self.a <= x <= self.b):
+                return None
+            if abs(step) < self.epsilon:
+                return x, self.family["f"](x, *p), i, -f_p / f_x
+        return None
+
+    def rebracket(self, p, near=None):
+        """
+        Поиск корня заново на [a, b]; из нескольких корней выбирается
+        ближайший к near (или наименьший).
+
+        :return: Кортеж (root, value, iterations, dx_dp) или None, если корней нет.
+        """
+        import ScanService
+
+        roots = ScanService.find_all_roots(self.family["at"](*p), self.meth_num, self.a, self.b, self.epsilon)
+        if not roots:
+            return None
+        root, value, iterations = min(roots, key=lambda r: abs(r[0] - near)) if near is not None else roots[0]
+        _, f_x, f_p = self.evaluate(root, p)
+        dx_dp = -f_p / f_x if f_x != 0 else np.zeros_like(f_p)
+        return root, value, iterations, dx_dp
+
+    def sweep(self, params, index=None):
+        """
+        Решение для каждого набора параметров params (массив формы (m, k)).
+        Если задан index, params - массив значений параметра с номером index,
+        остальные параметры берутся из family["default"].
+
+        :return: Список кортежей (root, func_value, iterations) по порядку params.
+                 Если корень не найден, root и func_value равны NaN. Индексы
+                 повторных поисков сохраняются в self.rebrackets, индексы
+                 отказов - в self.failures.
+        """
+        params = np.asarray(params, dtype=float)
+        if index is not None:
+            values = params
+            params = np.tile(np.asarray(self.family["default"], dtype=float), (len(values), 1))
+            params[:, index] = values
+        params = params.reshape(len(params), -1)
+
+        self.rebrackets = []
+        self.failures = []
+        results = []
+        previous = None
+        for k, p in enumerate(params):
+            p = tuple(p.tolist())
+            solution = None
+            if previous is not None:
+                x, p_prev, dx_dp = previous
+                predicted = x + float(dx_dp @ (np.asarray(p) - p_prev))
+                solution = self.correct(min(max(predicted, self.a), self.b), p)
+            if solution is None:
+                self.rebrackets.append(k)
+                solution = self.rebracket(p, previous[0] if previous is not None else None)
+            if solution is None:
+                self.failures.append(k)
+                results.append((math.nan, math.nan, 0))
+                previous = None
+                continue
+
+            root, value, iterations, dx_dp = solution
+            results.append((float(root), float(value), iterations))
+            previous = (root, np.asarray(p), dx_dp)
+        return results
+
+
+def sweep(family, params, a, b, epsilon, index=None, meth_num=4):
+    """Решения семейства family из FunctionService.families для каждого набора params"""
+    return ContinuationSolver(family, a, b, epsilon, meth_num=meth_num).sweep(params, index)
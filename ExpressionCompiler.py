@@ -0,0 +1,416 @@
+import hashlib
+import json
+import math
+import os
+import re
+
+import AutoDiff
+from LazyImport import lazy_import
+
+np = lazy_import("numpy")
+
+# Версия формата кэша: при изменении формата старые записи игнорируются.
+# В кэше хранятся деревья f, f', f'' (не исходный код): при загрузке деревья
+# проверяются, а код генерируется из них заново
+CACHE_VERSION = 2
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".expression_cache")
+
+FUNCTIONS = ("sin", "cos", "exp", "log", "sqrt", "cbrt")
+CONSTANTS = {"pi": math.pi, "e": math.e}
+
+TOKEN_RE = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\*\*|[-+*/^()]))")
+
+
+# Разбор выражения в дерево из кортежей:
+# ("num", v), ("var",), ("neg", u), ("add"|"sub"|"mul"|"div"|"pow", u, v), ("call", name, u)
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Недопустимый символ в выражении: '{text[pos:].strip()[:1]}'")
+        number, name, op = match.groups()
+        if number is not None:
+            tokens.append(("num", float(number)))
+        elif name is not None:
+            tokens.append(("name", name))
+        else:
+            tokens.append(("op", "^" if op == "**" else op))
+        pos = match.end()
+    return tokens
+
+
+class Parser:
+    """Рекурсивный спуск; поддерживает неявное умножение ("2x^3", "3(x+1)")"""
+
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, op):
+        if self.take() != ("op", op):
+            raise ValueError(f"Ожидался символ '{op}'.")
+
+    def parse(self):
+        node = self.expr()
+        if self.pos != len(self.tokens):
+            raise ValueError("Лишние символы в конце выражения.")
+        return node
+
+    def expr(self):
+        node = self.term()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            op = self.take()[1]
+            node = ("add" if op == "+" else "sub", node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while True:
+            kind, value = self.peek()
+            if kind == "op" and value in "*/":
+                self.take()
+                node = ("mul" if value == "*" else "div", node, self.unary())
+            elif kind in ("num", "name") or (kind, value) == ("op", "("):
+                node = ("mul", node, self.unary())
+            else:
+                return node
+
+    def unary(self):
+        if self.peek() == ("op", "-"):
+            self.take()
+            return ("neg", self.unary())
+        if self.peek() == ("op", "+"):
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.peek() == ("op", "^"):
+            self.take()
+            node = ("pow", node, self.unary())
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "num":
+            return ("num", value)
+        if kind == "name":
+            if value == "x":
+                return ("var",)
+            if value in CONSTANTS:
+                return ("num", float(CONSTANTS[value]))
+            if value in FUNCTIONS:
+                self.expect("(")
+                node = self.expr()
+                self.expect(")")
+                return ("call", value, node)
+            raise ValueError(f"Неизвестное имя в выражении: '{value}'")
+        if (kind, value) == ("op", "("):
+            node = self.expr()
+            self.expect(")")
+            return node
+        raise ValueError("Неожиданный конец выражения.")
+
+
+def parse(text):
+    return simplify(Parser(text).parse())
+
+
+# Упрощение
+
+def is_num(node, value=None):
+    return node[0] == "num" and (value is None or node[1] == value)
+
+
+def simplify(node):
+    kind = node[0]
+    if kind in ("num", "var"):
+        return node
+    if kind == "neg":
+        u = simplify(node[1])
+        if is_num(u):
+            return ("num", -u[1])
+        if u[0] == "neg":
+            return u[1]
+        return ("neg", u)
+    if kind == "call":
+        u = simplify(node[2])
+        if is_num(u):
+            return ("num", float(getattr(AutoDiff, node[1])(u[1])))
+        return ("call", node[1], u)
+
+    u, v = simplify(node[1]), simplify(node[2])
+    if is_num(u) and is_num(v):
+        a, b = u[1], v[1]
+        if kind == "add":
+            return ("num", a + b)
+        if kind == "sub":
+            return ("num", a - b)
+        if kind == "mul":
+            return ("num", a * b)
+        if kind == "div" and b != 0:
+            return ("num", a / b)
+        if kind == "pow" and (a >= 0 or float(b).is_integer()):
+            return ("num", a ** b)
+    if kind == "add":
+        if is_num(u, 0):
+            return v
+        if is_num(v, 0):
+            return u
+        if v[0] == "neg":
+            return simplify(("sub", u, v[1]))
+    if kind == "sub":
+        if is_num(v, 0):
+            return u
+        if is_num(u, 0):
+            return simplify(("neg", v))
+        if v[0] == "neg":
+            return simplify(("add", u, v[1]))
+    if kind == "mul":
+        if is_num(u, 0) or is_num(v, 0):
+            return ("num", 0.0)
+        if is_num(u, 1):
+            return v
+        if is_num(v, 1):
+            return u
+        if is_num(u, -1):
+            return simplify(("neg", v))
+        if is_num(v):
+            # Число ставится перед множителем: x*2 -> 2*x
+            return simplify(("mul", v, u))
+        if is_num(u) and v[0] == "mul" and is_num(v[1]):
+            return simplify(("mul", ("num", u[1] * v[1][1]), v[2]))
+    if kind == "div":
+        if is_num(u, 0):
+            return ("num", 0.0)
+        if is_num(v, 1):
+            return u
+    if kind == "pow":
+        if is_num(v, 0):
+            return ("num", 1.0)
+        if is_num(v, 1):
+            return u
+    return (kind, u, v)
+
+
+# Символьное дифференцирование
+
+def differentiate(node):
+    kind = node[0]
+    if kind == "num":
+        return ("num", 0.0)
+    if kind == "var":
+        return ("num", 1.0)
+    if kind == "neg":
+        return ("neg", differentiate(node[1]))
+    if kind == "call":
+        name, u = node[1], node[2]
+        du = differentiate(u)
+        if name == "sin":
+            outer = ("call", "cos", u)
+        elif name == "cos":
+            outer = ("neg", ("call", "sin", u))
+        elif name == "exp":
+            outer = node
+        elif name == "log":
+            outer = ("div", ("num", 1.0), u)
+        elif name == "sqrt":
+            outer = ("div", ("num", 0.5), node)
+        else:
+            outer = ("div", ("num", 1.0), ("mul", ("num", 3.0), ("pow", node, ("num", 2.0))))
+        return simplify(("mul", outer, du))
+
+    u, v = node[1], node[2]
+    du, dv = differentiate(u), differentiate(v)
+    if kind == "add":
+        result = ("add", du, dv)
+    elif kind == "sub":
+        result = ("sub", du, dv)
+    elif kind == "mul":
+        result = ("add", ("mul", du, v), ("mul", u, dv))
+    elif kind == "div":
+        result = ("div", ("sub", ("mul", du, v), ("mul", u, dv)), ("pow", v, ("num", 2.0)))
+    elif is_num(v):
+        result = ("mul", ("mul", v, ("pow", u, ("num", v[1] - 1))), du)
+    else:
+        # (u^v)' = u^v * (v' ln u + v u'/u)
+        result = ("mul", node, ("add", ("mul", dv, ("call", "log", u)), ("div", ("mul", v, du), u)))
+    return simplify(result)
+
+
+# Генерация кода
+
+OPERATORS = {"add": "+", "sub": "-", "mul": "*", "div": "/", "pow": "**"}
+
+
+def to_source(node, module):
+    """Исходный код выражения; функции берутся из модуля с именем module"""
+    kind = node[0]
+    if kind == "num":
+        value = node[1]
+        if math.isfinite(value):
+            return repr(value)
+        return "math.nan" if math.isnan(value) else ("math.inf" if value > 0 else "(-math.inf)")
+    if kind == "var":
+        return "x"
+    if kind == "neg":
+        return f"(-{to_source(node[1], module)})"
+    if kind == "call":
+        return f"{module}.{node[1]}({to_source(node[2], module)})"
+    return f"({to_source(node[1], module)} {OPERATORS[kind]} {to_source(node[2], module)})"
+
+
+def to_string(node):
+    """Запись выражения для вывода пользователю"""
+    kind = node[0]
+    if kind == "num":
+        return f"{node[1]:g}"
+    if kind == "var":
+        return "x"
+    if kind == "neg":
+        return f"-{to_string(node[1])}"
+    if kind == "call":
+        return f"{node[1]}({to_string(node[2])})"
+    symbol = {"add": " + ", "sub": " - ", "mul": "*", "div": "/", "pow": "^"}[kind]
+    return f"({to_string(node[1])}{symbol}{to_string(node[2])})"
+
+
+def load_tree(data):
+    """
+    Дерево из записи кэша (списки JSON) с проверкой структуры: допускаются
+    только узлы, которые строит Parser.
+    """
+    if isinstance(data, list) and data:
+        kind = data[0]
+        if kind == "num" and len(data) == 2 and type(data[1]) in (int, float):
+            return ("num", float(data[1]))
+        if kind == "var" and len(data) == 1:
+            return ("var",)
+        if kind == "neg" and len(data) == 2:
+            return ("neg", load_tree(data[1]))
+        if kind == "call" and len(data) == 3 and data[1] in FUNCTIONS:
+            return ("call", data[1], load_tree(data[2]))
+        if kind in OPERATORS and len(data) == 3:
+            return (kind, load_tree(data[1]), load_tree(data[2]))
+    raise ValueError("Поврежденная запись кэша выражений.")
+
+
+def compile_source(source, vectorized):
+    namespace = {"np": np, "ad": AutoDiff, "math": math}
+    func = eval(f"lambda x: {source}", namespace)
+    if vectorized:
+        # Константное выражение тоже должно возвращать массив
+        return lambda x: func(x) + np.zeros_like(x, dtype=float)
+    return func
+
+
+class CompiledExpression:
+    """
+    Выражение f(x), разобранное один раз и скомпилированное вместе с f' и f''.
+
+    Скалярные функции используют элементарные функции AutoDiff и поэтому
+    принимают числа, массивы NumPy и дуальные числа; векторизованные
+    используют NumPy напрямую.
+    """
+
+    def __init__(self, text, use_cache=True):
+        self.text = text
+        trees = self.load_cache() if use_cache else None
+        if trees is None:
+            f = parse(text)
+            f_prime = differentiate(f)
+            trees = (f, f_prime, differentiate(f_prime))
+            if use_cache:
+                self.save_cache(trees)
+
+        self.trees = trees
+        self.simplified = to_string(trees[0])
+        self.sources = {
+            "scalar": [to_source(node, "ad") for node in trees],
+            "vectorized": [to_source(node, "np") for node in trees]
+        }
+        self.f, self.f_prime, self.f2 = (compile_source(s, False) for s in self.sources["scalar"])
+        self.f_vec, self.f_prime_vec, self.f2_vec = (compile_source(s, True) for s in self.sources["vectorized"])
+
+    @property
+    def key(self):
+        return hashlib.sha256(f"{CACHE_VERSION}:{self.text}".encode("utf-8")).hexdigest()
+
+    def cache_path(self):
+        return os.path.join(CACHE_DIR, f"{self.key}.json")
+
+    def load_cache(self):
+        """Деревья (f, f', f'') из кэша; None, если записи нет или она повреждена"""
+        try:
+            with open(self.cache_path(), encoding="utf-8") as file_:
+                entry = json.load(file_)
+            if entry.get("version") != CACHE_VERSION or entry.get("text") != self.text:
+                return None
+            trees = tuple(load_tree(data) for data in entry["trees"])
+        except (OSError, ValueError, AttributeError, KeyError, TypeError, RecursionError):
+            return None
+        return trees if len(trees) == 3 else None
+
+    def save_cache(self, trees):
+        entry = {"version": CACHE_VERSION, "text": self.text, "trees": trees}
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{self.cache_path()}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file_:
+                json.dump(entry, file_)
+            os.replace(tmp_path, self.cache_path())
+        except OSError:
+            pass
+
+    def suggest_lambda(self, a, b, num_points=100):
+        """
+        Множитель lambda для phi(x) = x + lambda*f(x): lambda = -1/max|f'(x)|
+        со знаком, противоположным знаку f' на [a, b].
+        """
+        values = self.f_prime_vec(np.linspace(a, b, num_points))
+        maxi = np.max(np.abs(values))
+        if maxi == 0:
+            raise ValueError("f'(x) = 0 на всем интервале, phi построить нельзя.")
+        return -1 / maxi if values[np.argmax(np.abs(values))] > 0 else 1 / maxi
+
+    def to_equation(self, a=None, b=None):
+        """
+        Уравнение в формате FunctionService.equations. Если заданы a и b,
+        добавляется предлагаемая phi(x) = x + lambda*f(x).
+        """
+        eq = {
+            "description": f"f(x) = {self.text}",
+            "f": self.f,
+            "f_prime": self.f_prime,
+            "f2": self.f2,
+            "vectorized": {
+                "f": self.f_vec,
+                "f_prime": self.f_prime_vec,
+                "f2": self.f2_vec
+            }
+        }
+        if a is not None and b is not None:
+            lmbda = self.suggest_lambda(a, b)
+            f, f_prime, f_vec, f_prime_vec = self.f, self.f_prime, self.f_vec, self.f_prime_vec
+            eq["phi"] = lambda x: x + lmbda * f(x)
+            eq["phi_prime"] = lambda x: 1 + lmbda * f_prime(x)
+            eq["vectorized"]["phi"] = lambda x: x + lmbda * f_vec(x)
+            eq["vectorized"]["phi_prime"] = lambda x: 1 + lmbda * f_prime_vec(x)
+        return eq
+
+
+def compile_expression(text, use_cache=True):
+    return CompiledExpression(text, use_cache)
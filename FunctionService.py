@@ -1,4 +1,9 @@
-import math
+import AutoDiff
+import ExpressionCompiler
+from LazyImport import lazy_import
+from Polynomial import Polynomial
+
+np = lazy_import("numpy")
 
 
 def f1(x):
@@ -27,44 +32,44 @@ def phi1_prime(x):
 
 def f2(x):
     """f(x) = cos(x) - x"""
-    return math.cos(x) - x
+    return AutoDiff.cos(x) - x
 
 
 def f2_prime(x):
-    return -math.sin(x) - 1
+    return -AutoDiff.sin(x) - 1
 
 
 def f2_2(x):
-    return -math.cos(x)
+    return -AutoDiff.cos(x)
 
 
 def phi2(x):
-    return math.cos(x)
+    return AutoDiff.cos(x)
 
 
 def phi2_prime(x):
-    return -math.sin(x)
+    return -AutoDiff.sin(x)
 
 
 def f3(x):
     """f(x) = exp(x) - 3*x"""
-    return math.exp(x) - 3 * x
+    return AutoDiff.exp(x) - 3 * x
 
 
 def f3_prime(x):
-    return math.exp(x) - 3
+    return AutoDiff.exp(x) - 3
 
 
 def f3_2(x):
-    return math.exp(x)
+    return AutoDiff.exp(x)
 
 
 def phi3(x):
-    return math.exp(x) / 3
+    return AutoDiff.exp(x) / 3
 
 
 def phi3_prime(x):
-    return math.exp(x) / 3
+    return AutoDiff.exp(x) / 3
 
 
 def f4(x):
@@ -81,12 +86,75 @@ def f4_2(x):
 
 
 def phi4(x):
-    return (0.945 * x ** 2 + 2.5 * x - 1.17) ** (1 / 3)
+    # Вещественный кубический корень (как в phi1): для отрицательного
+    # аргумента ** (1 / 3) дает комплексное число
+    u = 0.945 * x ** 2 + 2.5 * x - 1.17
+    if u >= 0:
+        return u ** (1 / 3)
+    else:
+        return -((-u) ** (1 / 3))
 
 
 def phi4_prime(x):
     numerator = (2 * 0.945 * x + 2.5)
-    denominator = 3 * ((0.945 * x ** 2 + 2.5 * x - 1.17) ** (2 / 3))
+    denominator = 3 * (abs(0.945 * x ** 2 + 2.5 * x - 1.17) ** (2 / 3))
+    return numerator / denominator
+
+
+# Векторизованные варианты (принимают массивы NumPy).
+# Многочлены f1, f4 и их производные работают с массивами без изменений.
+
+def phi1_vec(x):
+    return np.cbrt(x + 2)
+
+
+def phi1_prime_vec(x):
+    return 1 / (3 * np.abs(x + 2) ** (2 / 3))
+
+
+def f2_vec(x):
+    return np.cos(x) - x
+
+
+def f2_prime_vec(x):
+    return -np.sin(x) - 1
+
+
+def f2_2_vec(x):
+    return -np.cos(x)
+
+
+def phi2_vec(x):
+    return np.cos(x)
+
+
+def phi2_prime_vec(x):
+    return -np.sin(x)
+
+
+def f3_vec(x):
+    return np.exp(x) - 3 * x
+
+
+def f3_prime_vec(x):
+    return np.exp(x) - 3
+
+
+def f3_2_vec(x):
+    return np.exp(x)
+
+
+def phi3_vec(x):
+    return np.exp(x) / 3
+
+
+def phi4_vec(x):
+    return np.cbrt(0.945 * x ** 2 + 2.5 * x - 1.17)
+
+
+def phi4_prime_vec(x):
+    numerator = (2 * 0.945 * x + 2.5)
+    denominator = 3 * np.cbrt(0.945 * x ** 2 + 2.5 * x - 1.17) ** 2
     return numerator / denominator
 
 
@@ -97,7 +165,15 @@ equations = {
         "f_prime": f1_prime,
         "f2": f1_2,
         "phi": phi1,
-        "phi_prime": phi1_prime
+        "phi_prime": phi1_prime,
+        "vectorized": {
+            "f": f1,
+            "f_prime": f1_prime,
+            "f2": f1_2,
+            "phi": phi1_vec,
+            "phi_prime": phi1_prime_vec
+        },
+        "polynomial": Polynomial([1, 0, -1, -2])
     },
     2: {
         "description": "f(x) = cos(x) - x",
@@ -105,7 +181,14 @@ equations = {
         "f_prime": f2_prime,
         "f2": f2_2,
         "phi": phi2,
-        "phi_prime": phi2_prime
+        "phi_prime": phi2_prime,
+        "vectorized": {
+            "f": f2_vec,
+            "f_prime": f2_prime_vec,
+            "f2": f2_2_vec,
+            "phi": phi2_vec,
+            "phi_prime": phi2_prime_vec
+        }
     },
     3: {
         "description": "f(x) = exp(x) - 3*x",
@@ -113,7 +196,14 @@ equations = {
         "f_prime": f3_prime,
         "f2": f3_2,
         "phi": phi3,
-        "phi_prime": phi3_prime
+        "phi_prime": phi3_prime,
+        "vectorized": {
+            "f": f3_vec,
+            "f_prime": f3_prime_vec,
+            "f2": f3_2_vec,
+            "phi": phi3_vec,
+            "phi_prime": phi3_vec
+        }
     },
     4: {
         "description": "f(x) = 2x^3 - 1.89x^2 - 5x + 2.34",
@@ -121,6 +211,124 @@ equations = {
         "f_prime": f4_prime,
         "f2": f4_2,
         "phi": phi4,
-        "phi_prime": phi4_prime
+        "phi_prime": phi4_prime,
+        "vectorized": {
+            "f": f4,
+            "f_prime": f4_prime,
+            "f2": f4_2,
+            "phi": phi4_vec,
+            "phi_prime": phi4_prime_vec
+        },
+        "polynomial": Polynomial([2, -1.89, -5, 2.34])
+    }
+}
+
+
+def make_equation(description, f, phi=None):
+    """
+    Уравнение в формате equations, в котором f_prime, f2 и phi_prime
+    получены автоматическим дифференцированием f и phi.
+    f и phi должны использовать элементарные функции из AutoDiff.
+    """
+    eq = {
+        "description": description,
+        "f": f,
+        "f_prime": AutoDiff.derivative(f),
+        "f2": AutoDiff.second_derivative(f)
+    }
+    if phi is not None:
+        eq["phi"] = phi
+        eq["phi_prime"] = AutoDiff.derivative(phi)
+    add_combined(eq)
+    return eq
+
+
+def add_combined(eq):
+    """
+    Добавляет в уравнение совместное вычисление f и ее производных за один
+    проход f (автоматическое дифференцирование):
+    f_f_prime(x) -> (f, f'), f_f_prime_f2(x) -> (f, f', f'').
+
+    MethodService передает их методам Ньютона, гибридному и Чебышева-Галлея.
+    Выгодно, когда f' и f'' сами получены автоматическим дифференцированием
+    (make_equation); для уравнений с готовыми производными (equations 1-4,
+    register_expression) отдельные вызовы f, f', f'' быстрее.
+    """
+    f = eq["f"]
+    eq["f_f_prime"] = lambda x: AutoDiff.value_and_derivative(f, x)
+    eq["f_f_prime_f2"] = lambda x: AutoDiff.taylor2(f, x)
+    return eq
+
+
+def polynomial_equation(coefficients, description=None):
+    """
+    Уравнение в формате equations для многочлена с коэффициентами
+    coefficients (от старшего). Производные - тоже многочлены, все функции
+    вычисляются схемой Горнера и принимают массивы NumPy.
+    """
+    p = Polynomial(coefficients)
+    p_prime = p.derivative()
+    p2 = p_prime.derivative()
+    return {
+        "description": description or f"f(x) = {p}",
+        "f": p,
+        "f_prime": p_prime,
+        "f2": p2,
+        "vectorized": {
+            "f": p,
+            "f_prime": p_prime,
+            "f2": p2
+        },
+        "polynomial": p,
+        "f_f_prime": p.value_and_derivative,
+        "f_f_prime_f2": p.taylor2
+    }
+
+
+def f4_family(x, c2, c0):
+    """f(x) = 2x^3 - c2*x^2 - 5x + c0 (f4 при c2 = 1.89, c0 = 2.34)"""
+    return 2 * x ** 3 - c2 * x ** 2 - 5 * x + c0
+
+
+def make_family(description, f, default):
+    """
+    Семейство уравнений f(x, p1, ..., pk) = 0 с параметрами p.
+    f должна использовать элементарные функции из AutoDiff; at(*p) - уравнение
+    в формате equations при заданных значениях параметров.
+    """
+    return {
+        "description": description,
+        "f": f,
+        "default": tuple(default),
+        "at": lambda *p: make_equation(f"{description}, p = {p}", lambda x: f(x, *p))
     }
+
+
+families = {
+    4: make_family("f(x) = 2x^3 - c2*x^2 - 5x + c0", f4_family, (1.89, 2.34))
 }
+
+
+def register_polynomial(coefficients, description=None):
+    """
+    Регистрирует уравнение-многочлен в equations.
+
+    :return: Номер уравнения в equations.
+    """
+    num = max(equations) + 1
+    equations[num] = polynomial_equation(coefficients, description)
+    return num
+
+
+def register_expression(text, a=None, b=None):
+    """
+    Регистрирует уравнение f(x) = 0, заданное строкой (например, "2x^3 - 1.89x^2 - 5x + 2.34").
+    Выражение разбирается и дифференцируется один раз, результат компиляции
+    кэшируется на диске. Если заданы a и b, добавляется предлагаемая phi(x).
+
+    :return: Номер уравнения в equations.
+    """
+    eq = ExpressionCompiler.compile_expression(text).to_equation(a, b)
+    num = max(equations) + 1
+    equations[num] = eq
+    return num
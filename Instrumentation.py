@@ -0,0 +1,126 @@
+import json
+import time
+
+# Этапы решения: имя метода решателя -> название этапа
+PHASES = {
+    "verify_interval": "interval_check",
+    "check_convergence_condition": "convergence_check",
+    "choose_initial": "initial_choice"
+}
+
+
+class CountingFunction:
+    """Обертка, считающая вызовы функции (без замера времени, в отличие от Instrument)"""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+
+class Instrument:
+    """
+    Сбор статистики одного или нескольких решений.
+
+    Передается решателю параметром instrument. При подключении (attach)
+    функции решателя (f, f', phi, ...) оборачиваются счетчиками вызовов
+    и времени, а этапы решения - таймерами. Без instrument решатели
+    работают с исходными функциями и не несут накладных расходов, кроме
+    одной проверки на итерацию.
+    """
+
+    def __init__(self, callbacks=(), trace=True):
+        """
+        callbacks: функции callback(iteration, x, error), вызываемые на каждой итерации
+        trace    : сохранять ли трассу итераций (iteration, x, error)
+        """
+        self.callbacks = list(callbacks)
+        self.trace = [] if trace else None
+        self.calls = {}
+        self.function_time = {}
+        self.timings = {}
+
+    def wrap_function(self, name, func):
+        """Обертка, считающая вызовы и время функции name"""
+        if func is None:
+            return None
+        self.calls.setdefault(name, 0)
+        self.function_time.setdefault(name, 0.0)
+
+        def counted(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.function_time[name] += time.perf_counter() - start
+                self.calls[name] += 1
+        return counted
+
+    def wrap_phase(self, phase, method):
+        """Обертка, измеряющая время этапа phase"""
+        self.timings.setdefault(phase, 0.0)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.timings[phase] += time.perf_counter() - start
+        return timed
+
+    def attach(self, solver, functions):
+        """
+        Подключение к решателю: functions - имена атрибутов-функций
+        решателя, которые нужно считать.
+        """
+        for name in functions:
+            if getattr(solver, name, None) is not None:
+                setattr(solver, name, self.wrap_function(name, getattr(solver, name)))
+        for method, phase in PHASES.items():
+            if hasattr(solver, method):
+                setattr(solver, method, self.wrap_phase(phase, getattr(solver, method)))
+        solver.solve = self.wrap_phase("solve", solver.solve)
+
+    def iteration(self, iteration, x, error):
+        """Вызывается решателем на каждой итерации: x - приближение, error - оценка погрешности"""
+        if self.trace is not None:
+            self.trace.append((iteration, x, error))
+        for callback in self.callbacks:
+            callback(iteration, x, error)
+
+    def report(self):
+        """
+        Сводка: число вызовов и время каждой функции, время этапов, время
+        основного цикла без учета этапов и время самого цикла Python без
+        учета вызовов функций.
+        """
+        timings = dict(self.timings)
+        total = timings.get("solve", 0.0)
+        phases = sum(t for phase, t in timings.items() if phase != "solve")
+        timings["main_loop"] = total - phases
+        timings["overhead"] = total - sum(self.function_time.values())
+        return {
+            "calls": dict(self.calls),
+            "function_time": dict(self.function_time),
+            "timings": timings,
+            "iterations": len(self.trace) if self.trace is not None else None
+        }
+
+    def export(self, path):
+        """Сохранение сводки и трассы итераций в JSON"""
+        data = self.report()
+        data["trace"] = [[i, _plain(x), _plain(v)] for i, x, v in (self.trace or [])]
+        with open(path, "w", encoding="utf-8") as file_:
+            json.dump(data, file_, ensure_ascii=False)
+
+
+def _plain(value):
+    """Приведение чисел и массивов NumPy к типам JSON"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (tuple, list)):
+        return [_plain(v) for v in value]
+    return value
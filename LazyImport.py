@@ -0,0 +1,31 @@
+"""
+Отложенный импорт тяжелых модулей (numpy) для быстрого запуска.
+
+Модуль, полученный lazy_import, загружается при первом обращении к его
+атрибуту, поэтому короткий запуск main.py, не требующий векторных
+вычислений и графиков, не тратит время на импорт numpy.
+"""
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name):
+    """Модуль name, загружаемый при первом обращении к атрибуту"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(name):
+    """Загружен ли модуль name (отложенный модуль до первого обращения - нет)"""
+    # type() не обращается к атрибутам и не вызывает загрузку
+    return name in sys.modules and type(sys.modules[name]) is types.ModuleType
@@ -0,0 +1,96 @@
+"""
+Реестр методов решения. Класс метода задается полным именем и загружается
+при первом создании решателя (load_class), поэтому запуск с одним методом
+не импортирует модули остальных.
+"""
+import importlib
+
+
+def load_class(path):
+    """Класс по полному имени "пакет.модуль.Класс" (модуль импортируется при первом вызове)"""
+    module_name, class_name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_chord(cls, eq, a, b, epsilon, **kwargs):
+    return cls(eq["f"], eq["f2"], a, b, epsilon, **kwargs)
+
+
+def create_newton(cls, eq, a, b, epsilon, **kwargs):
+    """Методы, использующие f, f', f'' и f_f_prime уравнения (Ньютон, гибридный)"""
+    kwargs.setdefault("f_f_prime", eq.get("f_f_prime"))
+    return cls(eq["f"], eq["f_prime"], eq["f2"], a, b, epsilon, **kwargs)
+
+
+def create_chebyshev_halley(cls, eq, a, b, epsilon, **kwargs):
+    """Методы Чебышева-Галлея: f, f', f'' и f_f_prime_f2 уравнения"""
+    kwargs.setdefault("f_f_prime_f2", eq.get("f_f_prime_f2"))
+    return cls(eq["f"], eq["f_prime"], eq["f2"], a, b, epsilon, **kwargs)
+
+
+def create_super_halley(cls, eq, a, b, epsilon, **kwargs):
+    kwargs.setdefault("alpha", 1)
+    return create_chebyshev_halley(cls, eq, a, b, epsilon, **kwargs)
+
+
+def create_polynomial(cls, eq, a, b, epsilon, **kwargs):
+    if "polynomial" not in eq:
+        raise ValueError("Метод применим только к многочленам!")
+    return cls(eq["polynomial"], a, b, epsilon, **kwargs)
+
+
+def create_simple_iteration(cls, eq, a, b, epsilon, **kwargs):
+    kwargs.setdefault("phi_prime_vec", eq.get("vectorized", {}).get("phi_prime"))
+    return cls(eq["f"], eq["phi"], eq["phi_prime"], a, b, epsilon, **kwargs)
+
+
+methods = {
+    1: {
+        "description": "Метод хорд",
+        "class": "Methods.ChordMethod.ChordMethod",
+        "create": create_chord
+    },
+    2: {
+        "description": "Метод Ньютона",
+        "class": "Methods.NewtonMethod.NewtonMethod",
+        "create": create_newton
+    },
+    3: {
+        "description": "Метод простой итерации",
+        "class": "Methods.SimpleIterationMethod.SimpleIterationMethod",
+        "create": create_simple_iteration
+    },
+    4: {
+        "description": "Гибридный метод (Ньютон + хорды + деление пополам)",
+        "class": "Methods.HybridMethod.HybridMethod",
+        "create": create_newton
+    },
+    5: {
+        "description": "Метод Галлея",
+        "class": "Methods.HalleyMethod.HalleyMethod",
+        "create": create_chebyshev_halley
+    },
+    6: {
+        "description": "Метод Чебышева",
+        "class": "Methods.ChebyshevMethod.ChebyshevMethod",
+        "create": create_chebyshev_halley
+    },
+    7: {
+        "description": "Метод супер-Галлея",
+        "class": "Methods.ChebyshevHalleyMethod.ChebyshevHalleyMethod",
+        "create": create_super_halley
+    },
+    8: {
+        "description": "Корни многочлена (система Штурма + матрица компаньона)",
+        "class": "Methods.PolynomialMethod.PolynomialMethod",
+        "create": create_polynomial
+    }
+}
+
+
+def create_solver(meth_num, eq, a, b, epsilon, **kwargs):
+    """Создает решатель с номером meth_num для уравнения eq из FunctionService.equations"""
+    if meth_num not in methods:
+        raise ValueError("Недействительный номер метода!")
+    method = methods[meth_num]
+    return method["create"](load_class(method["class"]), eq, a, b, epsilon, **kwargs)
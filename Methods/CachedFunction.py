@@ -0,0 +1,92 @@
+from collections import OrderedDict
+
+
+class CachedFunction:
+    """
+    Обертка над функцией одной переменной, запоминающая вычисленные значения.
+
+    Ключом служат тип и точное значение аргумента (cache_key), при
+    переполнении удаляется значение, к которому дольше всего не обращались
+    (LRU). Массивы NumPy передаются в функцию напрямую, без кэширования.
+    """
+
+    def __init__(self, func, maxsize=1024):
+        """
+        func   : функция f(x)
+        maxsize: максимальное число запоминаемых значений
+        """
+        if not callable(func):
+            raise TypeError("func должна быть вызываемым объектом (функцией).")
+
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize должен быть положительным целым числом.")
+
+        self.func = func
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.__doc__ = func.__doc__
+
+    def __call__(self, x):
+        cache = self.cache
+        try:
+            key = cache_key(x)
+            value = cache[key]
+        except KeyError:
+            self.misses += 1
+            value = cache[key] = self.func(x)
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+            return value
+        except TypeError:
+            # Нехешируемый аргумент: массив NumPy, дуальное число
+            return self.func(x)
+
+        self.hits += 1
+        cache.move_to_end(key)
+        return value
+
+    def cache_info(self):
+        """Статистика кэша: попадания, промахи, текущий и максимальный размер"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.cache), "maxsize": self.maxsize}
+
+    def clear(self):
+        """Очистка кэша и счетчиков"""
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def cache_key(x):
+    """
+    Ключ кэша для аргумента x. Равные, но различимые функцией аргументы
+    (0.0 и -0.0, 1 и True) дают разные ключи: вещественное число задается
+    своей шестнадцатеричной записью, сохраняющей знак нуля.
+    """
+    if isinstance(x, float):
+        return type(x), x.hex()
+    return type(x), x
+
+
+def cached(func, maxsize=1024):
+    """Возвращает func с кэшем; уже кэширующая функция не оборачивается повторно"""
+    if func is None or isinstance(func, CachedFunction):
+        return func
+    return CachedFunction(func, maxsize)
+
+
+CACHED_KEYS = ("f", "f_prime", "f2", "phi", "phi_prime")
+
+
+def cached_equation(eq, maxsize=1024):
+    """
+    Копия уравнения из FunctionService.equations, в которой f, f_prime, f2,
+    phi и phi_prime обернуты в CachedFunction. Кэш общий для всех решателей,
+    получивших это уравнение.
+    """
+    result = dict(eq)
+    for key in CACHED_KEYS:
+        if key in result:
+            result[key] = cached(result[key], maxsize)
+    return result
@@ -0,0 +1,170 @@
+from LazyImport import lazy_import
+from Methods.CachedFunction import cached
+from Methods.FunctionPlotter import FunctionPlotter
+from SolveResult import IterationHistory, SolveResult
+
+np = lazy_import("numpy")
+
+
+class ChebyshevHalleyMethod:
+    """
+    Семейство методов Чебышева-Галлея третьего порядка:
+
+        L(x) = f(x) f''(x) / f'(x)²,
+        x_(n+1) = x_n - (1 + L / (2 (1 - alpha L))) * f(x_n) / f'(x_n).
+
+    alpha = 0 - метод Чебышева, alpha = 1/2 - метод Галлея (метод
+    Хаусхолдера второго порядка), alpha = 1 - метод супер-Галлея.
+    Если знаменатель 1 - alpha L обращается в нуль, делается шаг Ньютона.
+    """
+
+    ALPHA = 0.5
+
+    def __init__(self, f, f_prime, f_prime2, a, b, epsilon, max_iter=100, plotter=None, cache_size=None,
+                 f_f_prime_f2=None, instrument=None, alpha=None, history=False):
+        """
+        f           : функция f(x)
+        f_prime     : первая производная f'(x)
+        f_prime2    : вторая производная f''(x)
+        a, b        : границы интервала [a, b]
+        epsilon     : требуемая точность
+        max_iter    : максимальное число итераций
+        plotter     : объект для построения графика (None - без графика)
+        cache_size  : размер кэша значений f, f' и f'' (None - без кэша)
+        f_f_prime_f2: необязательная функция x -> (f(x), f'(x), f''(x)) за один проход
+        instrument  : объект Instrumentation.Instrument для сбора статистики (None - без нее)
+        alpha       : параметр семейства (None - значение ALPHA класса)
+        history     : сохранять ли историю итераций (IterationHistory) в self.history
+        """
+        self.iterations = None
+        self.f = cached(f, cache_size) if cache_size else f
+        self.f_prime = cached(f_prime, cache_size) if cache_size else f_prime
+        self.f_prime2 = cached(f_prime2, cache_size) if cache_size else f_prime2
+        self.f_f_prime_f2 = f_f_prime_f2
+        self.a = a
+        self.b = b
+        self.epsilon = epsilon
+        self.max_iter = max_iter
+        self.alpha = self.ALPHA if alpha is None else alpha
+        self.plotter = plotter
+        self.root = None
+        self.error = None
+        self.keep_history = history
+        self.history = None
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ("f", "f_prime", "f_prime2", "f_f_prime_f2"))
+
+    def check_convergence_condition(self):
+        """Проверка условия сходимости"""
+        if self.f(self.a) * self.f(self.b) >= 0:
+            raise Exception("Неверный интервал: функция не меняет знак на [a, b].")
+
+    def choose_initial(self):
+        """Выбор начального приближения f(x)*f''(x) > 0"""
+        if self.f(self.a) * self.f_prime2(self.a) > 0:
+            return self.a
+        else:
+            return self.b
+
+    def evaluate(self, x):
+        """Кортеж (f(x), f'(x), f''(x))"""
+        if self.f_f_prime_f2 is not None:
+            return self.f_f_prime_f2(x)
+        return self.f(x), self.f_prime(x), self.f_prime2(x)
+
+    def step(self, f_x, f_prime_x, f_prime2_x):
+        """Поправка x_n - x_(n+1)"""
+        newton = f_x / f_prime_x
+        L = newton * f_prime2_x / f_prime_x
+        denominator = 1 - self.alpha * L
+        if denominator == 0:
+            return newton
+        return (1 + L / (2 * denominator)) * newton
+
+    def solve(self):
+        """Основной метод класса"""
+        if self.plotter is not None:
+            self.plot_function()
+        self.check_convergence_condition()
+
+        x_i = self.choose_initial()
+        history = self.history = IterationHistory(self.max_iter) if self.keep_history else None
+        for i in range(1, self.max_iter + 1):
+            f_x, f_prime_x, f_prime2_x = self.evaluate(x_i)
+            if f_prime_x == 0:
+                raise ZeroDivisionError(f"Производная равна нулю в точке x = {x_i}")
+            x_new = x_i - self.step(f_x, f_prime_x, f_prime2_x)
+            if history is not None:
+                history.record(x_i, f_x, x_new - x_i, abs(x_new - x_i))
+            if self.instrument is not None:
+                self.instrument.iteration(i, x_new, abs(x_new - x_i))
+            if abs(x_new - x_i) < self.epsilon:
+                self.root = x_new
+                self.iterations = i
+                self.error = self.f(self.root)
+                return SolveResult(x_new, self.error, i, history)
+            x_i = x_new
+        raise Exception("Метод не сошелся за заданное число итераций.")
+
+    @classmethod
+    def solve_batch(cls, f, f_prime, f_prime2, a, b, epsilon, max_iter=100, alpha=None):
+        """
+        Пакетное нахождение корней на массивах интервалов.
+
+        f, f_prime, f_prime2 : векторизованные f(x), f'(x), f''(x)
+        a, b                 : массивы границ интервалов
+        epsilon              : точность (число или массив по каждому интервалу)
+        alpha                : параметр семейства (None - значение ALPHA класса)
+
+        :return: Кортеж массивов (roots, func_values, iterations).
+                 Для неверных интервалов, нулевой производной и несошедшихся
+                 интервалов root и func_value равны NaN.
+        """
+        alpha = cls.ALPHA if alpha is None else alpha
+        a, b, epsilon = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                            np.asarray(b, dtype=float),
+                                            np.asarray(epsilon, dtype=float))
+
+        roots = np.full(a.shape, np.nan)
+        values = np.full(a.shape, np.nan)
+        iterations = np.zeros(a.shape, dtype=int)
+
+        f_a = f(a)
+        active = np.flatnonzero(f_a * f(b) < 0)
+        # Начальное приближение: f(x)*f''(x) > 0
+        x_i = np.where(f_a * f_prime2(a) > 0, a, b)[active]
+        epsilon = epsilon[active]
+
+        for i in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            f_prime_x = f_prime(x_i)
+            nonzero = f_prime_x != 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = f(x_i) / f_prime_x
+                L = newton * f_prime2(x_i) / f_prime_x
+                denominator = 1 - alpha * L
+                factor = np.where(denominator != 0, 1 + L / (2 * denominator), 1)
+                x_new = x_i - factor * newton
+
+            done = nonzero & (np.abs(x_new - x_i) < epsilon)
+            roots[active[done]] = x_new[done]
+            iterations[active] = i
+
+            keep = nonzero & ~done & np.isfinite(x_new)
+            active, x_i, epsilon = active[keep], x_new[keep], epsilon[keep]
+
+        converged = ~np.isnan(roots)
+        values[converged] = f(roots[converged])
+        return roots, values, iterations
+
+    def plot_function(self, num_points=None):
+        """
+        Построение графика функции на интервале [a, b].
+        Если плоттер не задан, используется FunctionPlotter по умолчанию.
+
+        :param num_points: Количество точек для построения графика.
+        """
+        plotter = self.plotter if self.plotter is not None else FunctionPlotter()
+        return plotter.plot(self.f, self.a, self.b, num_points)
@@ -0,0 +1,10 @@
+from Methods.ChebyshevHalleyMethod import ChebyshevHalleyMethod
+
+
+class ChebyshevMethod(ChebyshevHalleyMethod):
+    """
+    Метод Чебышева:
+    x_(n+1) = x_n - (1 + f f'' / (2 f'²)) * f / f'.
+    """
+
+    ALPHA = 0
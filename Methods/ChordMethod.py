@@ -1,15 +1,34 @@
-import numpy as np
-import matplotlib.pyplot as plt
+import math
+
+from LazyImport import lazy_import
+from Methods.CachedFunction import cached
+from Methods.FunctionPlotter import FunctionPlotter
+from SolveResult import IterationHistory, SolveResult
+
+np = lazy_import("numpy")
 
 
 class ChordMethod:
-    def __init__(self, f, f2, a, b, tol, max_iter=100):
+    # Модификации метода против одностороннего застоя:
+    # None - классический метод хорд (regula falsi),
+    # "illinois", "pegasus", "anderson_bjorck" - уменьшение значения функции
+    # на неподвижном конце интервала.
+    MODIFICATIONS = (None, "illinois", "pegasus", "anderson_bjorck")
+
+    def __init__(self, f, f2, a, b, tol, max_iter=100, plotter=None, modification=None, cache_size=None,
+                 instrument=None, history=False):
         """
-        f       : функция f(x)
-        f2      : вторая производная f''(x)
-        a, b    : границы интервала [a, b]
-        tol     : требуемая точность
-        max_iter: максимальное число итераций
+        f           : функция f(x)
+        f2          : вторая производная f''(x)
+        a, b        : границы интервала [a, b]
+        tol         : требуемая точность
+        max_iter    : максимальное число итераций
+        plotter     : объект для построения графика (None - без графика)
+        modification: модификация метода из ChordMethod.MODIFICATIONS
+                      (по умолчанию - классический метод хорд)
+        cache_size  : размер кэша значений f и f2 (None - без кэша)
+        instrument  : объект Instrumentation.Instrument для сбора статистики (None - без нее)
+        history     : сохранять ли историю итераций (IterationHistory) в self.history
         """
         if not callable(f) or not callable(f2):
             raise TypeError("f и f2 должны быть вызываемыми объектами (функциями).")
@@ -28,23 +47,36 @@ class ChordMethod:
         if not isinstance(max_iter, int) or max_iter <= 0:
             raise ValueError("max_iter должен быть положительным целым числом.")
 
-        self.f = f
-        self.f2 = f2
+        if modification not in self.MODIFICATIONS:
+            raise ValueError(f"Неизвестная модификация метода хорд: {modification}.")
+
+        self.f = cached(f, cache_size) if cache_size else f
+        self.f2 = cached(f2, cache_size) if cache_size else f2
         self.a = a
         self.b = b
         self.tol = tol
         self.max_iter = max_iter
+        self.plotter = plotter
+        self.modification = modification
+        self.f_a = None
+        self.f_b = None
         self.root = None
         self.iterations = 0
         self.error = None
+        self.keep_history = history
+        self.history = None
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ("f", "f2"))
 
     def verify_interval(self):
         """
         Проверка наличия корня на интервале [a, b].
         Корень существует, если функция меняет знак на концах интервала.
+        Значения f(a) и f(b) сохраняются для основного цикла.
         """
-        f_a = self.f(self.a)
-        f_b = self.f(self.b)
+        f_a = self.f_a = self.f(self.a)
+        f_b = self.f_b = self.f(self.b)
 
         if f_a * f_b > 0:
             raise ValueError("На интервале нет корня или их несколько.")
@@ -55,76 +87,155 @@ class ChordMethod:
 
         return True
 
+    @staticmethod
+    def retained_scale(modification, f_b, f_x):
+        """
+        Множитель для значения функции на неподвижном конце интервала,
+        когда новое приближение x оказалось по ту же сторону от корня, что и b.
+        Работает как с числами, так и с массивами NumPy.
+        """
+        if modification == "illinois":
+            return 0.5
+        if modification == "pegasus":
+            return f_b / (f_b + f_x)
+        if modification == "anderson_bjorck":
+            m = 1 - f_x / f_b
+            if isinstance(m, (int, float)):
+                return m if m > 0 else 0.5
+            return np.where(m > 0, m, 0.5)
+        return 1
+
     def solve(self):
         """
         Нахождение корня методом хорд.
+        На каждой итерации функция вычисляется ровно один раз.
 
-        :return: Кортеж (root, func_value, iterations), где:
+        :return: SolveResult (распаковывается как кортеж (root, func_value, iterations)), где:
                  root - найденный корень,
                  func_value - значение функции в корне,
                  iterations - количество выполненных итераций.
         """
         # Проверка интервала
-        self.plot_function()
+        if self.plotter is not None:
+            self.plot_function()
+        history = self.history = IterationHistory(self.max_iter) if self.keep_history else None
         interval_check = self.verify_interval()
-        if isinstance(interval_check, (int, float)):
+        if interval_check is not True:
             self.root = interval_check
             self.iterations = 0
-            self.error = abs(self.f(self.root))
-            return self.root, self.f(self.root), self.iterations
+            value = self.f_a if self.root == self.a else self.f_b
+            self.error = abs(value)
+            return SolveResult(self.root, value, self.iterations, history)
 
-        # Выбор начальных точек
+        # a - неподвижный конец, b - последнее приближение
         a, b = self.a, self.b
+        f_a, f_b = self.f_a, self.f_b
         iterations = 0
 
         while iterations < self.max_iter:
             try:
                 # Вычисление нового приближения
-                f_a = self.f(a)
-                f_b = self.f(b)
                 x_0 = a - ((b - a) / (f_b - f_a)) * f_a
+            except ZeroDivisionError:
+                raise ZeroDivisionError("Деление на ноль при вычислении нового приближения.")
 
-                if np.isnan(x_0) or np.isinf(x_0):
-                    raise ArithmeticError("Вычисленное значение x_0 является NaN или бесконечностью.")
+            if not math.isfinite(x_0):
+                raise ArithmeticError("Вычисленное значение x_0 является NaN или бесконечностью.")
 
-                # Проверка условия сходимости
-                if abs(self.f(x_0)) < self.tol:
-                    self.root = x_0
-                    self.iterations = iterations
-                    self.error = abs(self.f(x_0))
-                    return x_0, self.f(x_0), iterations
+            f_x = self.f(x_0)
+            if history is not None:
+                history.record(x_0, f_x, x_0 - b, abs(f_x))
+            if self.instrument is not None:
+                self.instrument.iteration(iterations, x_0, abs(f_x))
 
-                # Обновление границ
-                if self.f(x_0) * self.f(a) < 0:
-                    b = x_0
-                else:
-                    a = x_0
+            # Проверка условия сходимости
+            if abs(f_x) < self.tol:
+                self.root = x_0
+                self.iterations = iterations
+                self.error = abs(f_x)
+                return SolveResult(x_0, f_x, iterations, history)
 
-                iterations += 1
-            except ZeroDivisionError:
-                raise ZeroDivisionError("Деление на ноль при вычислении нового приближения.")
+            # Обновление границ
+            if f_x * f_b < 0:
+                a, f_a = b, f_b
+            else:
+                f_a *= self.retained_scale(self.modification, f_b, f_x)
+            b, f_b = x_0, f_x
+
+            iterations += 1
 
         raise RuntimeError("Метод хорд не сошелся за заданное число итераций.")
 
-    def plot_function(self, num_points=100):
+    @classmethod
+    def solve_batch(cls, f, a, b, tol, max_iter=100, modification=None):
+        """
+        Пакетное нахождение корней методом хорд на массивах интервалов.
+
+        f           : векторизованная функция f(x) (принимает массивы NumPy)
+        a, b        : массивы границ интервалов
+        tol         : требуемая точность (число или массив по каждому интервалу)
+        modification: модификация метода из ChordMethod.MODIFICATIONS
+
+        :return: Кортеж массивов (roots, func_values, iterations).
+                 Для интервалов без смены знака и несошедшихся интервалов
+                 root и func_value равны NaN.
+        """
+        if modification not in cls.MODIFICATIONS:
+            raise ValueError(f"Неизвестная модификация метода хорд: {modification}.")
+
+        a, b, tol = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                        np.asarray(b, dtype=float),
+                                        np.asarray(tol, dtype=float))
+        a, b = np.minimum(a, b), np.maximum(a, b)
+        tol = tol.copy()
+
+        roots = np.full(a.shape, np.nan)
+        values = np.full(a.shape, np.nan)
+        iterations = np.zeros(a.shape, dtype=int)
+
+        f_a = f(a)
+        f_b = f(b)
+        at_a = f_a == 0
+        at_b = (f_b == 0) & ~at_a
+        roots[at_a], values[at_a] = a[at_a], f_a[at_a]
+        roots[at_b], values[at_b] = b[at_b], f_b[at_b]
+
+        # Активные интервалы: функция меняет знак и корень еще не найден
+        active = np.flatnonzero(f_a * f_b < 0)
+        a, b, f_a, f_b, tol = a[active], b[active], f_a[active], f_b[active], tol[active]
+
+        for i in range(max_iter):
+            if active.size == 0:
+                break
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x_0 = a - ((b - a) / (f_b - f_a)) * f_a
+            f_x = f(x_0)
+
+            done = np.abs(f_x) < tol
+            failed = ~np.isfinite(x_0)
+            roots[active[done]] = x_0[done]
+            values[active[done]] = f_x[done]
+            iterations[active] = i
+
+            crossed = f_x * f_b < 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scale = cls.retained_scale(modification, f_b, f_x)
+            a = np.where(crossed, b, a)
+            f_a = np.where(crossed, f_b, f_a * scale)
+            b, f_b = x_0, f_x
+
+            keep = ~(done | failed)
+            active, a, b, f_a, f_b, tol = active[keep], a[keep], b[keep], f_a[keep], f_b[keep], tol[keep]
+
+        iterations[active] = max_iter
+        return roots, values, iterations
+
+    def plot_function(self, num_points=None):
         """
         Построение графика функции на интервале [a, b].
+        Если плоттер не задан, используется FunctionPlotter по умолчанию.
 
         :param num_points: Количество точек для построения графика.
         """
-        if not isinstance(num_points, int) or num_points <= 0:
-            raise ValueError("num_points должен быть положительным целым числом.")
-
-        x_vals = np.linspace(self.a, self.b, num_points)
-        y_vals = [self.f(x) for x in x_vals]
-
-        plt.figure(figsize=(8, 6))
-        plt.plot(x_vals, y_vals, label="f(x)")
-        plt.axhline(0, color='black', linewidth=0.5, linestyle='--')
-        plt.axvline(0, color='black', linewidth=0.5, linestyle='--')
-        plt.title("График функции")
-        plt.xlabel("x")
-        plt.ylabel("f(x)")
-        plt.grid(True)
-        plt.legend()
-        plt.show()
+        plotter = self.plotter if self.plotter is not None else FunctionPlotter()
+        return plotter.plot(self.f, self.a, self.b, num_points)
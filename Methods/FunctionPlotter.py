@@ -0,0 +1,48 @@
+class FunctionPlotter:
+    """
+    Построение графика функции для методов из Methods.
+
+    matplotlib импортируется только при первом построении графика, поэтому
+    решатели без плоттера не загружают matplotlib и не создают фигуры.
+    """
+
+    def __init__(self, num_points=100, show=True):
+        """
+        num_points: количество точек для построения графика
+        show      : вызывать ли plt.show() после построения
+        """
+        if not isinstance(num_points, int) or num_points <= 0:
+            raise ValueError("num_points должен быть положительным целым числом.")
+
+        self.num_points = num_points
+        self.show = show
+
+    def plot(self, f, a, b, num_points=None):
+        """
+        Построение графика функции на интервале [a, b].
+
+        :return: Созданная фигура matplotlib.
+        """
+        import numpy as np
+        import matplotlib.pyplot as plt
+
+        if num_points is None:
+            num_points = self.num_points
+        if not isinstance(num_points, int) or num_points <= 0:
+            raise ValueError("num_points должен быть положительным целым числом.")
+
+        x_vals = np.linspace(a, b, num_points)
+        y_vals = [f(x) for x in x_vals]
+
+        fig = plt.figure(figsize=(8, 6))
+        plt.plot(x_vals, y_vals, label="f(x)")
+        plt.axhline(0, color='black', linewidth=0.5, linestyle='--')
+        plt.axvline(0, color='black', linewidth=0.5, linestyle='--')
+        plt.title("График функции")
+        plt.xlabel("x")
+        plt.ylabel("f(x)")
+        plt.grid(True)
+        plt.legend()
+        if self.show:
+            plt.show()
+        return fig
@@ -0,0 +1,10 @@
+from Methods.ChebyshevHalleyMethod import ChebyshevHalleyMethod
+
+
+class HalleyMethod(ChebyshevHalleyMethod):
+    """
+    Метод Галлея (метод Хаусхолдера второго порядка):
+    x_(n+1) = x_n - 2 f f' / (2 f'² - f f'').
+    """
+
+    ALPHA = 0.5
@@ -0,0 +1,127 @@
+from Methods.CachedFunction import cached
+from Methods.FunctionPlotter import FunctionPlotter
+from SolveResult import IterationHistory, SolveResult
+
+
+class HybridMethod:
+    """
+    Гибридный метод с гарантированной сходимостью (в духе Деккера-Брента):
+    шаг Ньютона, если он остается внутри отрезка локализации и быстро его
+    сокращает, иначе шаг хорд, иначе деление отрезка пополам.
+    """
+
+    def __init__(self, f, f_prime, f_prime2, a, b, epsilon, max_iter=100, plotter=None, cache_size=None,
+                 f_f_prime=None, instrument=None, history=False):
+        """
+        f        : функция f(x)
+        f_prime  : первая производная f'(x)
+        f_prime2 : вторая производная f''(x) (для выбора начального приближения)
+        a, b     : границы интервала [a, b]
+        epsilon  : требуемая точность
+        max_iter : максимальное число итераций
+        plotter  : объект для построения графика (None - без графика)
+        cache_size: размер кэша значений f, f' и f'' (None - без кэша)
+        f_f_prime: необязательная функция x -> (f(x), f'(x)) за один проход
+        instrument: объект Instrumentation.Instrument для сбора статистики (None - без нее)
+        history  : сохранять ли историю итераций (IterationHistory) в self.history
+        """
+        if a > b:
+            a, b = b, a
+
+        self.iterations = None
+        self.f = cached(f, cache_size) if cache_size else f
+        self.f_prime = cached(f_prime, cache_size) if cache_size else f_prime
+        self.f_prime2 = cached(f_prime2, cache_size) if cache_size else f_prime2
+        self.f_f_prime = f_f_prime
+        self.a = a
+        self.b = b
+        self.epsilon = epsilon
+        self.max_iter = max_iter
+        self.plotter = plotter
+        self.root = None
+        self.error = None
+        self.keep_history = history
+        self.history = None
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ("f", "f_prime", "f_prime2", "f_f_prime"))
+
+    def choose_initial(self, f_a, f_b):
+        """Выбор начального приближения f(x)*f''(x) > 0, иначе середина отрезка"""
+        if f_a * self.f_prime2(self.a) > 0:
+            return self.a, f_a
+        if f_b * self.f_prime2(self.b) > 0:
+            return self.b, f_b
+        x = (self.a + self.b) / 2
+        return x, self.f(x)
+
+    def solve(self):
+        """Основной метод класса"""
+        if self.plotter is not None:
+            self.plot_function()
+
+        a, b = self.a, self.b
+        history = self.history = IterationHistory(self.max_iter) if self.keep_history else None
+        f_a, f_b = self.f(a), self.f(b)
+        if f_a * f_b > 0:
+            raise ValueError("На интервале нет корня или их несколько.")
+        for x, f_x in ((a, f_a), (b, f_b)):
+            if f_x == 0:
+                self.root, self.iterations, self.error = x, 0, f_x
+                return SolveResult(x, f_x, 0, history)
+
+        x, f_x = self.choose_initial(f_a, f_b)
+        # Длины двух предыдущих шагов: быстрый шаг принимается, только если он
+        # хотя бы вдвое короче позапрошлого, что гарантирует сходимость
+        steps = [b - a, b - a]
+        f_prime_next = None
+        for i in range(1, self.max_iter + 1):
+            if f_x == 0:
+                if history is not None:
+                    history.record(x, f_x, 0.0, 0.0)
+                self.root, self.iterations, self.error = x, i, f_x
+                return SolveResult(x, f_x, i, history)
+
+            # Сужение отрезка локализации текущим приближением
+            if a < x < b:
+                if f_x * f_a < 0:
+                    b, f_b = x, f_x
+                else:
+                    a, f_a = x, f_x
+
+            # Шаг Ньютона, затем шаг хорд, затем деление пополам
+            bisection = False
+            f_prime_x = f_prime_next if f_prime_next is not None else self.f_prime(x)
+            x_new = x - f_x / f_prime_x if f_prime_x != 0 else None
+            if x_new is None or not a < x_new < b or abs(x_new - x) >= steps[0] / 2:
+                x_new = a - (b - a) / (f_b - f_a) * f_a
+                if not a < x_new < b or abs(x_new - x) >= steps[0] / 2:
+                    x_new = (a + b) / 2
+                    bisection = True
+            steps = [steps[1], abs(x_new - x)]
+            if history is not None:
+                history.record(x, f_x, x_new - x, b - a if bisection else abs(x_new - x))
+            if self.instrument is not None:
+                self.instrument.iteration(i, x_new, abs(x_new - x))
+
+            if (not bisection and abs(x_new - x) < self.epsilon) or b - a < self.epsilon:
+                self.root = x_new
+                self.iterations = i
+                self.error = self.f(self.root)
+                return SolveResult(x_new, self.error, i, history)
+            if self.f_f_prime is not None:
+                x, (f_x, f_prime_next) = x_new, self.f_f_prime(x_new)
+            else:
+                x, f_x = x_new, self.f(x_new)
+
+        raise Exception("Гибридный метод не сошелся за заданное число итераций.")
+
+    def plot_function(self, num_points=None):
+        """
+        Построение графика функции на интервале [a, b].
+        Если плоттер не задан, используется FunctionPlotter по умолчанию.
+
+        :param num_points: Количество точек для построения графика.
+        """
+        plotter = self.plotter if self.plotter is not None else FunctionPlotter()
+        return plotter.plot(self.f, self.a, self.b, num_points)
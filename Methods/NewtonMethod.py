@@ -1,21 +1,36 @@
-import matplotlib.pyplot as plt
-import numpy as np
+from LazyImport import lazy_import
+from Methods.CachedFunction import cached
+from Methods.FunctionPlotter import FunctionPlotter
+from SolveResult import IterationHistory, SolveResult
+
+np = lazy_import("numpy")
 
 
 class NewtonMethod:
     """Метод Ньютона"""
 
-    def __init__(self, f, f_prime, f_prime2, a, b, epsilon, max_iter=100):
+    def __init__(self, f, f_prime, f_prime2, a, b, epsilon, max_iter=100, plotter=None, cache_size=None,
+                 f_f_prime=None, instrument=None, history=False):
         self.iterations = None
-        self.f = f
-        self.f_prime = f_prime
+        self.f = cached(f, cache_size) if cache_size else f
+        self.f_prime = cached(f_prime, cache_size) if cache_size else f_prime
         self.a = a
         self.b = b
         self.epsilon = epsilon
         self.max_iter = max_iter
-        self.f_prime2 = f_prime2
+        self.f_prime2 = cached(f_prime2, cache_size) if cache_size else f_prime2
+        # Необязательная функция x -> (f(x), f'(x)) за один проход f
+        self.f_f_prime = f_f_prime
+        self.plotter = plotter
         self.root = None
         self.error = None
+        # Сохранять ли историю итераций (IterationHistory) последнего решения
+        self.keep_history = history
+        self.history = None
+        # Необязательный Instrumentation.Instrument для сбора статистики
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ("f", "f_prime", "f_prime2", "f_f_prime"))
 
     def check_convergence_condition(self):
         """Проверка условия сходимости"""
@@ -31,43 +46,85 @@ class NewtonMethod:
 
     def solve(self):
         """Основной метод класса"""
-        self.plot_function()
+        if self.plotter is not None:
+            self.plot_function()
         self.check_convergence_condition()
 
         x_i = self.choose_initial()
+        history = self.history = IterationHistory(self.max_iter) if self.keep_history else None
         for i in range(1, self.max_iter + 1):
-            f_x = self.f(x_i)
-            f_prime_x = self.f_prime(x_i)
+            if self.f_f_prime is not None:
+                f_x, f_prime_x = self.f_f_prime(x_i)
+            else:
+                f_x = self.f(x_i)
+                f_prime_x = self.f_prime(x_i)
             if f_prime_x == 0:
                 raise ZeroDivisionError(f"Производная равна нулю в точке x = {x_i}")
             x_new = x_i - f_x / f_prime_x
+            if history is not None:
+                history.record(x_i, f_x, x_new - x_i, abs(x_new - x_i))
+            if self.instrument is not None:
+                self.instrument.iteration(i, x_new, abs(x_new - x_i))
             if abs(x_new - x_i) < self.epsilon:
                 self.root = x_new
                 self.iterations = i
                 self.error = self.f(self.root)
-                return x_new, self.error, i
+                return SolveResult(x_new, self.error, i, history)
             x_i = x_new
         raise Exception("Метод Ньютона не сошелся за заданное число итераций.")
 
-    def plot_function(self, num_points=100):
+    @classmethod
+    def solve_batch(cls, f, f_prime, f_prime2, a, b, epsilon, max_iter=100):
+        """
+        Пакетное нахождение корней методом Ньютона на массивах интервалов.
+
+        f, f_prime, f_prime2 : векторизованные f(x), f'(x), f''(x)
+        a, b                 : массивы границ интервалов
+        epsilon              : точность (число или массив по каждому интервалу)
+
+        :return: Кортеж массивов (roots, func_values, iterations).
+                 Для неверных интервалов, нулевой производной и несошедшихся
+                 интервалов root и func_value равны NaN.
+        """
+        a, b, epsilon = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                            np.asarray(b, dtype=float),
+                                            np.asarray(epsilon, dtype=float))
+
+        roots = np.full(a.shape, np.nan)
+        values = np.full(a.shape, np.nan)
+        iterations = np.zeros(a.shape, dtype=int)
+
+        f_a = f(a)
+        active = np.flatnonzero(f_a * f(b) < 0)
+        # Начальное приближение: f(x)*f''(x) > 0
+        x_i = np.where(f_a * f_prime2(a) > 0, a, b)[active]
+        epsilon = epsilon[active]
+
+        for i in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            f_prime_x = f_prime(x_i)
+            nonzero = f_prime_x != 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x_new = x_i - f(x_i) / f_prime_x
+
+            done = nonzero & (np.abs(x_new - x_i) < epsilon)
+            roots[active[done]] = x_new[done]
+            iterations[active] = i
+
+            keep = nonzero & ~done & np.isfinite(x_new)
+            active, x_i, epsilon = active[keep], x_new[keep], epsilon[keep]
+
+        converged = ~np.isnan(roots)
+        values[converged] = f(roots[converged])
+        return roots, values, iterations
+
+    def plot_function(self, num_points=None):
         """
         Построение графика функции на интервале [a, b].
+        Если плоттер не задан, используется FunctionPlotter по умолчанию.
 
         :param num_points: Количество точек для построения графика.
         """
-        if not isinstance(num_points, int) or num_points <= 0:
-            raise ValueError("num_points должен быть положительным целым числом.")
-
-        x_vals = np.linspace(self.a, self.b, num_points)
-        y_vals = [self.f(x) for x in x_vals]
-
-        plt.figure(figsize=(8, 6))
-        plt.plot(x_vals, y_vals, label="f(x)")
-        plt.axhline(0, color='black', linewidth=0.5, linestyle='--')
-        plt.axvline(0, color='black', linewidth=0.5, linestyle='--')
-        plt.title("График функции")
-        plt.xlabel("x")
-        plt.ylabel("f(x)")
-        plt.grid(True)
-        plt.legend()
-        plt.show()
+        plotter = self.plotter if self.plotter is not None else FunctionPlotter()
+        return plotter.plot(self.f, self.a, self.b, num_points)
@@ -0,0 +1,115 @@
+from LazyImport import lazy_import
+from Methods.FunctionPlotter import FunctionPlotter
+from SolveResult import SolveResult
+
+np = lazy_import("numpy")
+
+
+class PolynomialMethod:
+    """
+    Нахождение корней многочлена (Polynomial) без итераций по отрезку:
+    число корней на [a, b] определяется системой Штурма, сами корни -
+    собственные значения матрицы компаньона, уточненные методом Ньютона.
+    """
+
+    def __init__(self, polynomial, a, b, epsilon, max_iter=100, plotter=None, instrument=None):
+        """
+        polynomial: многочлен Polynomial
+        a, b      : границы интервала [a, b]
+        epsilon   : требуемая точность уточнения корней
+        max_iter  : максимальное число итераций метода Ньютона для одного корня
+        plotter   : объект для построения графика (None - без графика)
+        instrument: объект Instrumentation.Instrument для сбора статистики (None - без нее)
+        """
+        if a > b:
+            a, b = b, a
+
+        self.polynomial = polynomial
+        self.a = a
+        self.b = b
+        self.epsilon = epsilon
+        self.max_iter = max_iter
+        self.plotter = plotter
+        self.roots = None
+        self.root = None
+        self.iterations = None
+        self.error = None
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ())
+
+    def count_roots(self):
+        """Число различных вещественных корней на [a, b] по системе Штурма"""
+        return self.polynomial.count_roots(self.a, self.b)
+
+    def solve_all(self):
+        """
+        Все различные вещественные корни на [a, b].
+
+        :return: Список SolveResult (root, func_value, iterations), отсортированный
+                 по root; iterations - число итераций уточнения корня.
+        """
+        if self.plotter is not None:
+            self.plot_function()
+
+        found = self.polynomial.real_roots(self.a, self.b, self.epsilon, self.max_iter)
+        self.roots = []
+        for i, (root, iterations) in enumerate(found, 1):
+            if self.instrument is not None:
+                self.instrument.iteration(i, root, abs(self.polynomial(root)))
+            self.roots.append(SolveResult(root, self.polynomial(root), iterations))
+        return self.roots
+
+    def solve(self):
+        """Единственный корень на [a, b] в формате остальных методов"""
+        roots = self.solve_all()
+        if len(roots) != 1:
+            count = len(roots)
+            raise ValueError("На интервале нет корня." if count == 0 else
+                             f"На интервале несколько корней ({count}), все корни возвращает solve_all().")
+        self.root, self.error, self.iterations = roots[0]
+        return roots[0]
+
+    @classmethod
+    def solve_batch(cls, polynomial, a, b, epsilon, max_iter=100):
+        """
+        Пакетное нахождение корней многочлена на массивах интервалов.
+        Все корни находятся один раз и распределяются по интервалам.
+
+        :return: Кортеж массивов (roots, func_values, iterations). Для
+                 интервалов без корня или с несколькими корнями root и
+                 func_value равны NaN.
+        """
+        a, b, epsilon = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                            np.asarray(b, dtype=float),
+                                            np.asarray(epsilon, dtype=float))
+        left, right = np.minimum(a, b), np.maximum(a, b)
+
+        tolerance = float(np.min(epsilon)) if epsilon.size else 1e-14
+        found = polynomial.real_roots(epsilon=tolerance, max_iter=max_iter)
+        all_roots = np.array([root for root, _ in found])
+        all_iterations = np.array([i for _, i in found], dtype=int)
+
+        roots = np.full(a.shape, np.nan)
+        iterations = np.zeros(a.shape, dtype=int)
+        if all_roots.size:
+            inside = (all_roots >= left[..., None]) & (all_roots <= right[..., None])
+            single = inside.sum(axis=-1) == 1
+            index = np.argmax(inside, axis=-1)
+            roots[single] = all_roots[index[single]]
+            iterations[single] = all_iterations[index[single]]
+
+        values = np.full(a.shape, np.nan)
+        converged = ~np.isnan(roots)
+        values[converged] = polynomial(roots[converged])
+        return roots, values, iterations
+
+    def plot_function(self, num_points=None):
+        """
+        Построение графика функции на интервале [a, b].
+        Если плоттер не задан, используется FunctionPlotter по умолчанию.
+
+        :param num_points: Количество точек для построения графика.
+        """
+        plotter = self.plotter if self.plotter is not None else FunctionPlotter()
+        return plotter.plot(self.polynomial, self.a, self.b, num_points)
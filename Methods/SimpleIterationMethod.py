@@ -1,27 +1,141 @@
-import numpy as np
-import matplotlib.pyplot as plt
+import functools
+import math
+
+from LazyImport import lazy_import
+from Methods.CachedFunction import cached
+from Methods.FunctionPlotter import FunctionPlotter
+from SolveResult import IterationHistory, SolveResult
+
+np = lazy_import("numpy")
+
+
+def _abs_values(func, x):
+    """|func(x)| на массиве x; NaN, бесконечности и ошибки вычисления дают inf"""
+    with np.errstate(all='ignore'):
+        try:
+            y = np.asarray(func(x), dtype=float)
+            if y.shape != x.shape:
+                raise ValueError
+        except (TypeError, ValueError, ArithmeticError):
+            # Функция не векторизована: вычисление по точкам
+            y = np.array([_point_value(func, t) for t in x])
+        y = np.abs(y)
+    y[~np.isfinite(y)] = np.inf
+    return y
+
+
+def _point_value(func, t):
+    try:
+        return float(func(float(t)))
+    except (TypeError, ValueError, ArithmeticError):
+        return math.inf
+
+
+@functools.lru_cache(maxsize=256)
+def max_abs_on_interval(func, a, b, num_points=65, candidates=3, refine_steps=4):
+    """
+    Оценка max|func(x)| на [a, b].
+
+    Значения вычисляются на равномерной сетке, затем вокруг candidates
+    наибольших узлов строятся сгущающиеся сетки (каждая в 4 раза мельче),
+    что находит узкие пики, пропускаемые редкой сеткой. Результат
+    кэшируется для (func, a, b).
+    """
+    x = np.linspace(a, b, num_points)
+    y = _abs_values(func, x)
+    best = y.max()
+    if best == math.inf:
+        return best
+
+    width = (b - a) / (num_points - 1)
+    for center in x[np.argsort(y)[-candidates:]]:
+        step = width
+        for _ in range(refine_steps):
+            local = np.linspace(max(a, center - step), min(b, center + step), 9)
+            values = _abs_values(func, local)
+            k = values.argmax()
+            best = max(best, values[k])
+            center = local[k]
+            step /= 4
+    return float(best)
 
 
 class SimpleIterationMethod:
-    """Метод простой итерации"""
-    def __init__(self, f, phi, phi_prime, a, b, epsilon, max_iter=100):
+    """
+    Метод простой итерации.
+
+    Параметр acceleration задает ускорение сходимости:
+    None        - обычная итерация x_(n+1) = phi(x_n);
+    "aitken"    - Δ²-процесс Эйткена над последовательностью phi (одно
+                  вычисление phi на итерацию, сходимость быстрее линейной);
+    "steffensen"- метод Стеффенсена (два вычисления phi на итерацию,
+                  квадратичная сходимость);
+    "anderson"  - смешивание Андерсона по memory последним итерациям.
+    """
+
+    ACCELERATIONS = (None, "aitken", "steffensen", "anderson")
+
+    def __init__(self, f, phi, phi_prime, a, b, epsilon, max_iter=100, plotter=None, cache_size=None,
+                 instrument=None, phi_prime_vec=None, acceleration=None, memory=3, history=False):
+        if acceleration not in self.ACCELERATIONS:
+            raise ValueError(f"Неизвестный способ ускорения: {acceleration}")
+        if not isinstance(memory, int) or memory <= 0:
+            raise ValueError("memory должен быть положительным целым числом")
+
         self.iterations = None
-        self.f = f
-        self.phi = phi
-        self.phi_prime = phi_prime
+        self.f = cached(f, cache_size) if cache_size else f
+        self.phi = cached(phi, cache_size) if cache_size else phi
+        self.phi_prime = cached(phi_prime, cache_size) if cache_size else phi_prime
+        # Функция для оценки max|phi'(x)|: векторизованная phi'(x), если задана.
+        # Исходная (не обернутая) функция - ключ кэша max_abs_on_interval
+        self.phi_prime_bound = phi_prime_vec if phi_prime_vec is not None else phi_prime
         self.a = a
         self.b = b
         self.epsilon = epsilon
         self.max_iter = max_iter
+        self.plotter = plotter
+        self.acceleration = acceleration
+        self.memory = memory
         self.root = None
         self.error = None
+        # Коэффициент сжатия q = max|phi'(x)|, априорный прогноз числа
+        # итераций и апостериорная оценка погрешности корня
+        self.q = None
+        self.predicted_iterations = None
+        self.error_bound = None
+        self.phi_evaluations = 0
+        # Сохранять ли историю итераций (IterationHistory) последнего решения.
+        # Сам метод f не вычисляет, поэтому для истории f(x_k) вычисляется
+        # дополнительно (одно вычисление f на итерацию)
+        self.keep_history = history
+        self.history = None
+        # Необязательный Instrumentation.Instrument для сбора статистики
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ("f", "phi", "phi_prime"))
 
     def check_convergence_condition(self):
-        """Проверка достаточного условия сходимости"""
-        line = np.linspace(self.a, self.b, 100)
-        maxi = max(abs(self.phi_prime(x)) for x in line)
-        if maxi >= 1:
-            raise Exception(f"Достаточное условие сходимости не выполнено: max|phi'(x)| = {maxi:.4f} >= 1")
+        """
+        Проверка достаточного условия сходимости max|phi'(x)| < 1.
+
+        :return: Коэффициент сжатия q = max|phi'(x)| на [a, b].
+        """
+        a, b = sorted((float(self.a), float(self.b)))
+        self.q = max_abs_on_interval(self.phi_prime_bound, a, b)
+        if self.q >= 1:
+            raise Exception(f"Достаточное условие сходимости не выполнено: max|phi'(x)| = {self.q:.4f} >= 1")
+        return self.q
+
+    def predict_iterations(self, first_step):
+        """
+        Априорная оценка числа итераций по первому шагу |x_1 - x_0|:
+        наименьшее n, при котором q^n / (1 - q) * |x_1 - x_0| < epsilon.
+        """
+        q = self.q
+        if q == 0 or first_step == 0:
+            return 1
+        n = math.log(self.epsilon * (1 - q) / first_step) / math.log(q)
+        return max(1, math.ceil(n))
 
     def choose_initial(self):
         """Выбор начального приближения"""
@@ -46,39 +160,176 @@ class SimpleIterationMethod:
 
     def solve(self):
         """Основной метод класса"""
-        self.plot_function()
+        if self.plotter is not None:
+            self.plot_function()
         self.check_convergence_condition()
         self.verify_interval()
-        x_i = self.choose_initial()
+        iterate = {
+            None: self.iterate,
+            "aitken": self.iterate_aitken,
+            "steffensen": self.iterate_steffensen,
+            "anderson": self.iterate_anderson
+        }[self.acceleration]
+
+        self.phi_evaluations = 0
+        self.history = IterationHistory(self.max_iter) if self.keep_history else None
+        result = iterate(self.choose_initial())
+        if result is None:
+            raise Exception("Метод простой итерации не сошелся за заданное число итераций.")
+        self.root, self.iterations, self.error_bound = result
+        self.error = self.f(self.root)
+        return SolveResult(self.root, self.error, self.iterations, self.history)
+
+    def evaluate_phi(self, x):
+        self.phi_evaluations += 1
+        value = self.phi(x)
+        if isinstance(value, complex) or not math.isfinite(value):
+            raise Exception(f"phi(x) не является конечным вещественным числом в точке x = {x}: {value}")
+        return value
+
+    def report(self, i, x, x_new, estimate):
+        """
+        Запись перехода x -> x_new в историю и передача итерации в instrument;
+        True, если достигнута точность.
+        """
+        if self.history is not None:
+            self.history.record(x, self.f(x), x_new - x, estimate)
+        if self.instrument is not None:
+            self.instrument.iteration(i, x_new, estimate)
+        return estimate < self.epsilon
+
+    def iterate(self, x_i):
+        """
+        Обычная итерация с остановкой по апостериорной оценке
+        |x_n - x*| <= q / (1 - q) * |x_n - x_(n-1)|.
+
+        :return: Кортеж (root, iterations, estimate) или None, если метод не сошелся.
+        """
+        factor = self.q / (1 - self.q)
+        for i in range(1, self.max_iter + 1):
+            x_new = self.evaluate_phi(x_i)
+            bound = factor * abs(x_new - x_i)
+            if i == 1:
+                self.predicted_iterations = self.predict_iterations(abs(x_new - x_i))
+            if self.report(i, x_i, x_new, bound):
+                return x_new, i, bound
+            x_i = x_new
+        return None
+
+    def iterate_aitken(self, x_0):
+        """
+        Δ²-процесс Эйткена: последовательность x_(n+1) = phi(x_n) не меняется,
+        по трем последним ее членам строится ускоренное приближение
+        x_n - (x_(n+1) - x_n)² / (x_(n+2) - 2x_(n+1) + x_n).
+        """
+        x_1 = self.evaluate_phi(x_0)
+        previous = x_0
+        for i in range(1, self.max_iter + 1):
+            x_2 = self.evaluate_phi(x_1)
+            denominator = x_2 - 2 * x_1 + x_0
+            accelerated = x_2 - (x_2 - x_1) ** 2 / denominator if denominator != 0 else x_2
+            step = abs(accelerated - previous)
+            if self.report(i, previous, accelerated, step):
+                return accelerated, i, step
+            x_0, x_1, previous = x_1, x_2, accelerated
+        return None
+
+    def iterate_steffensen(self, x_i):
+        """Метод Стеффенсена: Δ²-процесс, перезапускаемый из ускоренного приближения"""
         for i in range(1, self.max_iter + 1):
-            x_new = self.phi(x_i)
-            if abs(x_new - x_i) < self.epsilon:
-                self.root = x_new
-                self.iterations = i
-                self.error = self.f(self.root)
-                return x_new, self.error, i
+            y = self.evaluate_phi(x_i)
+            z = self.evaluate_phi(y)
+            denominator = z - 2 * y + x_i
+            x_new = x_i - (y - x_i) ** 2 / denominator if denominator != 0 else z
+            step = abs(x_new - x_i)
+            if self.report(i, x_i, x_new, step):
+                return x_new, i, step
             x_i = x_new
-        raise Exception("Метод простой итерации не сошелся за заданное число итераций.")
+        return None
+
+    def iterate_anderson(self, x_i):
+        """
+        Смешивание Андерсона: следующее приближение - комбинация phi(x) по
+        memory + 1 последним итерациям с коэффициентами, минимизирующими
+        невязку phi(x) - x (метод наименьших квадратов).
+        """
+        xs, residuals = [], []
+        for i in range(1, self.max_iter + 1):
+            phi_x = self.evaluate_phi(x_i)
+            xs.append(x_i)
+            residuals.append(phi_x - x_i)
+            if len(xs) > self.memory + 1:
+                del xs[0], residuals[0]
+
+            x_new = phi_x
+            if len(xs) > 1:
+                d_residuals = np.diff(residuals)
+                if np.any(d_residuals != 0):
+                    gamma = np.linalg.lstsq(d_residuals[None, :], [residuals[-1]], rcond=None)[0]
+                    x_new = phi_x - (np.diff(xs) + d_residuals) @ gamma
+
+            step = abs(x_new - x_i)
+            if self.report(i, x_i, x_new, step):
+                return float(x_new), i, step
+            x_i = x_new
+        return None
+
+    @classmethod
+    def solve_batch(cls, f, phi, phi_prime, a, b, epsilon, max_iter=100, num_points=100):
+        """
+        Пакетное нахождение корней методом простой итерации на массивах интервалов.
+
+        f, phi, phi_prime : векторизованные f(x), phi(x), phi'(x)
+        a, b              : массивы границ интервалов
+        epsilon           : точность (число или массив по каждому интервалу)
+        num_points        : число точек для проверки условия сходимости
+
+        :return: Кортеж массивов (roots, func_values, iterations).
+                 Для интервалов, где не выполнено условие сходимости или нет
+                 смены знака, и для несошедшихся интервалов root и func_value
+                 равны NaN. Итерации останавливаются по апостериорной оценке
+                 q / (1 - q) * |x_(n+1) - x_n| < epsilon, где q - max|phi'(x)|.
+        """
+        a, b, epsilon = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                            np.asarray(b, dtype=float),
+                                            np.asarray(epsilon, dtype=float))
+
+        roots = np.full(a.shape, np.nan)
+        values = np.full(a.shape, np.nan)
+        iterations = np.zeros(a.shape, dtype=int)
+
+        # Достаточное условие сходимости max|phi'(x)| < 1 на каждом интервале
+        maxi = np.zeros(a.shape)
+        for t in np.linspace(0, 1, num_points):
+            maxi = np.fmax(maxi, np.abs(phi_prime(a + t * (b - a))))
+
+        active = np.flatnonzero((maxi < 1) & (f(a) * f(b) <= 0))
+        x_i = ((a + b) / 2)[active]
+        epsilon = epsilon[active]
+        factor = maxi[active] / (1 - maxi[active])
+
+        for i in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            x_new = phi(x_i)
+
+            done = factor * np.abs(x_new - x_i) < epsilon
+            roots[active[done]] = x_new[done]
+            iterations[active] = i
+
+            keep = ~done & np.isfinite(x_new)
+            active, x_i, epsilon, factor = active[keep], x_new[keep], epsilon[keep], factor[keep]
+
+        converged = ~np.isnan(roots)
+        values[converged] = f(roots[converged])
+        return roots, values, iterations
 
-    def plot_function(self, num_points=100):
+    def plot_function(self, num_points=None):
         """
         Построение графика функции на интервале [a, b].
+        Если плоттер не задан, используется FunctionPlotter по умолчанию.
 
         :param num_points: Количество точек для построения графика.
         """
-        if not isinstance(num_points, int) or num_points <= 0:
-            raise ValueError("num_points должен быть положительным целым числом.")
-
-        x_vals = np.linspace(self.a, self.b, num_points)
-        y_vals = [self.f(x) for x in x_vals]
-
-        plt.figure(figsize=(8, 6))
-        plt.plot(x_vals, y_vals, label="f(x)")
-        plt.axhline(0, color='black', linewidth=0.5, linestyle='--')
-        plt.axvline(0, color='black', linewidth=0.5, linestyle='--')
-        plt.title("График функции")
-        plt.xlabel("x")
-        plt.ylabel("f(x)")
-        plt.grid(True)
-        plt.legend()
-        plt.show()
\ No newline at end of file
+        plotter = self.plotter if self.plotter is not None else FunctionPlotter()
+        return plotter.plot(self.f, self.a, self.b, num_points)
\ No newline at end of file
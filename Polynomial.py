@@ -0,0 +1,215 @@
+import math
+
+from LazyImport import lazy_import
+
+np = lazy_import("numpy")
+
+
+class Polynomial:
+    """
+    Многочлен c_0 x^n + c_1 x^(n-1) + ... + c_n (коэффициенты от старшего).
+
+    Вычисляется по схеме Горнера: аргумент может быть числом, массивом
+    NumPy (вычисление по всем точкам сразу) или дуальным числом AutoDiff.
+    Число вещественных корней на отрезке определяется по системе Штурма,
+    все вещественные корни находятся как собственные значения матрицы
+    компаньона, уточненные методом Ньютона.
+    """
+
+    def __init__(self, coefficients):
+        try:
+            values = [float(c) for c in coefficients]
+        except TypeError:
+            values = [float(coefficients)]
+        while len(values) > 1 and values[0] == 0:
+            del values[0]
+        # Коэффициенты как числа Python: схема Горнера для скаляров быстрее,
+        # массив NumPy создается только при необходимости
+        self._coefficients = values or [0.0]
+        self._array = None
+        self._sturm = None
+        self._square_free = None
+
+    @property
+    def coefficients(self):
+        """Коэффициенты в виде массива NumPy"""
+        if self._array is None:
+            self._array = np.array(self._coefficients)
+        return self._array
+
+    @property
+    def degree(self):
+        return len(self._coefficients) - 1
+
+    def require_nonzero(self):
+        """Корни нулевого многочлена не определены: корнем является любое число"""
+        if self._coefficients == [0.0]:
+            raise ValueError("Нулевой многочлен: корнем является любое число.")
+
+    def derived(self, coefficients):
+        """
+        Многочлен, построенный из этого (производная, члены системы Штурма,
+        p / НОД(p, p')); подклассы переопределяют его, чтобы построенные
+        многочлены были того же подкласса.
+        """
+        return Polynomial(coefficients)
+
+    def __call__(self, x):
+        result = self._coefficients[0]
+        for c in self._coefficients[1:]:
+            result = result * x + c
+        return result
+
+    def value_and_derivative(self, x):
+        """(p(x), p'(x)) по схеме Горнера за один проход"""
+        p, dp = self._coefficients[0], 0.0
+        for c in self._coefficients[1:]:
+            dp = dp * x + p
+            p = p * x + c
+        return p, dp
+
+    def taylor2(self, x):
+        """(p(x), p'(x), p''(x)) по схеме Горнера за один проход"""
+        p, dp, d2p = self._coefficients[0], 0.0, 0.0
+        for c in self._coefficients[1:]:
+            d2p = d2p * x + 2 * dp
+            dp = dp * x + p
+            p = p * x + c
+        return p, dp, d2p
+
+    def derivative(self):
+        n = self.degree
+        if n == 0:
+            return self.derived([0.0])
+        return self.derived(self.coefficients[:-1] * np.arange(n, 0, -1))
+
+    def __str__(self):
+        terms = []
+        for power, c in zip(range(self.degree, -1, -1), self._coefficients):
+            if c == 0 and self.degree > 0:
+                continue
+            magnitude = abs(c)
+            text = f"{magnitude:g}" if magnitude != 1 or power == 0 else ""
+            if power > 0:
+                text += "x" if power == 1 else f"x^{power}"
+            sign = "-" if c < 0 else "+"
+            terms.append((sign, text))
+        first_sign, first = terms[0]
+        return ("-" if first_sign == "-" else "") + first + "".join(f" {s} {t}" for s, t in terms[1:])
+
+    def __repr__(self):
+        return f"Polynomial({self._coefficients})"
+
+    def sturm_sequence(self):
+        """
+        Система Штурма: p_0 = p, p_1 = p', p_(k+1) = -остаток(p_(k-1) / p_k).
+        Последний член - НОД p и p' (с точностью до множителя).
+        """
+        if self._sturm is None:
+            self.require_nonzero()
+            # Члены нормируются на max|c| (положительный множитель не меняет знаков)
+            sequence = [c / np.max(np.abs(c)) for c in (self.coefficients, self.derivative().coefficients)
+                        if np.any(c)]
+            while len(sequence) > 1 and len(sequence[-1]) > 1:
+                remainder = -np.polydiv(sequence[-2], sequence[-1])[1]
+                # Отбрасывание коэффициентов, ставших нулем из-за округления
+                remainder[np.abs(remainder) <= 1e-12] = 0.0
+                remainder = np.trim_zeros(remainder, 'f')
+                if remainder.size == 0:
+                    break
+                sequence.append(remainder / np.max(np.abs(remainder)))
+            self._sturm = [self.derived(c) for c in sequence]
+        return self._sturm
+
+    def sign_changes(self, x):
+        """Число перемен знака в системе Штурма в точке x"""
+        values = [v for v in (p(x) for p in self.sturm_sequence()) if v != 0]
+        return sum(1 for u, v in zip(values, values[1:]) if u * v < 0)
+
+    def count_roots(self, a, b):
+        """Число различных вещественных корней на [a, b]"""
+        if a > b:
+            a, b = b, a
+        count = self.sign_changes(a) - self.sign_changes(b)
+        return count + 1 if self(a) == 0 else count
+
+    def root_bound(self):
+        """Граница Коши: все корни лежат в круге |x| <= root_bound()"""
+        self.require_nonzero()
+        return 1 + max((abs(c) for c in self._coefficients[1:]), default=0.0) / abs(self._coefficients[0])
+
+    def square_free(self):
+        """Многочлен с теми же корнями, но простыми: p / НОД(p, p')"""
+        if self._square_free is None:
+            gcd = self.sturm_sequence()[-1]
+            self._square_free = self
+            if gcd.degree > 0:
+                quotient, remainder = np.polydiv(self.coefficients, gcd.coefficients)
+                # НОД, искаженный округлением, не делит p - тогда p не меняется
+                if np.max(np.abs(remainder)) <= 1e-8 * np.max(np.abs(self.coefficients)):
+                    self._square_free = self.derived(quotient)
+        return self._square_free
+
+    def companion_eigenvalues(self):
+        """Собственные значения матрицы компаньона - все (комплексные) корни"""
+        n = self.degree
+        if n < 1:
+            return np.empty(0, dtype=complex)
+        companion = np.zeros((n, n))
+        companion[0] = -self.coefficients[1:] / self.coefficients[0]
+        companion[1:, :-1] = np.eye(n - 1)
+        return np.linalg.eigvals(companion)
+
+    def polish(self, x, epsilon=1e-14, max_iter=50):
+        """
+        Уточнение корня методом Ньютона для p / НОД(p, p') (кратные корни
+        становятся простыми, сходимость остается квадратичной).
+
+        :return: Кортеж (root, iterations).
+        """
+        p = self.square_free()
+        previous = math.inf
+        for i in range(1, max_iter + 1):
+            value, derivative = p.value_and_derivative(x)
+            if derivative == 0:
+                return x, i
+            step = value / derivative
+            if abs(step) >= previous:
+                # Шаг перестал уменьшаться: достигнут уровень ошибок округления
+                return x, i
+            x -= step
+            if abs(step) <= epsilon * max(1.0, abs(x)):
+                return x, i
+            previous = abs(step)
+        return x, max_iter
+
+    def real_roots(self, a=None, b=None, epsilon=1e-14, max_iter=50):
+        """
+        Все различные вещественные корни на [a, b] (по умолчанию - на всей оси).
+
+        Из собственных значений матрицы компаньона берутся ближайшие к
+        вещественной оси: не меньше, чем корней насчитала система Штурма, и
+        все с малой мнимой частью (на случай, если округление исказило
+        систему Штурма). Их вещественные части уточняются методом Ньютона.
+
+        :return: Список кортежей (root, iterations), отсортированный по root.
+        """
+        bound = self.root_bound()
+        count = self.count_roots(-bound, bound)
+        eigenvalues = self.companion_eigenvalues()
+        eigenvalues = eigenvalues[np.argsort(np.abs(eigenvalues.imag))]
+
+        roots = []
+        for z in eigenvalues:
+            near_real = abs(z.imag) <= 1e-6 * max(1.0, abs(z))
+            if len(roots) >= count and not near_real:
+                break
+            x, iterations = self.polish(float(z.real), epsilon, max_iter)
+            if math.isfinite(x) and all(abs(x - r) > 1e3 * epsilon * max(1.0, abs(x)) for r, _ in roots):
+                roots.append((x, iterations))
+
+        roots.sort()
+        if a is not None and b is not None:
+            a, b = min(a, b), max(a, b)
+            roots = [(x, i) for x, i in roots if a <= x <= b]
+        return roots
@@ -0,0 +1,173 @@
+"""
+Хранилище результатов решения на диске (SQLite).
+
+Результат (root, value, iterations) хранится для ключа (определение
+уравнения, метод, a, b, epsilon, параметры решателя). Запрос с точностью
+epsilon может быть удовлетворен результатом, полученным с более строгой
+точностью. Определение уравнения - отпечаток его функций (исходный код,
+замыкания, описание), а не номер: номера уравнений, добавленных через
+register_expression и register_polynomial, зависят от порядка регистрации.
+Результаты измененного уравнения просто перестают находиться.
+"""
+import hashlib
+import inspect
+import json
+import math
+import os
+import sqlite3
+
+import MethodService
+
+CACHE_VERSION = 3
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".result_cache.sqlite")
+FINGERPRINT_KEYS = ("f", "f_prime", "f2", "phi", "phi_prime", "polynomial")
+# Параметры решателя, не влияющие на результат (не входят в ключ)
+IGNORED_OPTIONS = ("plotter", "instrument", "history", "cache_size")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    definition TEXT NOT NULL,
+    method INTEGER NOT NULL,
+    a REAL NOT NULL,
+    b REAL NOT NULL,
+    epsilon REAL NOT NULL,
+    options TEXT NOT NULL,
+    root REAL NOT NULL,
+    value REAL NOT NULL,
+    iterations INTEGER NOT NULL,
+    PRIMARY KEY (definition, method, a, b, options, epsilon)
+);
+"""
+
+
+def _fingerprint(func, depth=0):
+    """Текст, меняющийся при изменении определения функции"""
+    code = getattr(func, "__code__", None)
+    if code is None or depth > 3:
+        return repr(func)
+    try:
+        text = inspect.getsource(func)
+    except (OSError, TypeError):
+        # Функция скомпилирована из строки (ExpressionCompiler)
+        text = code.co_code.hex() + repr(code.co_consts) + repr(code.co_names)
+    cells = []
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            continue
+        cells.append(_fingerprint(contents, depth + 1) if callable(contents) else repr(contents))
+    return "|".join([text] + cells)
+
+
+def definition_hash(eq):
+    """Отпечаток определения уравнения eq из FunctionService.equations"""
+    parts = [str(CACHE_VERSION), eq.get("description", "")]
+    parts += [_fingerprint(eq[key]) for key in FINGERPRINT_KEYS if eq.get(key) is not None]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def options_key(options):
+    """Параметры решателя, влияющие на результат, в виде строки ключа"""
+    options = {name: value for name, value in (options or {}).items() if name not in IGNORED_OPTIONS}
+    return json.dumps(options, sort_keys=True, default=repr)
+
+
+def is_real(value):
+    """Конечное вещественное число (не комплексное, не NaN и не бесконечность)"""
+    return isinstance(value, (int, float)) and math.isfinite(value)
+
+
+class ResultCache:
+    """Кэш результатов (root, value, iterations) в базе SQLite"""
+
+    def __init__(self, path=DEFAULT_PATH, commit_every=1):
+        """
+        path        : файл базы (":memory:" - без сохранения на диск)
+        commit_every: число записей между фиксациями транзакции (для пакетной
+                      обработки); оставшиеся записи фиксируются в close()
+        """
+        self.connection = sqlite3.connect(path)
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            # Файл старого формата пересоздается
+            self.connection.executescript("DROP TABLE IF EXISTS equations; DROP TABLE IF EXISTS results;")
+            self.connection.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self.connection.executescript(SCHEMA)
+        self.commit_every = commit_every
+        self.pending = 0
+        self.definitions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def definition(self, eq):
+        """Отпечаток уравнения eq (вычисляется один раз для объекта eq)"""
+        cached = self.definitions.get(id(eq))
+        if cached is not None and cached[0] is eq:
+            return cached[1]
+        definition = definition_hash(eq)
+        self.definitions[id(eq)] = (eq, definition)
+        return definition
+
+    def lookup(self, eq, meth_num, a, b, epsilon, options=None):
+        """
+        Сохраненный результат с точностью не хуже epsilon (из нескольких -
+        с наибольшим epsilon), полученный с теми же параметрами решателя
+        options (см. options_key).
+
+        :return: Кортеж (root, value, iterations) или None.
+        """
+        row = self.connection.execute(
+            "SELECT root, value, iterations FROM results "
+            "WHERE definition = ? AND method = ? AND a = ? AND b = ? AND options = ? AND epsilon <= ? "
+            "ORDER BY epsilon DESC LIMIT 1",
+            (self.definition(eq), meth_num, float(a), float(b), options_key(options),
+             float(epsilon))).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row
+
+    def store(self, eq, meth_num, a, b, epsilon, result, options=None):
+        """
+        Сохранение результата. Результаты с комплексным или неконечным
+        корнем или значением не сохраняются.
+
+        :return: True, если результат сохранен.
+        """
+        root, value, iterations = result
+        if not (is_real(root) and is_real(value)):
+            return False
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.definition(eq), meth_num, float(a), float(b), float(epsilon), options_key(options),
+             float(root), float(value), int(iterations)))
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.commit()
+        return True
+
+    def solve(self, eq, meth_num, a, b, epsilon, **kwargs):
+        """
+        Результат из кэша или решение методом meth_num с сохранением результата;
+        kwargs передаются решателю и входят в ключ.
+        """
+        result = self.lookup(eq, meth_num, a, b, epsilon, kwargs)
+        if result is None:
+            result = MethodService.create_solver(meth_num, eq, a, b, epsilon, **kwargs).solve()
+            self.store(eq, meth_num, a, b, epsilon, result, kwargs)
+        return result
+
+    def commit(self):
+        self.connection.commit()
+        self.pending = 0
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
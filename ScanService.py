@@ -0,0 +1,178 @@
+import math
+
+import numpy as np
+
+
+class RootScanner:
+    """Поиск всех корней уравнения на интервале [a, b]"""
+
+    def __init__(self, f, a, b, f_vec=None, num_points=200, max_depth=6, tol=1e-8):
+        """
+        f         : функция f(x)
+        a, b      : границы интервала [a, b]
+        f_vec     : векторизованная f(x) для вычисления на сетке (необязательно)
+        num_points: число отрезков начальной сетки
+        max_depth : максимальная глубина дробления вокруг локальных минимумов |f|
+        tol       : порог |f(x)| для корней без смены знака (кратных корней)
+        """
+        if not isinstance(num_points, int) or num_points <= 0:
+            raise ValueError("num_points должен быть положительным целым числом.")
+
+        if a > b:
+            a, b = b, a
+
+        self.f = f
+        self.f_vec = f_vec
+        self.a = a
+        self.b = b
+        self.num_points = num_points
+        self.max_depth = max_depth
+        self.tol = tol
+        # Шаг самой мелкой сетки дробления (каждый уровень мельче в 4 раза):
+        # корни, отстоящие меньше чем на него, не различаются и объединяются
+        self.resolution = (b - a) / num_points / 4 ** max_depth
+        self.brackets = None
+        self.failures = []
+
+    def evaluate(self, x):
+        """Вычисление f на массиве точек"""
+        if self.f_vec is not None:
+            return np.asarray(self.f_vec(x), dtype=float) * np.ones_like(x)
+        return np.array([self.f(t) for t in x], dtype=float)
+
+    def find_brackets(self):
+        """
+        Поиск отрезков, содержащих корни.
+
+        :return: Отсортированный список пар (left, right). Пара с left == right
+                 означает, что корень найден точно (в том числе корень без
+                 смены знака).
+        """
+        brackets = self.scan(self.a, self.b, self.num_points, 0)
+
+        # Удаление совпадающих (с точностью до resolution) корней, в том числе
+        # на стыках отрезков
+        brackets.sort()
+        tol = self.resolution
+        result = []
+        for left, right in brackets:
+            if result and left == right and result[-1][0] - tol <= left <= result[-1][1] + tol:
+                continue
+            if result and result[-1][0] == result[-1][1] and left - tol <= result[-1][0] <= right + tol:
+                result.pop()
+            result.append((left, right))
+
+        self.brackets = result
+        return result
+
+    def scan(self, a, b, num_points, depth):
+        """Поиск смен знака на сетке и дробление вокруг минимумов |f|"""
+        x = np.linspace(a, b, num_points + 1)
+        y = self.evaluate(x)
+        brackets = [(x[i], x[i]) for i in np.flatnonzero(y == 0)]
+
+        change = np.flatnonzero(y[:-1] * y[1:] < 0)
+        brackets += [(x[i], x[i + 1]) for i in change]
+
+        # Внутренние локальные минимумы |f| без смены знака в соседних отрезках
+        abs_y = np.abs(y)
+        inner = np.arange(1, num_points)
+        minima = inner[(abs_y[inner] <= abs_y[inner - 1]) &
+                       (abs_y[inner] <= abs_y[inner + 1]) &
+                       (y[inner - 1] * y[inner] > 0) &
+                       (y[inner] * y[inner + 1] > 0)]
+
+        # Точные нули, по обе стороны от которых f одного знака, могут скрывать
+        # соседний корень
+        zeros = inner[(y[inner] == 0) & (y[inner - 1] * y[inner + 1] > 0)]
+        if depth < self.max_depth:
+            for i in zeros:
+                brackets += self.scan(x[i - 1], x[i + 1], 8, depth + 1)
+
+        for i in minima:
+            if depth < self.max_depth:
+                brackets += self.scan(x[i - 1], x[i + 1], 8, depth + 1)
+            else:
+                brackets += self.zero_of_minimum(x[i - 1], x[i + 1])
+
+        # Минимумы |f| на концах [a, b] (касание оси в точке a или b или рядом
+        # с ней): дробление их не находит, так как концы отрезка не проверяются
+        if depth == 0:
+            for end, neighbour in ((0, 1), (num_points, num_points - 1)):
+                if y[end] * y[neighbour] > 0 and abs_y[end] <= abs_y[neighbour]:
+                    brackets += self.zero_of_minimum(min(x[end], x[neighbour]), max(x[end], x[neighbour]))
+
+        return brackets
+
+    def zero_of_minimum(self, a, b):
+        """Корень без смены знака на [a, b]: [(x, x)], если min|f| < tol, иначе []"""
+        x_min = self.minimize_abs(a, b)
+        return [(x_min, x_min)] if abs(self.f(x_min)) < self.tol else []
+
+    def minimize_abs(self, a, b, iterations=60):
+        """Поиск минимума |f| на [a, b] методом золотого сечения"""
+        ratio = (math.sqrt(5) - 1) / 2
+        c = b - ratio * (b - a)
+        d = a + ratio * (b - a)
+        f_c, f_d = abs(self.f(c)), abs(self.f(d))
+        for _ in range(iterations):
+            if f_c < f_d:
+                b, d, f_d = d, c, f_c
+                c = b - ratio * (b - a)
+                f_c = abs(self.f(c))
+            else:
+                a, c, f_c = c, d, f_d
+                d = a + ratio * (b - a)
+                f_d = abs(self.f(d))
+        return (a + b) / 2
+
+    def solve_all(self, create_solver, epsilon):
+        """
+        Нахождение всех корней на [a, b].
+
+        create_solver: функция (a, b, epsilon) -> решатель с методом solve()
+        epsilon      : точность для решателя
+
+        :return: Список кортежей (root, func_value, iterations), отсортированный
+                 по root. Корни, отстоящие не больше чем на max(epsilon,
+                 resolution), объединяются (остается корень с меньшим |f|).
+                 Отрезки, на которых решатель завершился ошибкой,
+                 сохраняются в self.failures вместе с исключением.
+        """
+        if self.brackets is None:
+            self.find_brackets()
+
+        self.failures = []
+        roots = []
+        for left, right in self.brackets:
+            if left == right:
+                roots.append((left, self.f(left), 0))
+                continue
+            try:
+                roots.append(create_solver(left, right, epsilon).solve())
+            except Exception as e:
+                self.failures.append(((left, right), e))
+
+        roots.sort(key=lambda r: r[0])
+        tol = max(epsilon, self.resolution)
+        merged = []
+        for root in roots:
+            if merged and abs(root[0] - merged[-1][0]) <= tol:
+                if abs(root[1]) < abs(merged[-1][1]):
+                    merged[-1] = root
+                continue
+            merged.append(root)
+        return merged
+
+
+def find_all_roots(eq, meth_num, a, b, epsilon, num_points=200):
+    """
+    Нахождение всех корней уравнения eq из FunctionService.equations на [a, b]
+    методом с номером meth_num из MethodService.methods.
+    """
+    import MethodService
+
+    vectorized = eq.get("vectorized", {})
+    scanner = RootScanner(eq["f"], a, b, f_vec=vectorized.get("f"), num_points=num_points)
+    return scanner.solve_all(lambda left, right, eps: MethodService.create_solver(meth_num, eq, left, right, eps),
+                             epsilon)
@@ -0,0 +1,107 @@
+"""
+Результат решения и история итераций.
+
+SolveResult - компактный (__slots__) результат решателя, распаковываемый как
+кортеж (root, value, iterations). IterationHistory - история итераций в
+массивах NumPy, выделенных заранее по max_iter: приближение x_k, значение
+функции f(x_k), шаг и оценка погрешности. История необязательна: без нее
+решатель не создает массивов и не загружает NumPy.
+"""
+from LazyImport import lazy_import
+
+np = lazy_import("numpy")
+
+
+class IterationHistory:
+    """
+    История итераций. Строка k: x - приближение, в котором на итерации
+    вычислялась функция, value - значение функции в нем, step - изменение
+    приближения на итерации, error - оценка погрешности из критерия
+    остановки. Для систем (dimension > 1) x, value и step - векторы.
+
+    Свойства x, values, steps, errors - представления заполненной части
+    массивов без копирования.
+    """
+
+    __slots__ = ("count", "_x", "_values", "_steps", "_errors")
+
+    def __init__(self, max_iter, dimension=1):
+        shape = (max_iter,) if dimension == 1 else (max_iter, dimension)
+        self.count = 0
+        self._x = np.empty(shape)
+        self._values = np.empty(shape)
+        self._steps = np.empty(shape)
+        self._errors = np.empty(max_iter)
+
+    def record(self, x, value, step, error):
+        """Запись очередной итерации"""
+        k = self.count
+        if k == len(self._errors):
+            raise IndexError("История итераций заполнена: число итераций больше max_iter.")
+        self._x[k] = x
+        self._values[k] = value
+        self._steps[k] = step
+        self._errors[k] = error
+        self.count = k + 1
+
+    @property
+    def x(self):
+        return self._x[:self.count]
+
+    @property
+    def values(self):
+        return self._values[:self.count]
+
+    @property
+    def steps(self):
+        return self._steps[:self.count]
+
+    @property
+    def errors(self):
+        return self._errors[:self.count]
+
+    @property
+    def nbytes(self):
+        """Память, занятая массивами истории"""
+        return self._x.nbytes + self._values.nbytes + self._steps.nbytes + self._errors.nbytes
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"IterationHistory(count={self.count}, max_iter={len(self._errors)})"
+
+
+class SolveResult:
+    """
+    Результат решения: root - корень, value - значение функции в корне,
+    iterations - число итераций, history - IterationHistory или None.
+    Распаковывается и индексируется как кортеж (root, value, iterations).
+    """
+
+    __slots__ = ("root", "value", "iterations", "history")
+
+    def __init__(self, root, value, iterations, history=None):
+        self.root = root
+        self.value = value
+        self.iterations = iterations
+        self.history = history
+
+    def __iter__(self):
+        return iter((self.root, self.value, self.iterations))
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        return (self.root, self.value, self.iterations)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (SolveResult, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SolveResult(root={self.root!r}, value={self.value!r}, iterations={self.iterations!r})"
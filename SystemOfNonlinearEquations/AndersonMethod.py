@@ -0,0 +1,103 @@
+import numpy as np
+
+from SolveResult import IterationHistory
+
+from SystemOfNonlinearEquations.BroydenMethod import finite_difference_jacobian
+from SystemOfNonlinearEquations.NewtonMethodND import lu_factor, lu_solve
+
+
+class AndersonMethod:
+    """
+    Смешивание Андерсона для систем из N уравнений.
+
+    Ускоряется итерация x_(k+1) = x_k + r_k с невязкой r_k = -J0^(-1) F(x_k),
+    где J0 - якобиан в начальном приближении (аналитический, если в системе
+    есть 'jacobian', иначе конечными разностями); сама по себе эта итерация -
+    упрощенный метод Ньютона со сходимостью первого порядка. Следующее
+    приближение строится по memory + 1 последним итерациям с коэффициентами,
+    минимизирующими невязку, на итерацию приходится одно вычисление функций.
+    """
+
+    def __init__(self, system, eps=1e-6, max_iter=100, memory=5, mixing=1.0, vectorized=False, history=True):
+        """
+        memory    : число запоминаемых разностей итераций
+        mixing    : доля невязки, добавляемая к приближению (0 < mixing <= 1)
+        vectorized: functions вычисляет значения по столбцам массива (N, M)
+                    (для якобиана конечными разностями одним вызовом)
+        history   : сохранять ли историю итераций (IterationHistory) в self.history
+        """
+        if not isinstance(memory, int) or memory <= 0:
+            raise ValueError("memory должен быть положительным целым числом")
+        if not 0 < mixing <= 1:
+            raise ValueError("mixing должен лежать в (0, 1]")
+
+        self.system = system
+        self.eps = eps
+        self.max_iter = max_iter
+        self.memory = memory
+        self.mixing = mixing
+        self.vectorized = vectorized
+        self.iterations = 0
+        self.function_evaluations = 0
+        # История итераций (IterationHistory) последнего решения: точки,
+        # значения функций, шаги и погрешности (False - без истории)
+        self.keep_history = history
+        self.history = None
+
+    @property
+    def errors(self):
+        """Погрешности на итерациях (массив без копирования истории)"""
+        return self.history.errors if self.history is not None else ()
+
+    def compute_functions(self, x):
+        self.function_evaluations += 1
+        return np.asarray(self.system['functions'](x), dtype=float)
+
+    def preconditioner(self, x, f):
+        """LU-разложение якобиана в точке x"""
+        if 'jacobian' in self.system:
+            jacobian = np.asarray(self.system['jacobian'](x), dtype=float)
+        else:
+            jacobian, evaluations = finite_difference_jacobian(self.system['functions'], x, f,
+                                                             vectorized=self.vectorized)
+            self.function_evaluations += evaluations
+        return lu_factor(jacobian)
+
+    def solve(self, x0):
+        x_prev = np.array(x0, dtype=float)
+        x_new = x_prev
+        f = self.compute_functions(x_prev)
+        factorization = self.preconditioner(x_prev, f)
+        beta = self.mixing
+        xs, residuals = [], []
+        history = self.history = IterationHistory(self.max_iter, x_prev.size) if self.keep_history else None
+        for self.iterations in range(self.max_iter):
+            r = lu_solve(factorization, -f)
+            xs.append(x_prev)
+            residuals.append(r)
+            if len(xs) > self.memory + 1:
+                del xs[0], residuals[0]
+
+            x_new = x_prev + beta * r
+            if len(xs) > 1:
+                # Столбцы - разности последовательных итераций и невязок
+                d_x = np.diff(xs, axis=0).T
+                d_r = np.diff(residuals, axis=0).T
+                gamma = np.linalg.lstsq(d_r, r, rcond=None)[0]
+                x_new = x_new - (d_x + beta * d_r) @ gamma
+
+            error = float(np.linalg.norm(x_new - x_prev))
+            if history is not None:
+                history.record(x_prev, f, x_new - x_prev, error)
+            f = self.compute_functions(x_new)
+
+            if error < self.eps or not np.isfinite(error):
+                break
+
+            x_prev = x_new
+
+        # Проверка решения
+        if not np.all(np.abs(f) <= self.eps * 100):
+            raise ValueError("Решение не сошлось")
+
+        return x_new
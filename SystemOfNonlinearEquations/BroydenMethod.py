@@ -0,0 +1,139 @@
+import numpy as np
+
+from SolveResult import IterationHistory
+
+from SystemOfNonlinearEquations.NewtonMethodND import lu_factor, lu_solve
+
+
+def finite_difference_jacobian(functions, x, f0=None, h=None, vectorized=False):
+    """
+    Матрица Якоби конечными разностями вперед.
+
+    Смещенные точки x + h_j*e_j вычисляются по одной. При vectorized=True
+    все N точек передаются в functions одним массивом формы (N, N)
+    (столбец j - точка j); functions должна тогда вычислять значения по
+    столбцам и возвращать массив формы (N, N). Функция, которая просто
+    транслирует массив (например, A @ v - b), дала бы без этого флага
+    неверную матрицу без ошибки.
+
+    :return: Кортеж (jacobian, evaluations) - матрица и число вызовов functions.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    if f0 is None:
+        f0 = np.asarray(functions(x), dtype=float)
+    if h is None:
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+    else:
+        h = np.broadcast_to(np.asarray(h, dtype=float), x.shape)
+
+    points = x[:, None] + np.diag(h)
+    if vectorized:
+        values = np.asarray(functions(points), dtype=float)
+        if values.shape != (n, n):
+            raise ValueError(f"functions вернула массив формы {values.shape} вместо {(n, n)}")
+        return (values - f0[:, None]) / h, 1
+
+    jacobian = np.empty((n, n))
+    for j in range(n):
+        jacobian[:, j] = (np.asarray(functions(points[:, j]), dtype=float) - f0) / h[j]
+    return jacobian, n
+
+
+class BroydenMethod:
+    """
+    Квазиньютоновский метод Бройдена для систем из N уравнений без
+    аналитического якобиана.
+
+    Начальный якобиан вычисляется конечными разностями, далее обратная
+    матрица уточняется обновлениями ранга один ("good" или "bad" вариант),
+    так что на итерацию приходится одно вычисление функций. Каждые refresh
+    итераций якобиан пересчитывается заново.
+    """
+
+    VARIANTS = ("good", "bad")
+
+    def __init__(self, system, eps=1e-6, max_iter=100, variant="good", refresh=None, h=None, vectorized=False,
+                 history=True):
+        """
+        vectorized: functions вычисляет значения по столбцам массива (N, M) -
+                    начальный якобиан считается одним вызовом
+        history   : сохранять ли историю итераций (IterationHistory) в self.history
+        """
+        if variant not in self.VARIANTS:
+            raise ValueError(f"Неизвестный вариант метода Бройдена: {variant}")
+        if refresh is not None and (not isinstance(refresh, int) or refresh <= 0):
+            raise ValueError("refresh должен быть положительным целым числом")
+
+        self.system = system
+        self.eps = eps
+        self.max_iter = max_iter
+        self.variant = variant
+        self.refresh = refresh
+        self.h = h
+        self.vectorized = vectorized
+        self.iterations = 0
+        self.function_evaluations = 0
+        # История итераций (IterationHistory) последнего решения: точки,
+        # значения функций, шаги и погрешности (False - без истории)
+        self.keep_history = history
+        self.history = None
+
+    @property
+    def errors(self):
+        """Погрешности на итерациях (массив без копирования истории)"""
+        return self.history.errors if self.history is not None else ()
+
+    def compute_functions(self, x):
+        self.function_evaluations += 1
+        return np.asarray(self.system['functions'](x), dtype=float)
+
+    def inverse_jacobian(self, x, f):
+        """Обратная матрица к якобиану, вычисленному конечными разностями"""
+        jacobian, evaluations = finite_difference_jacobian(self.system['functions'], x, f, self.h,
+                                                             self.vectorized)
+        self.function_evaluations += evaluations
+        factorization = lu_factor(jacobian)
+        return np.column_stack([lu_solve(factorization, e) for e in np.eye(x.size)])
+
+    def solve(self, x0):
+        x_prev = np.array(x0, dtype=float)
+        x_new = x_prev
+        f_prev = f_new = self.compute_functions(x_prev)
+        H = None
+        history = self.history = IterationHistory(self.max_iter, x_prev.size) if self.keep_history else None
+        for self.iterations in range(self.max_iter):
+            if H is None or (self.refresh is not None and self.iterations % self.refresh == 0):
+                H = self.inverse_jacobian(x_prev, f_prev)
+
+            s = -H @ f_prev
+            x_new = x_prev + s
+            f_new = self.compute_functions(x_new)
+
+            error = float(np.linalg.norm(s))
+            if history is not None:
+                history.record(x_prev, f_prev, s, error)
+
+            if error < self.eps or not np.isfinite(error):
+                break
+
+            # Обновление ранга один для обратной матрицы
+            y = f_new - f_prev
+            Hy = H @ y
+            if self.variant == "good":
+                sH = s @ H
+                denominator = sH @ y
+                if denominator != 0:
+                    H += np.outer(s - Hy, sH) / denominator
+            else:
+                denominator = y @ y
+                if denominator != 0:
+                    H += np.outer(s - Hy, y) / denominator
+
+            x_prev, f_prev = x_new, f_new
+
+        # Проверка решения
+        if not np.all(np.abs(f_new) <= self.eps * 100):
+            raise ValueError("Решение не сошлось")
+
+        return x_new
@@ -0,0 +1,194 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from SystemOfNonlinearEquations.BroydenMethod import BroydenMethod
+from SystemOfNonlinearEquations.NewtonMethodND import NewtonMethodND
+
+
+def grid_starts(bounds, points_per_dim):
+    """
+    Начальные приближения в узлах равномерной сетки.
+
+    bounds: список пар (min, max) по каждой переменной
+    :return: Массив формы (points_per_dim ** N, N).
+    """
+    axes = [np.linspace(low, high, points_per_dim) for low, high in bounds]
+    return np.stack([g.ravel() for g in np.meshgrid(*axes, indexing='ij')], axis=1)
+
+
+def latin_hypercube_starts(bounds, count, seed=None):
+    """
+    Начальные приближения латинским гиперкубом: по каждой переменной
+    в каждую из count полос попадает ровно одна точка.
+
+    :return: Массив формы (count, N).
+    """
+    rng = np.random.default_rng(seed)
+    bounds = np.asarray(bounds, dtype=float)
+    n = len(bounds)
+    strata = np.stack([rng.permutation(count) for _ in range(n)], axis=1)
+    unit = (strata + rng.random((count, n))) / count
+    return bounds[:, 0] + unit * (bounds[:, 1] - bounds[:, 0])
+
+
+# Система для рабочих процессов: передается через fork, так как функции
+# систем (lambda) не сериализуются pickle
+_WORKER_SYSTEM = None
+
+
+def _solve_chunk(starts, eps, max_iter):
+    """Решение из каждого начального приближения в рабочем процессе"""
+    results = []
+    for x0 in starts:
+        if 'jacobian' in _WORKER_SYSTEM:
+            solver = NewtonMethodND(_WORKER_SYSTEM, eps, max_iter, history=False)
+        else:
+            solver = BroydenMethod(_WORKER_SYSTEM, eps, max_iter, history=False)
+        try:
+            results.append((solver.solve(x0), solver.iterations + 1))
+        except (ValueError, ArithmeticError):
+            results.append((None, solver.iterations + 1))
+    return results
+
+
+class MultiStartSolver:
+    """
+    Поиск всех решений системы из множества начальных приближений.
+
+    Система задается над векторами (как для NewtonMethodND). В режиме
+    "lanes" все приближения итерируются одновременно: functions вызывается
+    с массивом формы (N, M), где столбцы - приближения, якобиан оценивается
+    конечными разностями. В режиме "process" приближения распределяются
+    по процессам и решаются NewtonMethodND (или BroydenMethod без якобиана).
+    """
+
+    MODES = ("lanes", "process")
+
+    def __init__(self, system, eps=1e-6, max_iter=100, tol=1e-6):
+        """
+        tol: расстояние, в пределах которого решения считаются совпадающими
+        """
+        self.system = system
+        self.eps = eps
+        self.max_iter = max_iter
+        self.tol = tol
+        self.basins = []
+        self.failures = 0
+
+    def solve(self, starts, mode="lanes", workers=None):
+        """
+        :return: Список различных решений (массивы NumPy). Статистика по
+                 областям притяжения сохраняется в self.basins: для каждого
+                 решения - число сошедшихся к нему приближений (count), их доля
+                 (share) и среднее число итераций (mean_iterations).
+                 Число несошедшихся приближений - в self.failures.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Неизвестный режим: {mode}")
+
+        starts = np.atleast_2d(np.asarray(starts, dtype=float))
+        if mode == "lanes":
+            roots, iterations = self.solve_lanes(starts)
+        else:
+            roots, iterations = self.solve_processes(starts, workers)
+
+        return self.group(roots, iterations, len(starts))
+
+    def solve_lanes(self, starts):
+        """
+        Метод Ньютона одновременно для всех приближений.
+
+        :return: Кортеж (roots, iterations): массив (M, N) с NaN для
+                 несошедшихся приближений и число итераций каждого.
+        """
+        functions = self.system['functions']
+        m, n = starts.shape
+        X = starts.T.copy()
+        roots = np.full((m, n), np.nan)
+        iterations = np.zeros(m, dtype=int)
+        active = np.arange(m)
+
+        with np.errstate(all='ignore'):
+            for i in range(1, self.max_iter + 1):
+                if active.size == 0:
+                    break
+                x = X[:, active]
+                f = np.asarray(functions(x), dtype=float)
+
+                # Якобиан конечными разностями: J[k, :, j] = dF/dx_j для приближения k
+                h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+                J = np.empty((active.size, n, n))
+                for j in range(n):
+                    shifted = x.copy()
+                    shifted[j] += h[j]
+                    J[:, :, j] = ((np.asarray(functions(shifted), dtype=float) - f) / h[j]).T
+
+                regular = np.abs(np.linalg.det(J)) > 1e-12
+                step = np.full((active.size, n), np.nan)
+                if np.any(regular):
+                    step[regular] = np.linalg.solve(J[regular], -f.T[regular][:, :, None])[:, :, 0]
+
+                X[:, active] = x + step.T
+                iterations[active] = i
+                error = np.linalg.norm(step, axis=1)
+                done = error < self.eps
+                roots[active[done]] = X[:, active[done]].T
+                active = active[~done & np.isfinite(error)]
+
+            # Проверка решения
+            converged = np.flatnonzero(~np.isnan(roots[:, 0]))
+            if converged.size:
+                residual = np.abs(np.asarray(functions(roots[converged].T), dtype=float))
+                roots[converged[~np.all(residual <= self.eps * 100, axis=0)]] = np.nan
+
+        return roots, iterations
+
+    def solve_processes(self, starts, workers=None):
+        """Решение из каждого приближения в пуле процессов"""
+        global _WORKER_SYSTEM
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Режим 'process' требует запуска процессов через fork")
+
+        workers = workers or multiprocessing.cpu_count()
+        chunks = np.array_split(starts, workers * 4)
+        _WORKER_SYSTEM = self.system
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = [r for chunk in executor.map(_solve_chunk, chunks,
+                                                   [self.eps] * len(chunks),
+                                                   [self.max_iter] * len(chunks))
+                       for r in chunk]
+
+        roots = np.full(starts.shape, np.nan)
+        iterations = np.zeros(len(starts), dtype=int)
+        for k, (root, count) in enumerate(results):
+            if root is not None:
+                roots[k] = root
+            iterations[k] = count
+        return roots, iterations
+
+    def group(self, roots, iterations, total):
+        """Объединение решений, отличающихся меньше чем на tol"""
+        converged = np.flatnonzero(~np.isnan(roots).any(axis=1))
+        self.failures = total - converged.size
+
+        distinct = []
+        members = []
+        for k in converged:
+            for index, root in enumerate(distinct):
+                if np.linalg.norm(roots[k] - root) < self.tol:
+                    members[index].append(k)
+                    break
+            else:
+                distinct.append(roots[k])
+                members.append([k])
+
+        self.basins = [{
+            'root': root,
+            'count': len(group),
+            'share': len(group) / total,
+            'mean_iterations': float(np.mean(iterations[group]))
+        } for root, group in zip(distinct, members)]
+        return distinct
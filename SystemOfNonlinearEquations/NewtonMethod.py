@@ -1,10 +1,29 @@
+import math
+
+from SolveResult import IterationHistory
+
+
 class NewtonMethod:
-    def __init__(self, system, eps=1e-6, max_iter=100):
+    def __init__(self, system, eps=1e-6, max_iter=100, instrument=None, sink=None, history=True):
         self.system = system
         self.eps = eps
         self.max_iter = max_iter
         self.iterations = 0
-        self.errors = []
+        # История итераций (IterationHistory) последнего решения: точки,
+        # значения функций, шаги и погрешности (False - без истории)
+        self.keep_history = history
+        self.history = None
+        # Приемник итераций из TraceSink (None - итерации не выводятся)
+        self.sink = sink
+        # Необязательный Instrumentation.Instrument для сбора статистики
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.attach(self, ("compute_functions", "compute_jacobian"))
+
+    @property
+    def errors(self):
+        """Погрешности на итерациях (массив без копирования истории)"""
+        return self.history.errors if self.history is not None else ()
 
     def compute_functions(self, x, y):
         return self.system['functions'](x, y)
@@ -14,6 +33,7 @@ class NewtonMethod:
 
     def solve(self, x0, y0):
         x_prev, y_prev = x0, y0
+        history = self.history = IterationHistory(self.max_iter, 2) if self.keep_history else None
         for self.iterations in range(self.max_iter):
             # Вычисляем значения функций
             f1, f2 = self.compute_functions(x_prev, y_prev)
@@ -36,12 +56,14 @@ class NewtonMethod:
 
             # Вычисляем погрешность
             error = math.sqrt((x_new - x_prev) ** 2 + (y_new - y_prev) ** 2)
-            self.errors.append(error)
+            if history is not None:
+                history.record((x_prev, y_prev), (f1, f2), (dx, dy), error)
+            if self.instrument is not None:
+                self.instrument.iteration(self.iterations + 1, (x_new, y_new), error)
 
-            # Вывод информации о текущей итерации
-            print(f"\nИтерация {self.iterations + 1}:")
-            print(f"Текущее приближение: x = {x_new:.6f}, y = {y_new:.6f}")
-            print(f"Погрешность: {error:.2e}")
+            # Передача информации о текущей итерации
+            if self.sink is not None:
+                self.sink.record(self.iterations + 1, x_new, y_new, error)
 
             # Проверка на сходимость
             if error < self.eps:
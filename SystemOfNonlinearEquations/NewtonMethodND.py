@@ -0,0 +1,123 @@
+import numpy as np
+
+from SolveResult import IterationHistory
+
+
+def lu_factor(A):
+    """
+    LU-разложение с выбором главного элемента по столбцу: P*A = L*U.
+
+    :return: Кортеж (lu, piv): L (без единичной диагонали) и U хранятся
+             в одной матрице lu, piv - перестановка строк.
+    """
+    lu = np.array(A, dtype=float)
+    n = lu.shape[0]
+    if lu.shape != (n, n):
+        raise ValueError("Матрица Якоби должна быть квадратной")
+    piv = np.arange(n)
+    scale = np.max(np.abs(lu)) if n else 0.0
+
+    for k in range(n):
+        p = k + np.argmax(np.abs(lu[k:, k]))
+        if abs(lu[p, k]) <= 1e-12 * max(scale, 1.0):
+            raise ValueError("Определитель якобиана близок к нулю")
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            piv[[k, p]] = piv[[p, k]]
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+    return lu, piv
+
+
+def lu_solve(factorization, b):
+    """Решение A*x = b по разложению из lu_factor"""
+    lu, piv = factorization
+    x = np.asarray(b, dtype=float)[piv]
+    n = lu.shape[0]
+    for i in range(1, n):
+        x[i] -= lu[i, :i] @ x[:i]
+    for i in range(n - 1, -1, -1):
+        x[i] = (x[i] - lu[i, i + 1:] @ x[i + 1:]) / lu[i, i]
+    return x
+
+
+def as_vector_system(system):
+    """
+    Преобразует систему вида {'functions': F(x, y, ...), 'jacobian': J(x, y, ...)}
+    в систему над векторами {'functions': F(v), 'jacobian': J(v)}.
+    """
+    functions = system['functions']
+    jacobian = system['jacobian']
+    return {
+        'name': system.get('name', ''),
+        'functions': lambda v: np.asarray(functions(*v), dtype=float),
+        'jacobian': lambda v: np.asarray(jacobian(*v), dtype=float)
+    }
+
+
+class NewtonMethodND:
+    """
+    Метод Ньютона для систем из N уравнений.
+
+    Линейная система J * delta = -F решается через LU-разложение. При
+    jacobian_update > 1 якобиан и его разложение пересчитываются только
+    на каждой jacobian_update-й итерации (метод Шаманского); при
+    jacobian_update >= max_iter получается модифицированный метод Ньютона.
+    """
+
+    def __init__(self, system, eps=1e-6, max_iter=100, jacobian_update=1, history=True):
+        if not isinstance(jacobian_update, int) or jacobian_update <= 0:
+            raise ValueError("jacobian_update должен быть положительным целым числом")
+
+        self.system = system
+        self.eps = eps
+        self.max_iter = max_iter
+        self.jacobian_update = jacobian_update
+        self.iterations = 0
+        self.jacobian_evaluations = 0
+        # История итераций (IterationHistory) последнего решения: точки,
+        # значения функций, шаги и погрешности (False - без истории)
+        self.keep_history = history
+        self.history = None
+
+    @property
+    def errors(self):
+        """Погрешности на итерациях (массив без копирования истории)"""
+        return self.history.errors if self.history is not None else ()
+
+    def compute_functions(self, x):
+        return np.asarray(self.system['functions'](x), dtype=float)
+
+    def compute_jacobian(self, x):
+        self.jacobian_evaluations += 1
+        return np.asarray(self.system['jacobian'](x), dtype=float)
+
+    def solve(self, x0):
+        x_prev = np.array(x0, dtype=float)
+        x_new = x_prev
+        factorization = None
+        history = self.history = IterationHistory(self.max_iter, x_prev.size) if self.keep_history else None
+        for self.iterations in range(self.max_iter):
+            f = self.compute_functions(x_prev)
+
+            if self.iterations % self.jacobian_update == 0:
+                factorization = lu_factor(self.compute_jacobian(x_prev))
+
+            step = lu_solve(factorization, -f)
+            x_new = x_prev + step
+
+            error = float(np.linalg.norm(step))
+            if history is not None:
+                history.record(x_prev, f, step, error)
+
+            if error < self.eps or not np.isfinite(error):
+                break
+
+            x_prev = x_new
+
+        # Проверка решения
+        if not np.all(np.abs(self.compute_functions(x_new)) <= self.eps * 100):
+            raise ValueError("Решение не сошлось")
+
+        return x_new
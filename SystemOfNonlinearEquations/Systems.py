@@ -0,0 +1,23 @@
+import AutoDiff
+from AutoDiff import sin, cos
+
+
+# Определение систем уравнений (матрицы Якоби вычисляются автоматическим дифференцированием)
+def make_system(name, functions):
+    return {
+        'name': name,
+        'functions': functions,
+        'jacobian': AutoDiff.jacobian(functions)
+    }
+
+
+SYSTEMS = {
+    1: make_system('Система 1: x² + y² = 2; x - y = 0',
+                   lambda x, y: (x ** 2 + y ** 2 - 2, x - y)),
+    2: make_system('Система 2: sin(x) + y = 2; x + cos(y) = 1',
+                   lambda x, y: (sin(x) + y - 2, x + cos(y) - 1)),
+    3: make_system('Система 3: x³ - y = 0; x² + y² = 4',
+                   lambda x, y: (x ** 3 - y, x ** 2 + y ** 2 - 4)),
+    4: make_system('Система 4: sin(y-1)+x=1.3; y-sin(x+1)=0.8',
+                   lambda x, y: (sin(y - 1) + x - 1.3, y - sin(x + 1) - 0.8))
+}
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class PrintSink:
+    """Вывод каждой итерации в консоль"""
+
+    def record(self, iteration, x, y, error):
+        print(f"\nИтерация {iteration}:")
+        print(f"Текущее приближение: x = {x:.6f}, y = {y:.6f}")
+        print(f"Погрешность: {error:.2e}")
+
+    def close(self):
+        pass
+
+
+class ArraySink:
+    """
+    Хранение итераций в массиве NumPy формы (n, 3): столбцы x, y, error.
+    Массив выделяется заранее и удваивается при переполнении.
+    """
+
+    def __init__(self, capacity=100):
+        self.buffer = np.empty((capacity, 3))
+        self.size = 0
+
+    def record(self, iteration, x, y, error):
+        if self.size == len(self.buffer):
+            self.buffer = np.concatenate([self.buffer, np.empty_like(self.buffer)])
+        self.buffer[self.size] = (x, y, error)
+        self.size += 1
+
+    @property
+    def data(self):
+        """Записанные итерации (представление без копирования)"""
+        return self.buffer[:self.size]
+
+    def close(self):
+        pass
+
+
+class BinaryFileSink:
+    """
+    Запись итераций в двоичный файл: тройки float64 (x, y, error) подряд.
+    Прочитать файл можно функцией read_binary_trace.
+    """
+
+    def __init__(self, path, buffer_size=1024):
+        self.file = open(path, "ab")
+        self.buffer = np.empty((buffer_size, 3))
+        self.size = 0
+
+    def record(self, iteration, x, y, error):
+        self.buffer[self.size] = (x, y, error)
+        self.size += 1
+        if self.size == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.buffer[:self.size].tobytes())
+        self.size = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_binary_trace(path):
+    """Итерации из файла BinaryFileSink в виде массива формы (n, 3)"""
+    return np.fromfile(path, dtype=np.float64).reshape(-1, 3)
@@ -0,0 +1,8 @@
+"""
+Решение систем нелинейных уравнений.
+
+Модули пакета импортируют друг друга и модули корня репозитория
+(SolveResult, AutoDiff) абсолютно, поэтому main2 запускается из корня
+репозитория: python -m SystemOfNonlinearEquations.main2. Прежний запуск
+python main2.py из каталога пакета больше не работает.
+"""
@@ -1,18 +1,50 @@
-import math
+import functools
+
 import matplotlib.pyplot as plt
-from matplotlib import cm
 import numpy as np
-from NewtonMethod import NewtonMethod
-# Функция для отрисовки графика системы уравнений и отметки решения
-def plot_system_with_solution(system, solution):
-    # Создаем сетку значений
-    x = np.linspace(-3, 3, 400)
-    y = np.linspace(-3, 3, 400)
+from SystemOfNonlinearEquations.NewtonMethod import NewtonMethod
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+from SystemOfNonlinearEquations.TraceSink import PrintSink
+
+# Число сеток, хранимых в кэше evaluate_grid
+GRID_CACHE_SIZE = 16
+
+
+def evaluate_grid(system, window=(-3, 3, -3, 3), resolution=400):
+    """
+    Значения обеих функций системы на сетке resolution x resolution.
+    Функции вычисляются одним вызовом над массивами; если система не
+    поддерживает массивы, используется поточечное вычисление.
+
+    Результат кэшируется по объекту функций системы (а не по ее имени),
+    окну и разрешению; возвращаемые массивы доступны только для чтения.
+    """
+    return _evaluate_grid(system['functions'], tuple(window), resolution)
+
+
+@functools.lru_cache(maxsize=GRID_CACHE_SIZE)
+def _evaluate_grid(functions, window, resolution):
+    x_min, x_max, y_min, y_max = window
+    x = np.linspace(x_min, x_max, resolution)
+    y = np.linspace(y_min, y_max, resolution)
     X, Y = np.meshgrid(x, y)
 
-    # Вычисляем значения функций
-    F1 = np.vectorize(lambda x, y: system['functions'](x, y)[0])(X, Y)
-    F2 = np.vectorize(lambda x, y: system['functions'](x, y)[1])(X, Y)
+    try:
+        F1, F2 = (np.broadcast_to(np.asarray(F, dtype=float), X.shape)
+                  for F in functions(X, Y))
+    except (TypeError, ValueError):
+        F1, F2 = np.vectorize(functions, otypes=[float, float])(X, Y)
+
+    grid = X, Y, F1, F2
+    for array in grid:
+        array.flags.writeable = False
+    return grid
+
+
+# Функция для отрисовки графика системы уравнений и отметки решения
+def plot_system_with_solution(system, solution, window=(-3, 3, -3, 3), resolution=400):
+    # Значения функций на сетке
+    X, Y, F1, F2 = evaluate_grid(system, window, resolution)
 
     fig, ax = plt.subplots(figsize=(7, 7))
 
@@ -37,34 +69,6 @@ def plot_system_with_solution(system, solution):
     plt.show()
 
 
-# Определение систем уравнений
-SYSTEMS = {
-    1: {
-        'name': 'Система 1: x² + y² = 2; x - y = 0',
-        'functions': lambda x, y: (x ** 2 + y ** 2 - 2, x - y),
-        'jacobian': lambda x, y: [[2 * x, 2 * y], [1, -1]]
-    },
-    2: {
-        'name': 'Система 2: sin(x) + y = 2; x + cos(y) = 1',
-        'functions': lambda x, y: (math.sin(x) + y - 2, x + math.cos(y) - 1),
-        'jacobian': lambda x, y: [[math.cos(x), 1], [1, -math.sin(y)]]
-    },
-    3: {
-        'name': 'Система 3: x³ - y = 0; x² + y² = 4',
-        'functions': lambda x, y: (x ** 3 - y, x ** 2 + y ** 2 - 4),
-        'jacobian': lambda x, y: [[3 * x ** 2, -1], [2 * x, 2 * y]]
-    },
-    4: {
-        'name': 'Система 4: sin(y-1)+x=1.3; y-sin(x+1)=0.8',
-        'functions': lambda x, y: (math.sin(y - 1) + x - 1.3, y - math.sin(x + 1) - 0.8),
-        'jacobian': lambda x, y: [
-            [1, math.cos(y - 1)],
-            [-math.cos(x + 1), 1]
-        ]
-    }
-}
-
-
 def main():
     # Выбор системы
     print("Доступные системы:")
@@ -92,7 +96,7 @@ def main():
             print("Введите числовые значения")
 
     # Решение методом Ньютона
-    solver = NewtonMethod(system)
+    solver = NewtonMethod(system, sink=PrintSink())
     try:
         x_sol, y_sol = solver.solve(x0, y0)
 
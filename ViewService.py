@@ -1,4 +1,5 @@
 import FunctionService
+import MethodService
 
 
 class ViewService:
@@ -16,16 +17,15 @@ class ViewService:
         for i in sorted(FunctionService.equations.keys()):
             print(f"\t{i}: {FunctionService.equations[i]['description']}")
         num = input()
-        if num not in ["1", "2", "3", "4"]:
+        if num not in [str(i) for i in FunctionService.equations]:
             raise ValueError("Недействительный номер уравнения!")
         self.eq = int(num)
 
         print("Введите номер метода:")
-        print("1: Метод хорд")
-        print("2: Метод Ньютона")
-        print("3: Метод простой итерации")
+        for i in sorted(MethodService.methods.keys()):
+            print(f"{i}: {MethodService.methods[i]['description']}")
         num = input()
-        if num not in ["1", "2", "3"]:
+        if num not in [str(i) for i in MethodService.methods]:
             raise ValueError("Недействительный номер метода!")
         self.method = int(num)
 
@@ -0,0 +1,167 @@
+"""
+Пакетное решение уравнений без интерактивного ввода.
+
+Задания читаются построчно из файла или stdin в формате CSV
+(eq,method,a,b,epsilon) или JSON Lines ({"eq": 1, "method": 2, "a": 1,
+"b": 2, "epsilon": 1e-6}), результаты пишутся построчно в том же формате.
+Задания обрабатываются генераторами по одному, поэтому расход памяти не
+зависит от их числа. Перед решением результат ищется в кэше ResultCache
+(отключается параметром --no-cache).
+
+Пример: python batch.py jobs.csv -o results.csv
+"""
+import argparse
+import csv
+import json
+import sys
+
+import FunctionService
+import MethodService
+import ResultCache
+
+JOB_FIELDS = ("eq", "method", "a", "b", "epsilon")
+RESULT_FIELDS = JOB_FIELDS + ("root", "value", "iterations", "error")
+
+
+def detect_format(first_line):
+    return "jsonl" if first_line.lstrip().startswith("{") else "csv"
+
+
+def read_jobs(lines, fmt):
+    """
+    Генератор заданий (словари с полями JOB_FIELDS) из непустых строк.
+    Для строки, которую не удалось разобрать, задание содержит сообщение
+    в поле error; остальные строки обрабатываются как обычно.
+    """
+    if fmt == "jsonl":
+        for number, line in enumerate(lines, 1):
+            try:
+                job = json.loads(line)
+            except ValueError as e:
+                yield {"error": f"Задание {number}: некорректная строка JSON ({e})"}
+                continue
+            if not isinstance(job, dict):
+                yield {"error": f"Задание {number}: строка должна быть JSON-объектом"}
+                continue
+            yield job
+        return
+
+    reader = csv.reader(lines)
+    number = 0
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            number += 1
+            yield {"error": f"Задание {number}: некорректная строка CSV ({e})"}
+            continue
+        if row and row[0].strip().lower() == "eq":
+            # Строка заголовка
+            continue
+        number += 1
+        values = [value.strip() for value in row]
+        job = dict(zip(JOB_FIELDS, values))
+        if len(values) != len(JOB_FIELDS):
+            job["error"] = f"Задание {number}: ожидается полей - {len(JOB_FIELDS)}, получено - {len(values)}"
+        yield job
+
+
+def job_field(job, name, kind):
+    """Значение поля name задания, приведенное к типу kind"""
+    value = job.get(name)
+    if value is None or value == "":
+        raise ValueError(f"Не задано поле {name}")
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Поле {name}: недопустимое значение {value!r}") from None
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+def solve_job(job, cache=None):
+    """
+    Решение одного задания; ошибки записываются в поле error результата.
+    cache - ResultCache.ResultCache для повторного использования результатов.
+    """
+    result = {field: job.get(field) for field in JOB_FIELDS}
+    result.update(root=None, value=None, iterations=None, error=job.get("error"))
+    if result["error"] is not None:
+        # Задание не удалось прочитать
+        return result
+    try:
+        eq_num = job_field(job, "eq", int)
+        if eq_num not in FunctionService.equations:
+            raise ValueError("Недействительный номер уравнения!")
+        eq = FunctionService.equations[eq_num]
+        meth_num = job_field(job, "method", int)
+        a, b, epsilon = (job_field(job, name, float) for name in ("a", "b", "epsilon"))
+        if cache is not None:
+            root, value, iterations = cache.solve(eq, meth_num, a, b, epsilon)
+        else:
+            root, value, iterations = MethodService.create_solver(meth_num, eq, a, b, epsilon).solve()
+        result.update(root=float(root), value=float(value), iterations=int(iterations))
+    except Exception as e:
+        result["error"] = str(e) or type(e).__name__
+    return result
+
+
+def solve_jobs(jobs, cache=None):
+    """Генератор результатов для потока заданий"""
+    for job in jobs:
+        yield solve_job(job, cache)
+
+
+def write_results(results, stream, fmt="csv"):
+    """Построчная запись результатов; возвращает число записанных строк"""
+    count = 0
+    if fmt == "jsonl":
+        for result in results:
+            stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+        return count
+
+    writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for result in results:
+        writer.writerow(result)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетное решение нелинейных уравнений.")
+    parser.add_argument("input", nargs="?", default="-", help="файл заданий ('-' - stdin)")
+    parser.add_argument("-o", "--output", default="-", help="файл результатов ('-' - stdout)")
+    parser.add_argument("-f", "--format", choices=("auto", "csv", "jsonl"), default="auto",
+                        help="формат заданий; результаты пишутся в том же формате")
+    parser.add_argument("--cache", default=ResultCache.DEFAULT_PATH, help="файл кэша результатов (SQLite)")
+    parser.add_argument("--no-cache", action="store_true", help="не использовать кэш результатов")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    cache = None if args.no_cache else ResultCache.ResultCache(args.cache, commit_every=1000)
+    try:
+        lines = (line for line in source if line.strip())
+        first = next(lines, None)
+        fmt = args.format if args.format != "auto" else detect_format(first or "")
+        if first is not None:
+            lines = _chain(first, lines)
+        write_results(solve_jobs(read_jobs(lines, fmt), cache), target, fmt)
+    finally:
+        if cache is not None:
+            cache.close()
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
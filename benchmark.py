@@ -0,0 +1,229 @@
+"""
+Сравнение методов решения на уравнениях FunctionService и системах
+SystemOfNonlinearEquations.
+
+Для каждого сочетания (метод, уравнение, интервал, точность) записываются
+лучшее время из нескольких запусков, число вычислений каждой функции,
+число итераций и ошибка, если метод не сошелся. Результаты сохраняются
+в JSON для сравнения между коммитами.
+
+Пример: python benchmark.py -o bench.json
+        python benchmark.py -o new.json --compare bench.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import FunctionService
+import MethodService
+from Instrumentation import CountingFunction
+from Methods.SimpleIterationMethod import max_abs_on_interval
+from Polynomial import Polynomial
+from SystemOfNonlinearEquations.AndersonMethod import AndersonMethod
+from SystemOfNonlinearEquations.BroydenMethod import BroydenMethod
+from SystemOfNonlinearEquations.NewtonMethod import NewtonMethod as SystemNewtonMethod
+from SystemOfNonlinearEquations.NewtonMethodND import NewtonMethodND, as_vector_system
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+
+# Интервалы для уравнений 1-4: узкие, обычные и широкие вокруг корней
+INTERVALS = {
+    1: [(1, 2), (0, 3), (1.5, 1.6)],
+    2: [(0, 1), (-1, 2), (0.7, 0.8)],
+    3: [(0, 1), (1, 2), (0.5, 0.7)],
+    4: [(-2, -1), (0, 1), (1, 3)]
+}
+TOLERANCES = (1e-4, 1e-8, 1e-12)
+STARTS = [(1.0, 1.2), (0.5, 1.5), (-1.0, -1.5), (2.0, 0.5)]
+SYSTEM_METHODS = {
+    "Newton 2D": lambda system, eps: SystemNewtonMethod(system, eps),
+    "Newton ND": lambda system, eps: NewtonMethodND(as_vector_system(system), eps),
+    "Broyden": lambda system, eps: BroydenMethod(as_vector_system(system), eps),
+    "Anderson": lambda system, eps: AndersonMethod(as_vector_system(system), eps)
+}
+
+
+class CountingPolynomial(Polynomial):
+    """
+    Многочлен, считающий вычисления - свои и построенных из него
+    многочленов (производных, системы Штурма) - в counter.calls.
+    """
+
+    def __init__(self, coefficients, counter):
+        super().__init__(coefficients)
+        self.counter = counter
+
+    def derived(self, coefficients):
+        return CountingPolynomial(coefficients, self.counter)
+
+    def __call__(self, x):
+        self.counter.calls += 1
+        return super().__call__(x)
+
+    def value_and_derivative(self, x):
+        self.counter.calls += 1
+        return super().value_and_derivative(x)
+
+    def taylor2(self, x):
+        self.counter.calls += 1
+        return super().taylor2(x)
+
+
+def fresh_equation(eq):
+    """
+    Уравнение eq без накопленных кэшей, чтобы каждый запуск выполнял всю
+    работу заново: сбрасывается кэш оценки max|phi'| метода простой
+    итерации, многочлен заменяется копией без вычисленной системы Штурма.
+    """
+    max_abs_on_interval.cache_clear()
+    if "polynomial" in eq:
+        return dict(eq, polynomial=Polynomial(eq["polynomial"].coefficients))
+    return eq
+
+
+def best_time(run, repeat, setup=None):
+    """
+    Лучшее время из repeat запусков run(); если задана setup, перед каждым
+    запуском вне замера вызывается setup() и ее результат передается в run.
+    Исключение run() пробрасывается.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        run(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def counted_equation(eq):
+    counters = {key: CountingFunction(eq[key]) for key in ("f", "f_prime", "f2", "phi", "phi_prime")}
+    counted = dict(eq, **counters)
+    if "phi_prime" in eq.get("vectorized", {}):
+        # Векторизованная phi' оценивает max|phi'| на сетках (один вызов на сетку)
+        counters["phi_prime_vec"] = CountingFunction(eq["vectorized"]["phi_prime"])
+        counted["vectorized"] = dict(eq["vectorized"], phi_prime=counters["phi_prime_vec"])
+    if "polynomial" in eq:
+        counters["polynomial"] = CountingFunction(eq["polynomial"])
+        counted["polynomial"] = CountingPolynomial(eq["polynomial"].coefficients, counters["polynomial"])
+    return counted, counters
+
+
+def bench_equations(repeat):
+    for meth_num, method in MethodService.methods.items():
+        for eq_num, intervals in INTERVALS.items():
+            eq = FunctionService.equations[eq_num]
+            for a, b in intervals:
+                for epsilon in TOLERANCES:
+                    record = {"kind": "equation", "method": method["description"], "problem": eq_num,
+                              "a": a, "b": b, "epsilon": epsilon}
+                    counted, counters = counted_equation(fresh_equation(eq))
+                    try:
+                        _, _, iterations = MethodService.create_solver(meth_num, counted, a, b, epsilon).solve()
+                        record["iterations"] = int(iterations)
+                        record["time"] = best_time(
+                            lambda fresh: MethodService.create_solver(meth_num, fresh, a, b, epsilon).solve(),
+                            repeat, lambda: fresh_equation(eq))
+                        record["error"] = None
+                    except Exception as e:
+                        record.update(iterations=None, time=None, error=str(e) or type(e).__name__)
+                    record["evaluations"] = {key: c.calls for key, c in counters.items() if c.calls}
+                    yield record
+
+
+def bench_systems(repeat):
+    for name, create in SYSTEM_METHODS.items():
+        for sys_num, system in SYSTEMS.items():
+            for x0, y0 in STARTS:
+                for epsilon in TOLERANCES:
+                    record = {"kind": "system", "method": name, "problem": sys_num,
+                              "start": [x0, y0], "epsilon": epsilon}
+                    functions = CountingFunction(system["functions"])
+                    jacobian = CountingFunction(system["jacobian"])
+                    counted = dict(system, functions=functions, jacobian=jacobian)
+                    solve = (lambda s: s.solve(x0, y0)) if name == "Newton 2D" else (lambda s: s.solve([x0, y0]))
+                    try:
+                        solver = create(counted, epsilon)
+                        solve(solver)
+                        record["iterations"] = solver.iterations + 1
+                        record["time"] = best_time(lambda: solve(create(system, epsilon)), repeat)
+                        record["error"] = None
+                    except Exception as e:
+                        record.update(iterations=None, time=None, error=str(e) or type(e).__name__)
+                    record["evaluations"] = {key: c.calls for key, c in
+                                             (("functions", functions), ("jacobian", jacobian)) if c.calls}
+                    yield record
+
+
+def case_key(record):
+    return (record["kind"], record["method"], record["problem"],
+            record.get("a"), record.get("b"), tuple(record.get("start", ())), record["epsilon"])
+
+
+def summarize(records):
+    """Сводка по (метод, задача): доля отказов, среднее время и вычисления"""
+    groups = {}
+    for record in records:
+        groups.setdefault((record["kind"], record["method"], record["problem"]), []).append(record)
+
+    lines = [f"{'метод':<55} {'задача':>6} {'отказы':>7} {'время, мкс':>11} {'вычисл.':>8} {'итер.':>6}"]
+    for (kind, method, problem), group in groups.items():
+        ok = [r for r in group if r["error"] is None]
+        failure_rate = 1 - len(ok) / len(group)
+        mean_time = sum(r["time"] for r in ok) / len(ok) * 1e6 if ok else float("nan")
+        mean_evals = sum(sum(r["evaluations"].values()) for r in ok) / len(ok) if ok else float("nan")
+        mean_iter = sum(r["iterations"] for r in ok) / len(ok) if ok else float("nan")
+        lines.append(f"{method:<55} {problem:>6} {failure_rate:>7.0%} {mean_time:>11.1f} "
+                     f"{mean_evals:>8.1f} {mean_iter:>6.1f}")
+    return "\n".join(lines)
+
+
+def compare(records, baseline, threshold):
+    """Случаи, ставшие медленнее в 1 + threshold раз или переставшие сходиться"""
+    old = {case_key(r): r for r in baseline}
+    lines = []
+    for record in records:
+        previous = old.get(case_key(record))
+        if previous is None:
+            continue
+        if previous["error"] is None and record["error"] is not None:
+            lines.append(f"ОТКАЗ  {case_key(record)}: {record['error']}")
+        elif previous["time"] and record["time"] and record["time"] > previous["time"] * (1 + threshold):
+            lines.append(f"МЕДЛЕННЕЕ x{record['time'] / previous['time']:.2f}  {case_key(record)}")
+    return "\n".join(lines) or "Регрессий не найдено."
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сравнение методов решения нелинейных уравнений.")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="файл результатов (JSON)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="число запусков для замера времени")
+    parser.add_argument("--compare", help="файл результатов предыдущего запуска")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="допустимое относительное замедление при сравнении")
+    args = parser.parse_args(argv)
+
+    records = list(bench_equations(args.repeat)) + list(bench_systems(args.repeat))
+    with open(args.output, "w", encoding="utf-8") as file_:
+        json.dump({"revision": git_revision(), "python": sys.version.split()[0], "results": records},
+                  file_, ensure_ascii=False, indent=1)
+
+    print(summarize(records))
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file_:
+            baseline = json.load(file_)["results"]
+        print()
+        print(compare(records, baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
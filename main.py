@@ -1,19 +1,44 @@
+import argparse
+import sys
+import time
+
+_start = time.perf_counter()
 import FunctionService
+import MethodService
+import ResultCache
 import ViewService
-from Methods.ChordMethod import ChordMethod
-from Methods.NewtonMethod import NewtonMethod
-from Methods.SimpleIterationMethod import SimpleIterationMethod
+from LazyImport import is_loaded
+from Methods.FunctionPlotter import FunctionPlotter
+IMPORT_TIME = time.perf_counter() - _start
+
+parser = argparse.ArgumentParser(description="Решение нелинейного уравнения.")
+parser.add_argument("--no-plot", action="store_true", help="не строить график")
+parser.add_argument("--import-times", action="store_true",
+                    help="вывести время импорта и решения (подробно: python -X importtime main.py)")
+args = parser.parse_args()
 
 view = ViewService.ViewService()
 eq_num, meth_num = view.start()
 a, b, epsilon = view.read()
 eq = FunctionService.equations[eq_num]
+plotter = None if args.no_plot else FunctionPlotter()
 
-if meth_num == 1:
-    root, value, iterations = ChordMethod(eq["f"], eq["f2"], a, b, epsilon).solve()
-if meth_num == 2:
-    root, value, iterations = NewtonMethod(eq["f"], eq["f_prime"], eq["f2"], a, b, epsilon).solve()
-else:
-    root, value, iterations = SimpleIterationMethod(eq["f"], eq["phi"], eq["phi_prime"], a, b, epsilon).solve()
+# Результат ищется в кэше; график строится в любом случае
+start = time.perf_counter()
+with ResultCache.ResultCache() as cache:
+    result = cache.lookup(eq, meth_num, a, b, epsilon)
+    if result is None:
+        solver = MethodService.create_solver(meth_num, eq, a, b, epsilon, plotter=plotter)
+        result = solver.solve()
+        cache.store(eq, meth_num, a, b, epsilon, result)
+    elif plotter is not None:
+        plotter.plot(eq["f"], a, b)
+root, value, iterations = result
+solve_time = time.perf_counter() - start
 
 view.write(root, value, iterations)
+
+if args.import_times:
+    print(f"Импорт модулей: {IMPORT_TIME * 1000:.1f} мс, решение: {solve_time * 1000:.1f} мс", file=sys.stderr)
+    print("Загружены: " + ", ".join(f"{name} - {'да' if is_loaded(name) else 'нет'}"
+                                     for name in ("numpy", "matplotlib")), file=sys.stderr)
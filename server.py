@@ -0,0 +1,182 @@
+"""
+Сервер решения уравнений на asyncio.
+
+Протокол: JSON Lines поверх TCP или Unix-сокета. Запрос - объект с полями
+eq, method, a, b, epsilon и необязательным id; ответ - объект с полями
+запроса и root, value, iterations, error (см. batch.solve_job). Запросы
+можно отправлять не дожидаясь ответов, ответы приходят в порядке запросов.
+Если клиент не читает ответы, после max_pending необработанных запросов
+сервер перестает читать его сокет. На строку длиннее max_line байт
+сервер отвечает ошибкой и закрывает соединение.
+
+Пример: python server.py --port 8765
+        python server.py --unix /tmp/solver.sock --workers 0
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import solve_job
+
+
+def handle_request(line, executor, loop):
+    """Future с ответом на одну строку запроса"""
+    try:
+        job = json.loads(line)
+        if not isinstance(job, dict):
+            raise ValueError("Запрос должен быть JSON-объектом")
+    except ValueError as e:
+        return rejected(loop, f"Некорректный запрос: {e}")
+
+    if executor is None:
+        future = loop.create_future()
+        future.set_result(respond(job, solve_job(job)))
+        return future
+    return asyncio.ensure_future(solve_remote(job, executor, loop))
+
+
+def rejected(loop, message):
+    """Future с готовым ответом-ошибкой на запрос, который не удалось прочитать"""
+    future = loop.create_future()
+    future.set_result({"id": None, "error": message})
+    return future
+
+
+async def solve_remote(job, executor, loop):
+    return respond(job, await loop.run_in_executor(executor, solve_job, job))
+
+
+async def unless_done(awaitable, task):
+    """
+    Результат awaitable; если раньше завершилась задача task (отправка
+    ответов прекращена - клиент отключился), ожидание отменяется и
+    возбуждается ConnectionError.
+    """
+    waiter = asyncio.ensure_future(awaitable)
+    await asyncio.wait({waiter, task}, return_when=asyncio.FIRST_COMPLETED)
+    if not waiter.done():
+        waiter.cancel()
+        raise ConnectionError("Отправка ответов прекращена")
+    return waiter.result()
+
+
+def respond(job, result):
+    if "id" in job:
+        result = {"id": job["id"], **result}
+    return result
+
+
+class SolverServer:
+    """Сервер с пулом процессов для решения (executor None - решение в цикле событий)"""
+
+    def __init__(self, workers=None, max_pending=1024, max_line=2 ** 20):
+        """
+        workers    : число процессов (0 - решать в цикле событий)
+        max_pending: максимум необработанных запросов на одно соединение
+        max_line   : максимальная длина строки запроса в байтах
+        """
+        # Процессы пула создаются при первом запросе, когда соединение уже
+        # принято; при fork они унаследовали бы сокет клиента, и тот не
+        # получил бы EOF после закрытия соединения сервером
+        context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+        self.executor = None if workers == 0 else ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        self.max_pending = max_pending
+        self.max_line = max_line
+
+    async def handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        pending = asyncio.Queue(maxsize=self.max_pending)
+        sender = asyncio.create_task(self.send_responses(pending, writer))
+        try:
+            while True:
+                try:
+                    line = await unless_done(reader.readline(), sender)
+                except ValueError:
+                    # Строка длиннее лимита StreamReader: остаток строки
+                    # нельзя отделить от следующих запросов
+                    line = None
+                    future = rejected(loop, f"Некорректный запрос: строка длиннее {self.max_line} байт")
+                else:
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    future = handle_request(line, self.executor, loop)
+                # При заполненной очереди чтение приостанавливается
+                try:
+                    await unless_done(pending.put(future), sender)
+                except ConnectionError:
+                    future.cancel()
+                    raise
+                if line is None:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            try:
+                await unless_done(pending.put(None), sender)
+            except ConnectionError:
+                pass
+            await sender
+            # Ответы, которые уже некому отправить
+            while not pending.empty():
+                future = pending.get_nowait()
+                if future is not None:
+                    future.cancel()
+            writer.close()
+
+    async def send_responses(self, pending, writer):
+        while True:
+            future = await pending.get()
+            if future is None:
+                break
+            response = await future
+            try:
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()
+            except ConnectionError:
+                break
+
+    async def serve(self, host=None, port=None, unix=None):
+        if unix is not None:
+            if os.path.exists(unix):
+                os.remove(unix)
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix, limit=self.max_line)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=self.max_line)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сервер решения нелинейных уравнений.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="путь к Unix-сокету (вместо TCP)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="число процессов (по умолчанию - число ядер, 0 - без пула)")
+    parser.add_argument("--max-pending", type=int, default=1024,
+                        help="максимум необработанных запросов на одно соединение")
+    parser.add_argument("--max-line", type=int, default=2 ** 20,
+                        help="максимальная длина строки запроса в байтах")
+    args = parser.parse_args(argv)
+
+    server = SolverServer(args.workers, args.max_pending, args.max_line)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+import AutoDiff
+import FunctionService
+import MethodService
+from Instrumentation import CountingFunction
+
+
+def f(x):
+    return AutoDiff.sin(x) * AutoDiff.exp(x) + x ** 3 / (1 + x ** 2) - AutoDiff.sqrt(x + 2)
+
+
+def f_prime(x):
+    return (math.cos(x) + math.sin(x)) * math.exp(x) + (x ** 4 + 3 * x ** 2) / (1 + x ** 2) ** 2 \
+        - 0.5 / math.sqrt(x + 2)
+
+
+@pytest.mark.parametrize("x", [-1.0, 0.3, 2.0])
+def test_first_and_second_derivative(x):
+    value, derivative = AutoDiff.value_and_derivative(f, x)
+    assert value == pytest.approx(f(x))
+    assert derivative == pytest.approx(f_prime(x), rel=1e-12)
+
+    h = 1e-5
+    second = (f_prime(x + h) - f_prime(x - h)) / (2 * h)
+    assert AutoDiff.taylor2(f, x)[2] == pytest.approx(second, rel=1e-6)
+    assert AutoDiff.second_derivative(f)(x) == pytest.approx(second, rel=1e-6)
+
+
+def test_jacobian():
+    jacobian = AutoDiff.jacobian(lambda x, y: (x ** 2 * y, AutoDiff.sin(x) + y))
+    assert np.allclose(jacobian(2.0, 3.0), [[12.0, 4.0], [math.cos(2.0), 1.0]])
+
+
+@pytest.mark.parametrize("meth_num, combined", [(2, "f_f_prime"), (4, "f_f_prime"), (5, "f_f_prime_f2"),
+                                                (6, "f_f_prime_f2"), (7, "f_f_prime_f2")])
+def test_methods_use_one_pass_evaluation(meth_num, combined):
+    eq = FunctionService.make_equation("f(x) = exp(x) - 3x", lambda x: AutoDiff.exp(x) - 3 * x)
+    counters = {key: CountingFunction(eq[key]) for key in ("f_prime", combined)}
+    root, _, _ = MethodService.create_solver(meth_num, dict(eq, **counters), 1, 2, 1e-10).solve()
+    assert root == pytest.approx(1.5121345516578424, abs=1e-9)
+    assert counters[combined].calls > 0
+    # Гибридный метод вычисляет f' отдельно только для начального приближения
+    assert counters["f_prime"].calls <= (1 if meth_num == 4 else 0)
+
+
+def test_builtin_equations_use_hand_written_derivatives():
+    assert "f_f_prime" not in FunctionService.equations[1]
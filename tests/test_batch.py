@@ -0,0 +1,43 @@
+import json
+
+import batch
+
+
+def test_main_writes_results(tmp_path):
+    source = tmp_path / "jobs.csv"
+    source.write_text("eq,method,a,b,epsilon\n1,2,1,2,1e-8\n\n1,1,1,2,1e-8\n", encoding="utf-8")
+    target = tmp_path / "results.csv"
+    batch.main([str(source), "-o", str(target), "--no-cache"])
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines[0].split(",") == list(batch.RESULT_FIELDS)
+    assert len(lines) == 3
+    assert all(line.endswith(",") for line in lines[1:])
+
+
+def test_malformed_jsonl_line_does_not_abort(tmp_path):
+    source = tmp_path / "jobs.jsonl"
+    source.write_text('{"eq": 1, "method": 2, "a": 1, "b": 2, "epsilon": 1e-8}\n'
+                      '{"eq": 1, "method":\n'
+                      '[1, 2]\n'
+                      '{"eq": 1, "method": 2, "a": 1, "b": 2, "epsilon": 1e-8, "id": 7}\n', encoding="utf-8")
+    target = tmp_path / "results.jsonl"
+    batch.main([str(source), "-o", str(target), "--no-cache"])
+    results = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert len(results) == 4
+    assert results[0]["error"] is None and results[3]["error"] is None
+    assert "Задание 2" in results[1]["error"]
+    assert "Задание 3" in results[2]["error"]
+
+
+def test_csv_missing_and_non_numeric_fields():
+    jobs = list(batch.read_jobs(["1,2,1\n", "1,2,abc,2,1e-8\n", "1,2,1,2,1e-8\n"], "csv"))
+    results = [batch.solve_job(job) for job in jobs]
+    assert "получено - 3" in results[0]["error"]
+    assert results[1]["error"] == "Поле a: недопустимое значение 'abc'"
+    assert results[2]["error"] is None
+    assert abs(results[2]["root"] - 1.5213797068045676) < 1e-8
+
+
+def test_solver_error_recorded():
+    result = batch.solve_job({"eq": 1, "method": 2, "a": 3, "b": 4, "epsilon": 1e-8})
+    assert result["root"] is None and result["error"]
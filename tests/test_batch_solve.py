@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import FunctionService
+from Methods.ChordMethod import ChordMethod
+from Methods.NewtonMethod import NewtonMethod
+from Methods.SimpleIterationMethod import SimpleIterationMethod
+
+# (уравнение, a, b) с одним корнем на интервале
+INTERVALS = [(1, 1.0, 2.0), (2, 0.0, 1.0), (3, 0.0, 1.0), (3, 1.0, 2.0), (4, 0.0, 1.0)]
+EPSILON = 1e-8
+
+
+@pytest.mark.parametrize("eq_num, a, b", INTERVALS)
+def test_chord_batch_matches_scalar(eq_num, a, b):
+    eq = FunctionService.equations[eq_num]
+    vec = eq["vectorized"]
+    roots, values, _ = ChordMethod.solve_batch(vec["f"], [a, b], [b, a], EPSILON)
+    root, _, _ = ChordMethod(eq["f"], eq["f2"], a, b, EPSILON).solve()
+    # Оба интервала (и с переставленными концами) дают тот же корень
+    assert roots == pytest.approx([root, root], abs=1e-6)
+    assert np.all(np.abs(values) < EPSILON)
+
+
+@pytest.mark.parametrize("eq_num, a, b", INTERVALS)
+def test_newton_batch_matches_scalar(eq_num, a, b):
+    eq = FunctionService.equations[eq_num]
+    vec = eq["vectorized"]
+    roots, _, iterations = NewtonMethod.solve_batch(vec["f"], vec["f_prime"], vec["f2"],
+                                                     np.array([a]), np.array([b]), EPSILON)
+    root, _, count = NewtonMethod(eq["f"], eq["f_prime"], eq["f2"], a, b, EPSILON).solve()
+    assert roots[0] == pytest.approx(root, abs=1e-10)
+    assert iterations[0] == count
+
+
+def test_simple_iteration_batch_converges():
+    eq = FunctionService.equations[2]
+    vec = eq["vectorized"]
+    roots, values, _ = SimpleIterationMethod.solve_batch(vec["f"], vec["phi"], vec["phi_prime"],
+                                                         [0.0], [1.0], EPSILON)
+    root, _, _ = SimpleIterationMethod(eq["f"], eq["phi"], eq["phi_prime"], 0.0, 1.0, EPSILON).solve()
+    assert roots[0] == pytest.approx(root, abs=1e-6)
+    assert abs(values[0]) < 1e-6
+
+
+def test_batch_marks_intervals_without_root():
+    f = FunctionService.equations[1]["f"]
+    roots, values, _ = ChordMethod.solve_batch(f, np.array([1.0, 3.0]), np.array([2.0, 4.0]), EPSILON)
+    assert np.isfinite(roots[0])
+    assert np.isnan(roots[1]) and np.isnan(values[1])
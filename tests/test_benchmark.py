@@ -0,0 +1,67 @@
+import json
+
+import benchmark
+
+
+def record(method="Метод хорд", time=1e-5, error=None, a=1):
+    return {"kind": "equation", "method": method, "problem": 1, "a": a, "b": 2, "epsilon": 1e-8,
+            "iterations": None if error else 4, "time": None if error else time, "error": error,
+            "evaluations": {} if error else {"f": 7}}
+
+
+def test_summarize_failure_rate_and_means():
+    lines = benchmark.summarize([record(time=1e-5), record(time=3e-5, a=0), record(error="нет корня", a=3)])
+    assert len(lines.splitlines()) == 2
+    row = lines.splitlines()[1].split()
+    assert row[-5:] == ["1", "33%", "20.0", "7.0", "4.0"]
+
+
+def test_compare_reports_slowdowns_and_new_failures():
+    baseline = [record(time=1e-5), record(time=1e-5, a=0), record(time=1e-5, a=3)]
+    current = [record(time=1.1e-5), record(time=2e-5, a=0), record(error="не сошелся", a=3)]
+    report = benchmark.compare(current, baseline, threshold=0.2).splitlines()
+    assert len(report) == 2
+    assert report[0].startswith("МЕДЛЕННЕЕ x2.00")
+    assert report[1].startswith("ОТКАЗ")
+    assert benchmark.compare(baseline, baseline, 0.2) == "Регрессий не найдено."
+
+
+def test_main_writes_results(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    benchmark.main(["-o", str(output), "-r", "1"])
+    data = json.loads(output.read_text(encoding="utf-8"))
+    kinds = {r["kind"] for r in data["results"]}
+    assert kinds == {"equation", "system"}
+    assert all(r["evaluations"] for r in data["results"] if r["error"] is None)
+
+    benchmark.main(["-o", str(tmp_path / "new.json"), "-r", "1", "--compare", str(output),
+                    "--threshold", "1000"])
+    assert capsys.readouterr().out.rstrip().endswith("Регрессий не найдено.")
+
+
+def test_counted_equation_counts_polynomial_and_scan():
+    eq = benchmark.FunctionService.equations[1]
+    counted, counters = benchmark.counted_equation(eq)
+    roots = benchmark.MethodService.create_solver(8, counted, 1, 2, 1e-10).solve_all()
+    assert len(roots) == 1
+    # Вычисления членов системы Штурма и p / НОД(p, p') тоже считаются
+    assert counters["polynomial"].calls > 2
+
+    counted, counters = benchmark.counted_equation(benchmark.fresh_equation(eq))
+    benchmark.MethodService.create_solver(3, counted, 1, 2, 1e-8).solve()
+    assert counters["phi_prime_vec"].calls > 0
+
+
+def test_timed_runs_start_without_warm_caches():
+    from Methods.SimpleIterationMethod import max_abs_on_interval
+
+    eq = benchmark.FunctionService.equations[1]
+    misses = []
+
+    def run(fresh):
+        benchmark.MethodService.create_solver(3, fresh, 1, 2, 1e-8).solve()
+        misses.append(max_abs_on_interval.cache_info().misses)
+
+    benchmark.best_time(run, 3, lambda: benchmark.fresh_equation(eq))
+    # Каждый запуск заново оценивает max|phi'| на интервале
+    assert misses[0] > 0 and misses == [misses[0]] * 3
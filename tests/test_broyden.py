@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from SystemOfNonlinearEquations.AndersonMethod import AndersonMethod
+from SystemOfNonlinearEquations.BroydenMethod import BroydenMethod, finite_difference_jacobian
+from SystemOfNonlinearEquations.NewtonMethodND import as_vector_system
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+
+A = np.array([[3.0, 1.0, 0.0], [1.0, 4.0, 1.0], [0.0, 2.0, 5.0]])
+b = np.array([1.0, 2.0, 3.0])
+
+
+def linear(v):
+    # Черный ящик, который транслирует массив (N, N) без ошибки
+    return A @ v - b
+
+
+def test_jacobian_of_broadcasting_black_box():
+    jacobian, evaluations = finite_difference_jacobian(linear, np.zeros(3))
+    assert np.allclose(jacobian, A, atol=1e-6)
+    assert evaluations == 3
+
+
+def test_vectorized_jacobian_is_opt_in():
+    def columns(points):
+        return A @ points - (b[:, None] if points.ndim == 2 else b)
+
+    jacobian, evaluations = finite_difference_jacobian(columns, np.zeros(3), -b, vectorized=True)
+    assert np.allclose(jacobian, A, atol=1e-6)
+    assert evaluations == 1
+
+    with pytest.raises(ValueError):
+        finite_difference_jacobian(lambda points: np.zeros(3), np.zeros(3), vectorized=True)
+
+
+@pytest.mark.parametrize("variant", BroydenMethod.VARIANTS)
+def test_broyden_linear_black_box(variant):
+    x = BroydenMethod({'functions': linear}, 1e-10, variant=variant).solve(np.zeros(3))
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_anderson_linear_black_box():
+    x = AndersonMethod({'functions': linear}, 1e-10).solve(np.zeros(3))
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_broyden_nonlinear_system():
+    x = BroydenMethod(as_vector_system(SYSTEMS[1]), 1e-10).solve([1.0, 1.2])
+    assert np.allclose(x, [1.0, 1.0])
@@ -0,0 +1,56 @@
+import math
+
+import numpy as np
+import pytest
+
+import FunctionService
+import MethodService
+from Instrumentation import CountingFunction
+from Methods.CachedFunction import CachedFunction, cache_key, cached, cached_equation
+
+
+def test_hits_and_lru_eviction():
+    f = CountingFunction(lambda x: x * x)
+    c = CachedFunction(f, maxsize=2)
+    assert [c(1.0), c(2.0), c(1.0)] == [1.0, 4.0, 1.0]
+    c(3.0)  # вытесняет 2.0, к которому дольше всего не обращались
+    assert list(c.cache) == [cache_key(1.0), cache_key(3.0)]
+    c(2.0)
+    assert f.calls == 4
+    assert c.cache_info() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2}
+
+
+def test_equal_but_distinct_arguments():
+    c = CachedFunction(lambda x: math.copysign(1.0, x) if isinstance(x, float) else repr(x))
+    assert c(0.0) == 1.0 and c(-0.0) == -1.0
+    assert c(1) == "1" and c(True) == "True" and c(1.0) == 1.0
+    assert c.cache_info()["misses"] == 5
+    assert c(-0.0) == -1.0 and c.cache_info()["hits"] == 1
+
+
+def test_arrays_are_not_cached():
+    f = CountingFunction(lambda x: x + 1)
+    c = CachedFunction(f)
+    x = np.array([1.0, 2.0])
+    assert np.array_equal(c(x), [2.0, 3.0]) and np.array_equal(c(x), [2.0, 3.0])
+    assert f.calls == 2 and c.cache_info()["size"] == 0
+
+
+def test_cached_does_not_wrap_twice():
+    c = cached(abs, 8)
+    assert cached(c) is c
+    assert cached(None) is None
+    with pytest.raises(ValueError):
+        CachedFunction(abs, maxsize=0)
+
+
+def test_cached_equation_shares_values_between_solvers():
+    eq = dict(FunctionService.equations[2])
+    f = eq["f"] = CountingFunction(eq["f"])
+    shared = cached_equation(eq)
+    first = MethodService.create_solver(1, shared, 0.0, 1.0, 1e-8).solve()
+    calls = f.calls
+    second = MethodService.create_solver(1, shared, 0.0, 1.0, 1e-8).solve()
+    assert tuple(first) == tuple(second)
+    assert f.calls == calls
+    assert eq["f"] is f
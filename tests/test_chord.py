@@ -0,0 +1,40 @@
+import pytest
+
+from Instrumentation import CountingFunction
+from Methods.ChordMethod import ChordMethod
+
+
+def solve(f, a, b, modification, tol=1e-10, max_iter=1000):
+    counted = CountingFunction(f)
+    root, value, iterations = ChordMethod(counted, lambda x: 0.0, a, b, tol, max_iter=max_iter,
+                                          modification=modification).solve()
+    return root, iterations, counted.calls
+
+
+@pytest.mark.parametrize("modification", ChordMethod.MODIFICATIONS)
+def test_one_evaluation_per_iteration(modification):
+    # f(a), f(b) и по одному вычислению на каждое приближение x_0, ..., x_iterations
+    root, iterations, calls = solve(lambda x: x ** 3 - x - 2, 1, 2, modification)
+    assert root == pytest.approx(1.5213797068, abs=1e-9)
+    assert calls == iterations + 3
+
+
+@pytest.mark.parametrize("modification", ChordMethod.MODIFICATIONS[1:])
+def test_modifications_avoid_one_sided_stagnation(modification):
+    # Для x^10 - 1 на [0, 1.3] классический метод хорд сдвигает только один конец
+    _, _, plain_calls = solve(lambda x: x ** 10 - 1, 0, 1.3, None)
+    root, _, calls = solve(lambda x: x ** 10 - 1, 0, 1.3, modification)
+    assert root == pytest.approx(1.0, abs=1e-10)
+    assert calls * 3 < plain_calls
+
+
+def test_unknown_modification():
+    with pytest.raises(ValueError):
+        ChordMethod(lambda x: x, lambda x: 0.0, -1, 1, 1e-6, modification="secant")
+
+
+def test_default_is_plain_regula_falsi():
+    solver = ChordMethod(lambda x: x ** 10 - 1, lambda x: 0.0, 0, 1.3, 1e-10, max_iter=1000)
+    assert solver.modification is None
+    # Классический метод хорд застаивается на x^10 - 1: более сотни итераций
+    assert solver.solve().iterations > 100
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+import pytest
+
+import ContinuationService
+import FunctionService
+from Polynomial import Polynomial
+
+FAMILY = FunctionService.families[4]
+
+
+def root_on_unit_interval(c2, c0):
+    roots = [x for x, _ in Polynomial([2, -c2, -5, c0]).real_roots(0, 1)]
+    assert len(roots) == 1
+    return roots[0]
+
+
+def test_sweep_follows_root_without_rebracketing():
+    values = np.linspace(2.34, 4.8, 13)
+    solver = ContinuationService.ContinuationSolver(FAMILY, 0, 1, 1e-12)
+    results = solver.sweep(values, index=1)
+    for c0, (root, value, _) in zip(values, results):
+        assert root == pytest.approx(root_on_unit_interval(1.89, c0), abs=1e-10)
+        assert abs(value) < 1e-10
+    # Повторный поиск сканированием - только для первого значения
+    assert solver.rebrackets == [0]
+    assert solver.failures == []
+
+
+def test_sweep_over_both_parameters():
+    params = [(1.89, 2.34), (1.5, 2.0), (2.2, 2.6)]
+    results = ContinuationService.sweep(FAMILY, params, 0, 1, 1e-12)
+    for (c2, c0), (root, _, _) in zip(params, results):
+        assert root == pytest.approx(root_on_unit_interval(c2, c0), abs=1e-10)
+
+
+def test_root_leaving_interval_is_reported():
+    solver = ContinuationService.ContinuationSolver(FAMILY, 0, 1, 1e-12)
+    results = solver.sweep(np.linspace(4.0, 6.0, 5), index=1)
+    # При c0 > 4.89 f(1) > 0 и корня на [0, 1] нет
+    assert solver.failures == [2, 3, 4]
+    assert all(math.isnan(root) for root, _, _ in results[2:])
+    assert all(math.isfinite(root) for root, _, _ in results[:2])
@@ -0,0 +1,58 @@
+import json
+import math
+import os
+
+import numpy as np
+import pytest
+
+import ExpressionCompiler
+from ExpressionCompiler import compile_expression
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ExpressionCompiler, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_derivatives():
+    expr = compile_expression("x^3 - 2x + sin(x)")
+    assert math.isclose(expr.f(1.0), 1 - 2 + math.sin(1.0))
+    assert math.isclose(expr.f_prime(1.0), 3 - 2 + math.cos(1.0))
+    assert math.isclose(expr.f2(1.0), 6 - math.sin(1.0))
+    assert np.allclose(expr.f_vec(np.array([0.0, 1.0])), [0.0, 1 - 2 + math.sin(1.0)])
+
+
+def test_infinite_constant():
+    expr = compile_expression("1e400*x")
+    assert expr.f(2.0) == math.inf
+    assert expr.f_vec(np.array([1.0]))[0] == math.inf
+
+
+def test_cache_round_trip(cache_dir):
+    first = compile_expression("exp(x) - 3")
+    assert len(os.listdir(cache_dir)) == 1
+    second = compile_expression("exp(x) - 3")
+    assert second.trees == first.trees
+    assert math.isclose(second.f_prime(0.0), 1.0)
+
+
+def test_cache_does_not_run_stored_code(cache_dir):
+    expr = compile_expression("x - 1")
+    path = expr.cache_path()
+    with open(path, encoding="utf-8") as file_:
+        entry = json.load(file_)
+    # Запись с кодом вместо дерева должна отбрасываться
+    entry["trees"][0] = ["call", "__import__('os').system('false') or sin", ["var"]]
+    entry["scalar"] = ["__import__('os')._exit(1)"] * 3
+    with open(path, "w", encoding="utf-8") as file_:
+        json.dump(entry, file_)
+
+    reloaded = compile_expression("x - 1")
+    assert reloaded.trees == expr.trees
+    assert reloaded.f(3.0) == 2.0
+
+
+def test_invalid_expression():
+    with pytest.raises(ValueError):
+        compile_expression("x + y")
@@ -0,0 +1,53 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from SystemOfNonlinearEquations import main2
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    main2._evaluate_grid.cache_clear()
+    yield
+    main2._evaluate_grid.cache_clear()
+
+
+def test_systems_with_same_name_do_not_share_grid():
+    first = {'name': 'Система', 'functions': lambda x, y: (x, y)}
+    second = {'name': 'Система', 'functions': lambda x, y: (x + 1, y + 1)}
+    _, _, F1, _ = main2.evaluate_grid(first, resolution=5)
+    _, _, G1, _ = main2.evaluate_grid(second, resolution=5)
+    assert np.allclose(G1, F1 + 1)
+
+
+def test_grid_is_reused_and_read_only():
+    system = {'name': 'Система', 'functions': lambda x, y: (x * y, x - y)}
+    grid = main2.evaluate_grid(system, resolution=5)
+    assert main2.evaluate_grid(system, [-3, 3, -3, 3], 5) is grid
+    with pytest.raises(ValueError):
+        grid[2][0, 0] = 1.0
+
+
+def test_scalar_only_functions():
+    import math
+    system = {'name': 'Система', 'functions': lambda x, y: (math.sin(x), math.cos(y))}
+    X, Y, F1, F2 = main2.evaluate_grid(system, resolution=4)
+    assert np.allclose(F1, np.sin(X)) and np.allclose(F2, np.cos(Y))
+
+
+def test_cache_is_bounded():
+    for k in range(main2.GRID_CACHE_SIZE + 5):
+        main2.evaluate_grid({'name': str(k), 'functions': lambda x, y, k=k: (x + k, y)}, resolution=3)
+    assert main2._evaluate_grid.cache_info().currsize == main2.GRID_CACHE_SIZE
+
+
+def test_functions_branching_on_array_truthiness():
+    def functions(x, y):
+        # if над массивом возбуждает ValueError
+        return (x if x > 0 else -x), y
+
+    X, Y, F1, F2 = main2.evaluate_grid({'name': 'Система', 'functions': functions}, resolution=4)
+    assert np.allclose(F1, np.abs(X)) and np.allclose(F2, Y)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import FunctionService
+import MethodService
+from Methods.ChebyshevHalleyMethod import ChebyshevHalleyMethod
+from Methods.HalleyMethod import HalleyMethod
+
+THIRD_ORDER = [5, 6, 7]
+INTERVALS = [(1, 1, 3), (2, 0, 1), (3, 1, 2), (4, 1, 3)]
+
+
+@pytest.mark.parametrize("meth_num", THIRD_ORDER)
+@pytest.mark.parametrize("eq_num, a, b", INTERVALS)
+def test_fewer_iterations_than_newton(meth_num, eq_num, a, b):
+    eq = FunctionService.equations[eq_num]
+    newton = MethodService.create_solver(2, eq, a, b, 1e-12).solve()
+    result = MethodService.create_solver(meth_num, eq, a, b, 1e-12).solve()
+    assert result.root == pytest.approx(newton.root, abs=1e-11)
+    assert result.iterations < newton.iterations
+
+
+def test_cubic_convergence():
+    solver = MethodService.create_solver(5, FunctionService.equations[3], 1, 2, 1e-14, history=True)
+    root = solver.solve().root
+    errors = np.abs(solver.history.x - root)
+    errors = errors[errors > 1e-13]
+    # Порядок сходимости 3: отношение e_(n+1) / e_n^3 ограничено
+    ratios = errors[1:] / errors[:-1] ** 3
+    assert np.all(ratios < 2)
+
+
+def test_halley_step_closed_form():
+    f, f1, f2 = 0.3, 1.7, -2.5
+    step = HalleyMethod(abs, abs, abs, 0, 1, 1e-6).step(f, f1, f2)
+    assert step == pytest.approx(2 * f * f1 / (2 * f1 ** 2 - f * f2))
+
+
+def test_super_halley_alpha():
+    assert MethodService.create_solver(7, FunctionService.equations[1], 1, 2, 1e-6).alpha == 1
+
+
+@pytest.mark.parametrize("alpha", [0, 0.5, 1])
+def test_batch_matches_scalar(alpha):
+    eq = FunctionService.equations[3]
+    vec = eq["vectorized"]
+    a, b = np.array([0.0, 1.0]), np.array([1.0, 2.0])
+    roots, _, iterations = ChebyshevHalleyMethod.solve_batch(vec["f"], vec["f_prime"], vec["f2"], a, b,
+                                                             1e-12, alpha=alpha)
+    for k in range(2):
+        result = ChebyshevHalleyMethod(eq["f"], eq["f_prime"], eq["f2"], a[k], b[k], 1e-12,
+                                       alpha=alpha).solve()
+        assert roots[k] == pytest.approx(result.root, abs=1e-12)
+        assert iterations[k] == result.iterations
@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+import FunctionService
+from Methods.HybridMethod import HybridMethod
+from Methods.NewtonMethod import NewtonMethod
+
+
+@pytest.mark.parametrize("eq_num, a, b", [(1, 1, 2), (2, 0, 1), (3, 0, 1), (4, 0, 1)])
+def test_matches_newton_on_builtin_equations(eq_num, a, b):
+    eq = FunctionService.equations[eq_num]
+    root, value, _ = HybridMethod(eq["f"], eq["f_prime"], eq["f2"], a, b, 1e-10).solve()
+    newton_root, _, _ = NewtonMethod(eq["f"], eq["f_prime"], eq["f2"], a, b, 1e-10).solve()
+    assert root == pytest.approx(newton_root, abs=1e-9)
+    assert abs(value) < 1e-9
+
+
+def test_converges_where_newton_diverges():
+    f = math.atan
+    f_prime = lambda x: 1 / (1 + x * x)
+    f2 = lambda x: -2 * x / (1 + x * x) ** 2
+    with pytest.raises(Exception):
+        NewtonMethod(f, f_prime, f2, -10, 20, 1e-10).solve()
+    root, _, _ = HybridMethod(f, f_prime, f2, -10, 20, 1e-10).solve()
+    assert root == pytest.approx(0.0, abs=1e-9)
+
+
+def test_multiple_root_stays_in_bracket():
+    # Тройной корень: шаги Ньютона сходятся линейно, отрезок сужается делением пополам
+    f = lambda x: (x - 1) ** 3
+    solver = HybridMethod(f, lambda x: 3 * (x - 1) ** 2, lambda x: 6 * (x - 1), 0, 3, 1e-10,
+                          max_iter=200, history=True)
+    root, _, _ = solver.solve()
+    assert root == pytest.approx(1.0, abs=1e-8)
+    assert all(0 <= x <= 3 for x in solver.history.x)
+
+
+def test_no_sign_change():
+    with pytest.raises(ValueError):
+        HybridMethod(lambda x: x * x + 1, lambda x: 2 * x, lambda x: 2.0, -1, 1, 1e-6).solve()
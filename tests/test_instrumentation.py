@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+import FunctionService
+import MethodService
+from Instrumentation import Instrument
+
+
+def test_counts_match_chord_evaluations():
+    instrument = Instrument()
+    root, _, iterations = MethodService.create_solver(1, FunctionService.equations[1], 1, 2, 1e-8,
+                                                      instrument=instrument).solve()
+    report = instrument.report()
+    # f(a), f(b) и по одному вычислению на приближение
+    assert report["calls"]["f"] == iterations + 3
+    assert report["iterations"] == iterations + 1
+    assert instrument.trace[-1][1] == root
+    assert {"solve", "interval_check", "main_loop", "overhead"} <= set(report["timings"])
+    assert report["timings"]["solve"] >= report["timings"]["interval_check"]
+
+
+@pytest.mark.parametrize("meth_num", sorted(MethodService.methods))
+def test_every_method_reports_iterations(meth_num):
+    seen = []
+    instrument = Instrument(callbacks=[lambda i, x, error: seen.append(i)], trace=False)
+    MethodService.create_solver(meth_num, FunctionService.equations[1], 1, 2, 1e-8,
+                                instrument=instrument).solve()
+    assert seen
+    assert instrument.report()["iterations"] is None
+
+
+def test_export(tmp_path):
+    instrument = Instrument()
+    MethodService.create_solver(2, FunctionService.equations[2], 0, 1, 1e-8, instrument=instrument).solve()
+    path = tmp_path / "trace.json"
+    instrument.export(path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["calls"] == instrument.report()["calls"]
+    assert len(data["trace"]) == len(instrument.trace)
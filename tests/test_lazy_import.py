@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from LazyImport import is_loaded, lazy_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code):
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+# Метод простой итерации проверяет условие сходимости на сетке NumPy
+@pytest.mark.parametrize("meth_num", [1, 2, 4, 5, 6, 7])
+def test_scalar_solve_does_not_load_numpy(meth_num):
+    run("import FunctionService, MethodService\n"
+        "from LazyImport import is_loaded\n"
+        f"MethodService.create_solver({meth_num}, FunctionService.equations[1], 1, 2, 1e-8).solve()\n"
+        "assert not is_loaded('numpy'), 'numpy loaded'\n")
+
+
+def test_methods_imported_on_demand():
+    run("import sys, MethodService\n"
+        "assert not any(name.startswith('Methods.') for name in sys.modules)\n"
+        "MethodService.load_class(MethodService.methods[1]['class'])\n"
+        "assert 'Methods.ChordMethod' in sys.modules and 'Methods.NewtonMethod' not in sys.modules\n")
+
+
+def test_history_loads_numpy_on_first_use():
+    run("import FunctionService, MethodService\n"
+        "from LazyImport import is_loaded\n"
+        "result = MethodService.create_solver(2, FunctionService.equations[1], 1, 2, 1e-8, history=True).solve()\n"
+        "assert is_loaded('numpy') and len(result.history) == result.iterations\n")
+
+
+def test_missing_module():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("no_such_module_for_lazy_import")
+
+
+def test_loaded_module_returned_as_is():
+    import json
+    assert lazy_import("json") is json
+    assert is_loaded("json")
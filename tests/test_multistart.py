@@ -0,0 +1,46 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from SystemOfNonlinearEquations.MultiStart import MultiStartSolver, grid_starts, latin_hypercube_starts
+from SystemOfNonlinearEquations.NewtonMethodND import as_vector_system
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+
+BOUNDS = [(-2, 2), (-2, 2)]
+
+
+def sorted_roots(roots):
+    return sorted(tuple(np.round(r, 6)) for r in roots)
+
+
+def test_starts():
+    grid = grid_starts(BOUNDS, 5)
+    assert grid.shape == (25, 2) and grid.min() == -2 and grid.max() == 2
+
+    lhs = latin_hypercube_starts(BOUNDS, 10, seed=1)
+    # В каждую из 10 полос по каждой переменной попадает ровно одна точка
+    for column in lhs.T:
+        assert sorted(np.floor((column + 2) / 0.4).astype(int)) == list(range(10))
+
+
+def test_lanes_find_both_roots():
+    solver = MultiStartSolver(as_vector_system(SYSTEMS[1]), eps=1e-10)
+    roots = solver.solve(grid_starts(BOUNDS, 6))
+    assert sorted_roots(roots) == [(-1.0, -1.0), (1.0, 1.0)]
+    assert sum(basin['count'] for basin in solver.basins) + solver.failures == 36
+    assert sum(basin['share'] for basin in solver.basins) <= 1
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="нужен fork")
+def test_process_mode_agrees_with_lanes():
+    system = as_vector_system(SYSTEMS[1])
+    starts = latin_hypercube_starts(BOUNDS, 12, seed=3)
+    lanes = MultiStartSolver(system, eps=1e-10).solve(starts)
+    processes = MultiStartSolver(system, eps=1e-10).solve(starts, mode="process", workers=2)
+    assert sorted_roots(lanes) == sorted_roots(processes)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        MultiStartSolver(as_vector_system(SYSTEMS[1])).solve([[0.0, 0.0]], mode="threads")
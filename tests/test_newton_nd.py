@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from SystemOfNonlinearEquations.NewtonMethodND import NewtonMethodND, as_vector_system, lu_factor, lu_solve
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+
+
+def test_lu_solve_with_pivoting():
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((6, 6))
+    A[0, 0] = 0.0  # без перестановки строк разложение невозможно
+    b = rng.standard_normal(6)
+    assert np.allclose(lu_solve(lu_factor(A), b), np.linalg.solve(A, b))
+
+
+def test_lu_rejects_singular_and_non_square():
+    with pytest.raises(ValueError):
+        lu_factor([[1.0, 2.0], [2.0, 4.0]])
+    with pytest.raises(ValueError):
+        lu_factor(np.ones((2, 3)))
+
+
+@pytest.mark.parametrize("num", sorted(SYSTEMS))
+def test_systems_from_start(num):
+    system = as_vector_system(SYSTEMS[num])
+    x = NewtonMethodND(system, 1e-10).solve([1.0, 1.0])
+    assert np.allclose(system['functions'](x), 0, atol=1e-8)
+
+
+def test_n_dimensional_system():
+    # x_i^2 + sum(x) - (n + 1) = 0 при n = 5 имеет корень x_i = 1
+    n = 5
+    system = {
+        'functions': lambda v: v ** 2 + v.sum() - (n + 1),
+        'jacobian': lambda v: np.diag(2 * v) + np.ones((n, n))
+    }
+    assert np.allclose(NewtonMethodND(system, 1e-12).solve(np.full(n, 1.3)), 1.0)
+
+
+def test_shamanskii_reuses_jacobian():
+    system = as_vector_system(SYSTEMS[1])
+    full = NewtonMethodND(system, 1e-10)
+    lazy = NewtonMethodND(system, 1e-10, jacobian_update=3)
+    assert np.allclose(full.solve([2.0, 0.5]), lazy.solve([2.0, 0.5]))
+    assert lazy.jacobian_evaluations < lazy.iterations + 1
+    assert full.jacobian_evaluations == full.iterations + 1
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import FunctionService
+import MethodService
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class RecordingPlotter:
+    def __init__(self):
+        self.calls = []
+
+    def plot(self, f, a, b, num_points=None):
+        self.calls.append((f, a, b))
+
+
+@pytest.mark.parametrize("meth_num", [1, 2, 3])
+def test_plotter_is_called_once(meth_num):
+    eq = FunctionService.equations[2]
+    plotter = RecordingPlotter()
+    root, _, _ = MethodService.create_solver(meth_num, eq, 0.0, 1.0, 1e-6, plotter=plotter).solve()
+    assert root == pytest.approx(0.7390851, abs=1e-5)
+    assert plotter.calls == [(eq["f"], 0.0, 1.0)]
+
+
+def test_headless_solve_does_not_load_matplotlib():
+    code = (
+        "import sys, FunctionService, MethodService\n"
+        "for meth_num in (1, 2, 3):\n"
+        "    MethodService.create_solver(meth_num, FunctionService.equations[2], 0.0, 1.0, 1e-6).solve()\n"
+        "assert 'matplotlib' not in sys.modules, 'matplotlib imported'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_function_plotter_without_show():
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    from Methods.FunctionPlotter import FunctionPlotter
+
+    fig = FunctionPlotter(num_points=10, show=False).plot(FunctionService.f1, 1, 2)
+    line = fig.axes[0].lines[0]
+    assert len(line.get_xdata()) == 10
+    matplotlib.pyplot.close(fig)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import FunctionService
+import MethodService
+from Methods.PolynomialMethod import PolynomialMethod
+from Polynomial import Polynomial
+
+
+def test_wilkinson_roots():
+    w = Polynomial(np.poly(np.arange(1, 11)))
+    assert w.count_roots(0, 11) == 10
+    assert w.count_roots(2.5, 6.5) == 4
+    roots = [root for root, _ in w.real_roots()]
+    assert roots == pytest.approx(list(range(1, 11)), abs=1e-8)
+
+
+def test_multiple_roots_counted_once():
+    p = Polynomial(np.poly([1, 1, 2, -3, -3, -3]))
+    assert p.count_roots(-5, 5) == 3
+    assert [root for root, _ in p.real_roots()] == pytest.approx([-3, 1, 2], abs=1e-10)
+    assert p.square_free().degree == 3
+
+
+def test_no_real_roots():
+    p = Polynomial([1, 0, 1])
+    assert p.count_roots(-10, 10) == 0
+    assert p.real_roots() == []
+
+
+def test_horner_value_and_derivatives():
+    p = Polynomial([2, -1.89, -5, 2.34])
+    x = np.linspace(-2, 3, 7)
+    value, derivative, second = p.taylor2(x)
+    assert np.allclose(value, FunctionService.f4(x))
+    assert np.allclose(derivative, FunctionService.f4_prime(x))
+    assert np.allclose(second, FunctionService.f4_2(x))
+
+
+def test_solve_all_and_single_root():
+    eq = FunctionService.equations[4]
+    roots = MethodService.create_solver(8, eq, -3, 3, 1e-12).solve_all()
+    assert len(roots) == 3
+    assert all(abs(value) < 1e-12 for _, value, _ in roots)
+    with pytest.raises(ValueError, match="несколько корней"):
+        MethodService.create_solver(8, eq, -3, 3, 1e-12).solve()
+    root, _, _ = MethodService.create_solver(8, eq, 0, 1, 1e-12).solve()
+    assert root == pytest.approx(0.42991896383793843, abs=1e-12)
+
+
+def test_non_polynomial_equation_rejected():
+    with pytest.raises(ValueError):
+        MethodService.create_solver(8, FunctionService.equations[2], 0, 1, 1e-6)
+
+
+def test_batch_distributes_roots():
+    p = FunctionService.equations[4]["polynomial"]
+    roots, _, _ = PolynomialMethod.solve_batch(p, [-3, 0, 1, -3, 5], [-1, 1, 3, 3, 6], 1e-12)
+    single = [r for r, _ in p.real_roots()]
+    assert roots[:3] == pytest.approx(single, abs=1e-12)
+    assert np.isnan(roots[3]) and np.isnan(roots[4])
+
+
+@pytest.mark.parametrize("meth_num, combined", [(2, "f_f_prime"), (5, "f_f_prime_f2")])
+def test_methods_use_horner_one_pass_evaluation(meth_num, combined):
+    eq = FunctionService.polynomial_equation([1, 0, -2])
+    assert eq["f_f_prime"](3.0) == (7.0, 6.0)
+    calls = []
+    one_pass = eq[combined]
+    eq[combined] = lambda x: calls.append(x) or one_pass(x)
+    root, _, _ = MethodService.create_solver(meth_num, eq, 1, 2, 1e-12).solve()
+    assert root == pytest.approx(2 ** 0.5, abs=1e-12)
+    assert calls
+
+
+@pytest.mark.parametrize("coefficients", [[0, 0, 0], [0], []])
+def test_zero_polynomial_rejected(coefficients):
+    p = Polynomial(coefficients)
+    assert p(2.0) == 0
+    for call in (p.root_bound, p.real_roots, lambda: p.count_roots(-1, 1)):
+        with pytest.raises(ValueError, match="Нулевой многочлен"):
+            call()
+    with pytest.raises(ValueError, match="Нулевой многочлен"):
+        PolynomialMethod(p, -1, 1, 1e-8).solve_all()
+
+
+def test_constant_polynomial_has_no_roots():
+    p = Polynomial([3])
+    assert p.count_roots(-1, 1) == 0 and p.real_roots() == []
+    # Вторая производная линейного многочлена - нулевой многочлен, но его
+    # можно вычислять
+    assert FunctionService.polynomial_equation([2, 1])["f2"](5.0) == 0
@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+
+import FunctionService
+from ResultCache import ResultCache, definition_hash
+
+EQ = FunctionService.equations[1]
+
+
+@pytest.fixture
+def cache():
+    with ResultCache(":memory:") as cache:
+        yield cache
+
+
+def test_hit_and_stricter_epsilon(cache):
+    first = cache.solve(EQ, 2, 1, 2, 1e-10)
+    assert cache.misses == 1
+    # Результат с более строгой точностью подходит для менее строгого запроса
+    assert cache.solve(EQ, 2, 1, 2, 1e-6) == tuple(first)
+    assert cache.hits == 1
+    assert cache.lookup(EQ, 2, 1, 2, 1e-12) is None
+
+
+def test_options_are_part_of_key(cache):
+    cache.solve(EQ, 1, 1, 2, 1e-8)
+    assert cache.lookup(EQ, 1, 1, 2, 1e-8, {"modification": "illinois"}) is None
+    assert cache.lookup(EQ, 1, 1, 2, 1e-8, {"max_iter": 5}) is None
+    cache.solve(EQ, 3, 1, 2, 1e-8, acceleration="aitken", memory=2)
+    assert cache.lookup(EQ, 3, 1, 2, 1e-8, {"memory": 2, "acceleration": "aitken"}) is not None
+    assert cache.lookup(EQ, 3, 1, 2, 1e-8, {"acceleration": "aitken", "memory": 3}) is None
+    # Параметры, не влияющие на результат, в ключ не входят
+    assert cache.lookup(EQ, 1, 1, 2, 1e-8, {"history": True, "plotter": None}) is not None
+
+
+def test_non_real_results_not_stored(cache):
+    assert not cache.store(EQ, 3, 1, 2, 1e-8, (1 + 2j, 0.0, 3))
+    assert not cache.store(EQ, 3, 1, 2, 1e-8, (float("nan"), 0.0, 3))
+    assert cache.lookup(EQ, 3, 1, 2, 1e-8) is None
+
+
+def test_key_is_definition_not_number(cache):
+    other = dict(FunctionService.equations[2])
+    assert definition_hash(other) != definition_hash(EQ)
+    cache.store(EQ, 2, 0, 1, 1e-8, (0.5, 0.0, 1))
+    assert cache.lookup(other, 2, 0, 1, 1e-8) is None
+    # Тот же объект определения под другим номером находится
+    assert cache.lookup(dict(EQ), 2, 0, 1, 1e-8) == (0.5, 0.0, 1)
+
+
+def test_old_schema_rebuilt(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE results (definition TEXT, method INTEGER)")
+    connection.commit()
+    connection.close()
+    with ResultCache(path) as cache:
+        cache.solve(EQ, 2, 1, 2, 1e-8)
+    with ResultCache(path) as cache:
+        assert cache.lookup(EQ, 2, 1, 2, 1e-8) is not None
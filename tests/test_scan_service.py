@@ -0,0 +1,51 @@
+import pytest
+
+import FunctionService
+import MethodService
+from ScanService import RootScanner, find_all_roots
+
+
+def hybrid(f, f_prime, f2):
+    eq = {"f": f, "f_prime": f_prime, "f2": f2}
+    return lambda a, b, epsilon: MethodService.create_solver(4, eq, a, b, epsilon)
+
+
+def roots_of(scanner, solver, epsilon=1e-10):
+    return [root for root, _, _ in scanner.solve_all(solver, epsilon)]
+
+
+def test_double_root_reported_once():
+    f = lambda x: (x - 1) ** 2 * (x + 2)
+    scanner = RootScanner(f, -2, 4)
+    solver = hybrid(f, lambda x: 3 * (x - 1) * (x + 1), lambda x: 6 * x)
+    assert roots_of(scanner, solver) == pytest.approx([-2, 1])
+
+
+def test_close_double_roots_not_duplicated():
+    f = lambda x: (x - 1) ** 2 * (x - 1.0002) ** 2
+    brackets = RootScanner(f, -2.75, 3.25).find_brackets()
+    assert [left for left, _ in brackets] == pytest.approx([1, 1.0002], abs=1e-7)
+
+
+def test_close_simple_roots():
+    f = lambda x: (x - 1) * (x - 1.0002)
+    scanner = RootScanner(f, 0, 2)
+    solver = hybrid(f, lambda x: 2 * x - 2.0002, lambda x: 2.0)
+    assert roots_of(scanner, solver) == pytest.approx([1, 1.0002], abs=1e-9)
+
+
+@pytest.mark.parametrize("a, b", [(0.3, 1.00001), (0.99999, 2)])
+def test_tangent_root_near_endpoint(a, b):
+    brackets = RootScanner(lambda x: (x - 1) ** 2, a, b).find_brackets()
+    assert len(brackets) == 1
+    assert brackets[0][0] == pytest.approx(1, abs=1e-6)
+
+
+def test_no_roots():
+    assert RootScanner(lambda x: (x - 1) ** 2 + 1e-3, 0.5, 2).find_brackets() == []
+
+
+def test_find_all_roots_of_equation():
+    roots = find_all_roots(FunctionService.equations[4], 4, -3, 3, 1e-10)
+    assert len(roots) == 3
+    assert all(abs(value) < 1e-8 for _, value, _ in roots)
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+
+from server import SolverServer
+
+REQUEST = json.dumps({"eq": 1, "method": 2, "a": 1, "b": 2, "epsilon": 1e-8})
+
+
+async def start(solver_server):
+    """Сервер на свободном порту; finished - события завершения обработчиков соединений"""
+    finished = []
+
+    async def handler(reader, writer):
+        done = asyncio.Event()
+        finished.append(done)
+        try:
+            await solver_server.handle_connection(reader, writer)
+        finally:
+            done.set()
+
+    server = await asyncio.start_server(handler, "127.0.0.1", 0, limit=solver_server.max_line)
+    return server, server.sockets[0].getsockname()[1], finished
+
+
+def exchange(solver_server, data):
+    """Ответы сервера на данные data; клиент читает ответы до EOF"""
+    async def scenario():
+        server, port, _ = await start(solver_server)
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(data)
+            writer.write_eof()
+            received = await asyncio.wait_for(reader.read(), timeout=10)
+            writer.close()
+        return [json.loads(line) for line in received.splitlines()]
+
+    try:
+        return asyncio.run(scenario())
+    finally:
+        solver_server.close()
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_responses_in_request_order(workers):
+    data = "".join(json.dumps(dict(json.loads(REQUEST), id=i)) + "\n" for i in range(5)) + "not json\n"
+    responses = exchange(SolverServer(workers=workers), data.encode())
+    assert [r["id"] for r in responses] == [0, 1, 2, 3, 4, None]
+    assert all(r["error"] is None for r in responses[:5])
+    assert "Некорректный запрос" in responses[5]["error"]
+
+
+def test_client_disconnect_with_requests_in_flight():
+    async def scenario():
+        solver_server = SolverServer(workers=0, max_pending=1)
+        server, port, finished = await start(solver_server)
+        async with server:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(((REQUEST + "\n") * 20000).encode())
+            await writer.drain()
+            # Клиент обрывает соединение, не читая ответов
+            writer.transport.abort()
+            await asyncio.sleep(0.1)
+            await asyncio.wait_for(finished[0].wait(), timeout=10)
+
+    asyncio.run(scenario())
+
+
+def test_line_over_limit():
+    job = dict(json.loads(REQUEST), id=0, comment="x" * 5000)
+    data = (REQUEST + "\n" + json.dumps(job) + "\n" + REQUEST + "\n").encode()
+    responses = exchange(SolverServer(workers=0, max_line=1024), data)
+    # Ответ на первый запрос, ошибка на длинную строку, затем соединение закрывается
+    assert responses[0]["error"] is None
+    assert responses[1] == {"id": None, "error": "Некорректный запрос: строка длиннее 1024 байт"}
+    assert len(responses) == 2
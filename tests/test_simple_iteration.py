@@ -0,0 +1,87 @@
+import math
+
+import pytest
+
+import FunctionService
+import MethodService
+from Methods.SimpleIterationMethod import SimpleIterationMethod, max_abs_on_interval
+
+
+@pytest.mark.parametrize("acceleration", SimpleIterationMethod.ACCELERATIONS)
+@pytest.mark.parametrize("a, b, expected", [(-2, -1, -1.4121211913118663), (1, 3, 1.9272022274739278)])
+def test_equation_4_real_roots(acceleration, a, b, expected):
+    root, value, _ = MethodService.create_solver(3, FunctionService.equations[4], a, b, 1e-8,
+                                                 acceleration=acceleration).solve()
+    assert isinstance(root, float)
+    assert root == pytest.approx(expected, abs=1e-6)
+
+
+def test_scalar_and_vectorized_phi_agree():
+    x = [-1.9, -1.4, -0.5, 0.2, 2.0]
+    for t in x:
+        assert FunctionService.phi4(t) == pytest.approx(float(FunctionService.phi4_vec(t)))
+        assert FunctionService.phi4_prime(t) == pytest.approx(float(FunctionService.phi4_prime_vec(t)))
+
+
+def test_complex_phi_raises():
+    solver = SimpleIterationMethod(lambda x: x - 1, lambda x: (x - 3) ** 0.5, lambda x: 0.1, 0, 2, 1e-6)
+    with pytest.raises(Exception, match="вещественным"):
+        solver.solve()
+
+
+def test_contraction_estimate_and_prediction():
+    solver = MethodService.create_solver(3, FunctionService.equations[2], 0, 1, 1e-10)
+    root, _, iterations = solver.solve()
+    assert root == pytest.approx(0.7390851332151607, abs=1e-9)
+    assert solver.q == pytest.approx(math.sin(1), rel=1e-6)
+    assert solver.error_bound < 1e-10
+    assert iterations <= solver.predicted_iterations
+
+
+def test_convergence_condition_fails():
+    with pytest.raises(Exception, match="Достаточное условие"):
+        MethodService.create_solver(3, FunctionService.equations[4], 0, 1, 1e-8).solve()
+
+
+def test_narrow_peak_found():
+    peak = lambda x: 1 / (1 + ((x - 0.3137) / 1e-4) ** 2)
+    assert max_abs_on_interval(peak, 0.0, 1.0) > 0.5
+
+
+def count_phi_calls(eq_num, a, b, acceleration):
+    eq = FunctionService.equations[eq_num]
+    calls = []
+
+    def phi(x):
+        calls.append(x)
+        return eq["phi"](x)
+
+    root, _, _ = SimpleIterationMethod(eq["f"], phi, eq["phi_prime"], a, b, 1e-10,
+                                       acceleration=acceleration).solve()
+    return root, len(calls)
+
+
+@pytest.mark.parametrize("acceleration", SimpleIterationMethod.ACCELERATIONS[1:])
+@pytest.mark.parametrize("eq_num, a, b", [(2, 0, 1), (3, 0, 1)])
+def test_acceleration_saves_phi_evaluations(acceleration, eq_num, a, b):
+    # q = max|phi'| близко к 1: без ускорения десятки итераций
+    plain_root, plain_calls = count_phi_calls(eq_num, a, b, None)
+    root, calls = count_phi_calls(eq_num, a, b, acceleration)
+    assert root == pytest.approx(plain_root, abs=1e-9)
+    assert calls * 2 <= plain_calls
+
+
+def test_unknown_acceleration():
+    eq = FunctionService.equations[2]
+    with pytest.raises(ValueError):
+        SimpleIterationMethod(eq["f"], eq["phi"], eq["phi_prime"], 0, 1, 1e-6, acceleration="wynn")
+
+
+@pytest.mark.parametrize("acceleration", SimpleIterationMethod.ACCELERATIONS)
+def test_history_records_residuals(acceleration):
+    eq = FunctionService.equations[2]
+    solver = MethodService.create_solver(3, eq, 0, 1, 1e-10, acceleration=acceleration, history=True)
+    result = solver.solve()
+    history = result.history
+    assert len(history) == result.iterations
+    assert list(history.values) == [eq["f"](x) for x in history.x]
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+
+import FunctionService
+import MethodService
+from SolveResult import IterationHistory, SolveResult
+from SystemOfNonlinearEquations.AndersonMethod import AndersonMethod
+from SystemOfNonlinearEquations.BroydenMethod import BroydenMethod
+from SystemOfNonlinearEquations.NewtonMethod import NewtonMethod as SystemNewtonMethod
+from SystemOfNonlinearEquations.NewtonMethodND import NewtonMethodND, as_vector_system
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+
+
+def test_result_unpacks_like_tuple():
+    result = SolveResult(1.5, 0.0, 4)
+    root, value, iterations = result
+    assert (root, value, iterations) == (1.5, 0.0, 4)
+    assert result[0] == 1.5 and result[-1] == 4
+    assert result == (1.5, 0.0, 4)
+    assert result.history is None
+
+
+def test_history_views_filled_part():
+    history = IterationHistory(10)
+    history.record(2.0, 1.0, -0.5, 0.5)
+    history.record(1.5, 0.1, -0.1, 0.1)
+    assert len(history) == 2
+    assert list(history.x) == [2.0, 1.5]
+    assert list(history.errors) == [0.5, 0.1]
+    # Представление без копирования
+    assert history.steps.base is not None
+
+
+def test_history_overflow():
+    history = IterationHistory(1)
+    history.record(0.0, 0.0, 0.0, 0.0)
+    with pytest.raises(IndexError):
+        history.record(0.0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("meth_num", [1, 2, 3, 4, 5, 6, 7])
+def test_methods_record_history(meth_num):
+    solver = MethodService.create_solver(meth_num, FunctionService.equations[1], 1, 2, 1e-10, history=True)
+    result = solver.solve()
+    assert solver.history is result.history
+    assert len(result.history) >= result.iterations
+    assert result.history.errors[-1] < 1e-6
+
+
+def test_history_is_optional():
+    result = MethodService.create_solver(2, FunctionService.equations[1], 1, 2, 1e-10).solve()
+    assert result.history is None
+    assert math.isclose(result.root, 1.5213797068045676, rel_tol=1e-12)
+
+
+def test_system_newton_history():
+    solver = SystemNewtonMethod(SYSTEMS[1])
+    x, y = solver.solve(1.0, 1.2)
+    assert math.isclose(x, 1.0) and math.isclose(y, 1.0)
+    assert len(solver.errors) == solver.iterations + 1
+    assert solver.history.x.shape == (solver.iterations + 1, 2)
+
+    solver = SystemNewtonMethod(SYSTEMS[1], history=False)
+    solver.solve(1.0, 1.2)
+    assert solver.history is None and len(solver.errors) == 0
+
+
+@pytest.mark.parametrize("method", [NewtonMethodND, BroydenMethod, AndersonMethod])
+def test_vector_system_history(method):
+    system = as_vector_system(SYSTEMS[1])
+    solver = method(system, 1e-10)
+    x = solver.solve([1.0, 1.2])
+    history = solver.history
+    assert len(history) == solver.iterations + 1
+    assert history.x.shape == history.values.shape == history.steps.shape == (len(history), 2)
+    # Невязка записана в точке, где она вычислена, шаг ведет к следующей точке
+    assert np.allclose(history.values[0], system['functions'](np.array([1.0, 1.2])))
+    assert np.allclose(history.x[-1] + history.steps[-1], x)
+    assert np.array_equal(solver.errors, history.errors)
+
+    solver = method(system, 1e-10, history=False)
+    solver.solve([1.0, 1.2])
+    assert solver.history is None and len(solver.errors) == 0
@@ -0,0 +1,34 @@
+import numpy as np
+
+from SystemOfNonlinearEquations.NewtonMethod import NewtonMethod
+from SystemOfNonlinearEquations.Systems import SYSTEMS
+from SystemOfNonlinearEquations.TraceSink import ArraySink, BinaryFileSink, PrintSink, read_binary_trace
+
+
+def test_silent_without_sink(capsys):
+    NewtonMethod(SYSTEMS[2], 1e-10).solve(1.0, 1.0)
+    assert capsys.readouterr().out == ""
+
+
+def test_print_sink(capsys):
+    solver = NewtonMethod(SYSTEMS[2], 1e-10, sink=PrintSink())
+    solver.solve(1.0, 1.0)
+    assert capsys.readouterr().out.count("Итерация") == solver.iterations + 1
+
+
+def test_array_sink_grows_and_matches_history():
+    sink = ArraySink(capacity=1)
+    solver = NewtonMethod(SYSTEMS[4], 1e-12, sink=sink)
+    x, y = solver.solve(0.0, 0.0)
+    assert sink.data.shape == (solver.iterations + 1, 3)
+    assert tuple(sink.data[-1, :2]) == (x, y)
+    assert np.array_equal(sink.data[:, 2], solver.errors)
+
+
+def test_binary_file_sink_round_trip(tmp_path):
+    path = tmp_path / "trace.bin"
+    array_sink = ArraySink()
+    with BinaryFileSink(path, buffer_size=2) as sink:
+        NewtonMethod(SYSTEMS[1], 1e-12, sink=sink).solve(2.0, 0.5)
+    NewtonMethod(SYSTEMS[1], 1e-12, sink=array_sink).solve(2.0, 0.5)
+    assert np.array_equal(read_binary_trace(path), array_sink.data)